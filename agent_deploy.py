@@ -1,76 +1,143 @@
 #!/usr/bin/env python3
 """
 Agent deployment script - Python version for reliable execution
+
+Performs the same steps as agent-deploy.sh in-process instead of shelling
+out to bash and parsing AGENT_RESULT markers from its stdout.
 """
+import atexit
+import json
+import os
 import subprocess
 import sys
-import time
-import urllib.request
-import json
+import urllib3
+
+from deploy_core import clear_caches, wait_active
+
+SCRIPT_DIR = '/home/ubuntu/datatracker'
+SOURCE_FILE = os.path.join(SCRIPT_DIR, 'ietf_data_viewer_simple.py')
+NEW_TEXT = 'Welcome to the Meta-Layer Governance Hub'
+
+# Service name and port per environment
+SERVICES = {
+    'development': ('datatracker-dev.service', 8001),
+    'production': ('datatracker.service', 8000),
+}
+
+# Shared keep-alive pool so repeated probes reuse TCP connections
+_http = urllib3.PoolManager(num_pools=2, maxsize=5, timeout=5.0, retries=False)
+atexit.register(_http.clear)
+
+
+class DeployError(Exception):
+    """A deployment step failed"""
+
+
+def agent_status(msg):
+    print(f"AGENT_STATUS|{msg}")
+
+
+def stop_service(service):
+    """Stop the service, ignoring failures (it may not be running)"""
+    subprocess.run(['systemctl', '--user', 'stop', service],
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def verify_code():
+    """Check the main file exists and report whether the new text is present"""
+    try:
+        with open(SOURCE_FILE, 'r') as f:
+            found = NEW_TEXT in f.read()
+    except OSError:
+        raise DeployError("Main file not found")
+    if found:
+        agent_status("Code verification: PASSED")
+    else:
+        agent_status("Code verification: WARNING - new text not found")
+
+
+def start_service(service):
+    result = subprocess.run(['systemctl', '--user', 'start', service],
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise DeployError(f"Service failed to start: {result.stderr.strip()}")
+
+
+def probe_status(port):
+    """GET the homepage, returning (HTTP status, raw body)"""
+    response = _http.request('GET', f'http://localhost:{port}/')
+    return response.status, response.data
+
 
 def agent_deploy(env='development'):
     """Deploy to specified environment"""
     print(f"=== AGENT DEPLOYMENT: {env.upper()} ===")
     print()
-    
-    # Run the bash script
+
+    if env not in SERVICES:
+        print(f"AGENT_RESULT|ERROR|Invalid environment: {env}")
+        print("✗ DEPLOYMENT FAILED")
+        return False
+    service, port = SERVICES[env]
+
     try:
-        result = subprocess.run(
-            ['bash', 'agent-deploy.sh', env],
-            capture_output=True,
-            text=True,
-            timeout=60,
-            cwd='/home/ubuntu/datatracker'
-        )
-        
-        print("DEPLOYMENT OUTPUT:")
-        print(result.stdout)
-        if result.stderr:
-            print("ERRORS:")
-            print(result.stderr)
-        print()
-        
-        # Parse output
-        if "AGENT_RESULT|SUCCESS" in result.stdout:
-            print("✓ DEPLOYMENT SUCCESSFUL")
-            
-            # Verify via API
-            print("\nVerifying via API...")
-            time.sleep(2)
-            try:
-                port = 8001 if env == 'development' else 8000
-                response = urllib.request.urlopen(f'http://localhost:{port}/_deploy/status', timeout=5)
-                status = json.loads(response.read().decode('utf-8'))
-                print(f"Environment: {status['environment']}")
-                print(f"Service active: {status['service_active']}")
-                print(f"Has new text: {status['has_new_text']}")
-                
-                # Test content
-                response = urllib.request.urlopen(f'http://localhost:{port}/', timeout=5)
-                content = response.read().decode('utf-8')
-                if 'Welcome to the Meta-Layer Governance Hub' in content:
-                    print("✓ New text verified in HTTP response")
-                else:
-                    print("⚠ New text not found (may need browser refresh)")
-                    
-            except Exception as e:
-                print(f"⚠ API verification failed: {e}")
-            
-            return True
-        elif "AGENT_RESULT|ERROR" in result.stdout:
-            print("✗ DEPLOYMENT FAILED")
-            return False
-        else:
+        agent_status("Stopping service...")
+        stop_service(service)
+
+        agent_status("Clearing Python cache...")
+        clear_caches(SCRIPT_DIR)
+
+        agent_status("Verifying code...")
+        verify_code()
+
+        agent_status("Starting service...")
+        start_service(service)
+
+        agent_status("Checking service status...")
+        if not wait_active(service, port):
+            raise DeployError("Service failed to start")
+        agent_status("Service is ACTIVE")
+
+        agent_status("Testing HTTP connection...")
+        try:
+            http_code, content = probe_status(port)
+        except Exception:
+            http_code, content = 0, b''
+        if http_code != 200:
+            print(f"AGENT_RESULT|WARNING|Service started but HTTP test failed (code: {http_code:03d})")
             print("⚠ DEPLOYMENT STATUS UNKNOWN")
             return False
-            
-    except subprocess.TimeoutExpired:
-        print("✗ DEPLOYMENT TIMED OUT")
+        agent_status("HTTP test: PASSED (200)")
+    except DeployError as e:
+        print(f"AGENT_RESULT|ERROR|{e}")
+        print("✗ DEPLOYMENT FAILED")
         return False
     except Exception as e:
         print(f"✗ DEPLOYMENT ERROR: {e}")
         return False
 
+    print("AGENT_RESULT|SUCCESS|Deployment complete")
+    print()
+    print("✓ DEPLOYMENT SUCCESSFUL")
+
+    if NEW_TEXT.encode('utf-8') in content:
+        print("✓ New text verified in HTTP response")
+    else:
+        print("⚠ New text not found (may need browser refresh)")
+
+    # Verify via API
+    print("\nVerifying via API...")
+    try:
+        response = _http.request('GET', f'http://localhost:{port}/_deploy/status')
+        status = json.loads(response.data)
+        print(f"Environment: {status['environment']}")
+        print(f"Service active: {status['service_active']}")
+        print(f"Has new text: {status['has_new_text']}")
+    except Exception as e:
+        print(f"⚠ API verification failed: {e}")
+
+    return True
+
 if __name__ == '__main__':
     env = sys.argv[1] if len(sys.argv) > 1 else 'development'
     success = agent_deploy(env)
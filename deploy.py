@@ -10,21 +10,35 @@
 Exit codes:
     0 = Success
     1 = Failure
+    2 = Invalid arguments
 """
 
+import argparse
+import atexit
+import concurrent.futures
 import os
+import shlex
+import signal
+import sqlite3
 import sys
 import subprocess
 import json
+import shutil
 import time
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from pathlib import Path
 
+from deploy_core import sweep_caches, wait_active
+
 # Configuration
 SCRIPT_DIR = Path(__file__).parent.absolute()
 LOG_DIR = Path("/tmp")
-DEPLOYMENT_LOG = LOG_DIR / f"deploy-{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+# One clock read per run, shared by the log name, backup dir, tag and result
+START = datetime.now()
+START_STAMP = START.strftime('%Y%m%d_%H%M%S')
+DEPLOYMENT_LOG = LOG_DIR / f"deploy-{START_STAMP}.log"
 
 # Environment mapping
 ENV_CONFIG = {
@@ -44,21 +58,37 @@
     }
 }
 
+_LOG_FH = None
+
+def _get_log_fh():
+    """Open the deployment log once, line-buffered, and reuse the handle"""
+    global _LOG_FH
+    if _LOG_FH is None:
+        DEPLOYMENT_LOG.parent.mkdir(exist_ok=True)
+        _LOG_FH = open(DEPLOYMENT_LOG, 'a', buffering=1)
+        atexit.register(_LOG_FH.close)
+    return _LOG_FH
+
+# One keep-alive connection reused across readiness polls; retries are left
+# to wait_for_service's own backoff
+_SESSION = requests.Session()
+_SESSION.mount('http://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+_SESSION.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0))
+atexit.register(_SESSION.close)
+
 def log(message, level='INFO'):
     """Log message to file and stdout"""
-    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    timestamp = time.strftime('%Y-%m-%d %H:%M:%S')
     log_msg = f"[{timestamp}] [{level}] {message}"
     print(log_msg)
-    with open(DEPLOYMENT_LOG, 'a') as f:
-        f.write(log_msg + '\n')
+    _get_log_fh().write(log_msg + '\n')
 
-def run_command(cmd, check=True, capture_output=False):
-    """Run shell command and return result"""
-    log(f"Running: {cmd}")
+def run_command(argv, check=True, capture_output=False):
+    """Run a command given as an argv list (no shell) and return result"""
+    log(f"Running: {' '.join(shlex.quote(a) for a in argv)}")
     try:
         result = subprocess.run(
-            cmd,
-            shell=True,
+            argv,
             check=check,
             capture_output=capture_output,
             text=True,
@@ -72,67 +102,123 @@ def run_command(cmd, check=True, capture_output=False):
         if capture_output:
             return e.stdout.strip() if e.stdout else '', e.returncode
         return False
+    except OSError as e:
+        log(f"Command failed: {e}", 'ERROR')
+        if capture_output:
+            return '', 127
+        return False
 
-def get_current_branch():
-    """Get current git branch"""
-    stdout, _ = run_command('git branch --show-current', capture_output=True)
-    return stdout
+_git_state = None
 
-def get_current_commit():
-    """Get current git commit hash"""
-    stdout, _ = run_command('git rev-parse HEAD', capture_output=True)
-    return stdout
+def get_git_state(refresh=False):
+    """Get current commit, branch and dirty flag from one git invocation
 
-def check_git_status():
-    """Check if git repo is clean"""
-    stdout, _ = run_command('git status --porcelain', capture_output=True)
-    return stdout == ''
+    The result is cached; pass refresh=True after anything that moves HEAD.
+    """
+    global _git_state
+    if _git_state is not None and not refresh:
+        return _git_state
+    log("Running: git status --porcelain=v2 --branch")
+    result = subprocess.run(
+        ['git', 'status', '--porcelain=v2', '--branch'],
+        capture_output=True,
+        text=True,
+        cwd=SCRIPT_DIR
+    )
+    state = {'commit': '', 'branch': '', 'dirty': False}
+    for line in result.stdout.splitlines():
+        if line.startswith('# branch.oid '):
+            oid = line[len('# branch.oid '):]
+            state['commit'] = '' if oid == '(initial)' else oid
+        elif line.startswith('# branch.head '):
+            head = line[len('# branch.head '):]
+            state['branch'] = '' if head == '(detached)' else head
+        elif not line.startswith('#'):
+            state['dirty'] = True
+    _git_state = state
+    return state
 
 def clear_python_cache():
     """Clear Python cache files"""
     log("Clearing Python cache...")
-    run_command('find . -type d -name __pycache__ -exec rm -r {} + 2>/dev/null || true', check=False)
-    run_command('find . -type f -name "*.pyc" -delete 2>/dev/null || true', check=False)
+    sweep_caches(SCRIPT_DIR)
     log("Python cache cleared")
 
+def find_python_pids(port):
+    """PIDs of python processes whose command line mentions port, read from /proc"""
+    needle = str(port).encode()
+    own_pid = os.getpid()
+    pids = []
+    try:
+        entries = os.scandir('/proc')
+    except OSError:
+        return pids
+    with entries:
+        for entry in entries:
+            if not entry.name.isdigit() or int(entry.name) == own_pid:
+                continue
+            try:
+                with open(f'/proc/{entry.name}/cmdline', 'rb') as f:
+                    cmdline = f.read()
+            except OSError:
+                continue  # process exited or is not ours to read
+            if b'python' in cmdline and needle in cmdline:
+                pids.append(int(entry.name))
+    return pids
+
 def kill_processes_on_port(port):
     """Kill any processes using the specified port"""
     log(f"Killing processes on port {port}...")
-    run_command(
-        f"ps aux | grep python | grep {port} | awk '{{print $2}}' | xargs kill -9 2>/dev/null || true",
-        check=False
-    )
-    time.sleep(1)  # Give processes time to die
+    pids = []
+    for pid in find_python_pids(port):
+        try:
+            os.kill(pid, signal.SIGKILL)
+            pids.append(pid)
+        except (ProcessLookupError, PermissionError):
+            pass
+    # Wait (up to 1s) only as long as the killed processes are still around
+    end = time.monotonic() + 1.0
+    while pids and time.monotonic() < end:
+        pids = [pid for pid in pids if os.path.exists(f'/proc/{pid}')]
+        if pids:
+            time.sleep(0.05)
     log(f"Processes on port {port} killed")
 
-def restart_service(service_name):
-    """Restart systemd service"""
+def restart_service(service_name, port):
+    """Restart systemd service and wait until it is active and listening"""
     log(f"Restarting service: {service_name}")
-    run_command(f'systemctl --user restart {service_name}')
-    time.sleep(3)  # Give service time to start
-    log(f"Service {service_name} restarted")
+    run_command(['systemctl', '--user', 'restart', service_name])
+    if wait_active(service_name, port, deadline=10.0, interval=0.1):
+        log(f"Service {service_name} restarted")
+    else:
+        log(f"Service {service_name} not active after restart", 'WARN')
 
 def check_service_status(service_name):
-    """Check if service is active"""
-    stdout, returncode = run_command(
-        f'systemctl --user is-active {service_name}',
-        check=False,
-        capture_output=True
+    """Check if service is active (is-active --quiet reports via exit code only)"""
+    return run_command(
+        ['systemctl', '--user', 'is-active', '--quiet', service_name],
+        check=False
     )
-    return stdout == 'active'
 
-def wait_for_service(url, max_attempts=10, delay=2):
-    """Wait for service to respond"""
+def wait_for_service(url, deadline=20.0, delay=0.1, max_delay=2.0):
+    """Wait for service to respond, backing off exponentially between polls"""
     log(f"Waiting for service at {url}...")
-    for i in range(max_attempts):
+    end = time.monotonic() + deadline
+    attempt = 0
+    while True:
+        attempt += 1
         try:
-            response = requests.get(url, timeout=5, verify=False)
+            response = _SESSION.get(url, timeout=(1, 3), verify=False)
             if response.status_code == 200:
-                log(f"Service is responding (attempt {i+1}/{max_attempts})")
+                log(f"Service is responding (attempt {attempt})")
                 return True
-        except Exception as e:
-            log(f"Service not ready yet (attempt {i+1}/{max_attempts}): {e}", 'WARN')
+            log(f"Service not ready yet (attempt {attempt}): HTTP {response.status_code}", 'WARN')
+        except requests.RequestException as e:
+            log(f"Service not ready yet (attempt {attempt}): {e}", 'WARN')
+        if time.monotonic() + delay > end:
+            break
         time.sleep(delay)
+        delay = min(delay * 2, max_delay)
     log("Service did not respond in time", 'ERROR')
     return False
 
@@ -143,26 +229,34 @@ def create_backup(env):
         return True
     
     log("Creating production backup...")
-    backup_dir = SCRIPT_DIR / 'backups' / f'prod-{datetime.now().strftime("%Y%m%d_%H%M%S")}'
+    backup_dir = SCRIPT_DIR / 'backups' / f'prod-{START_STAMP}'
     backup_dir.mkdir(parents=True, exist_ok=True)
     
     # Backup database
     db_path = SCRIPT_DIR / 'instance' / 'datatracker.db'
     if db_path.exists():
-        import shutil
-        shutil.copy2(db_path, backup_dir / 'datatracker.db')
+        # SQLite online backup: a consistent page-level copy even if the app
+        # writes while it runs
+        src = sqlite3.connect(f'file:{db_path}?mode=ro', uri=True)
+        dst = sqlite3.connect(str(backup_dir / 'datatracker.db'))
+        try:
+            with dst:
+                src.backup(dst, pages=1024)
+        finally:
+            dst.close()
+            src.close()
         log("Database backed up")
     
     # Backup service file
     service_file = Path.home() / '.config' / 'systemd' / 'user' / 'datatracker.service'
     if service_file.exists():
-        import shutil
         shutil.copy2(service_file, backup_dir / 'datatracker.service')
         log("Service file backed up")
     
     # Save git state
-    commit = get_current_commit()
-    branch = get_current_branch()
+    git_state = get_git_state()
+    commit = git_state['commit']
+    branch = git_state['branch']
     with open(backup_dir / 'git-state.txt', 'w') as f:
         f.write(f"Commit: {commit}\nBranch: {branch}\n")
     
@@ -170,11 +264,7 @@ def create_backup(env):
     return True
 
 def deploy(env, branch=None):
-    """Main deployment function"""
-    if env not in ENV_CONFIG:
-        log(f"Invalid environment: {env}. Must be 'dev' or 'prod'", 'ERROR')
-        return False
-    
+    """Main deployment function (env is validated by main's argument parser)"""
     config = ENV_CONFIG[env]
     target_branch = branch or config['branch']
     service_name = config['service']
@@ -192,41 +282,56 @@ def deploy(env, branch=None):
     log("Stage 1: Pre-Deployment Checks")
     log("=" * 60)
     
+    git_state = get_git_state()
+
     # Check git status
-    if not check_git_status():
+    if git_state['dirty']:
         log("WARNING: Uncommitted changes detected", 'WARN')
         log("Continuing anyway...", 'WARN')
     
     # Check current branch
-    current_branch = get_current_branch()
+    current_branch = git_state['branch']
     log(f"Current branch: {current_branch}")
     
-    # Create backup for production
-    if env == 'prod':
-        if not create_backup(env):
-            log("Backup failed, aborting", 'ERROR')
-            return False
-    
     # Stage 2: Deployment
     log("=" * 60)
     log("Stage 2: Deployment")
     log("=" * 60)
     
+    # Fetch the target branch while the production backup is taken; the
+    # network-bound fetch and the disk-bound backup don't touch each other
+    log(f"Fetching origin/{target_branch}...")
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as ex:
+        fetch_fut = ex.submit(run_command, ['git', 'fetch', 'origin', target_branch])
+        backup_fut = ex.submit(create_backup, env)
+    
+    try:
+        backup_ok = backup_fut.result()
+    except Exception as e:
+        log(f"Backup error: {e}", 'ERROR')
+        backup_ok = False
+    if not backup_ok:
+        log("Backup failed, aborting", 'ERROR')
+        return False
+    if not fetch_fut.result():
+        log(f"Failed to fetch branch {target_branch}", 'ERROR')
+        return False
+    
     # Checkout target branch
     if current_branch != target_branch:
         log(f"Switching to branch: {target_branch}")
-        if not run_command(f'git checkout {target_branch}'):
+        if not run_command(['git', 'checkout', target_branch]):
             log(f"Failed to checkout branch {target_branch}", 'ERROR')
             return False
     
-    # Pull latest changes
-    log("Pulling latest changes...")
-    if not run_command('git pull'):
-        log("Failed to pull latest changes", 'ERROR')
+    # Merge the fetched changes (no network round trip)
+    log("Merging latest changes...")
+    if not run_command(['git', 'merge', f'origin/{target_branch}']):
+        log("Failed to merge latest changes", 'ERROR')
         return False
     
     # Get commit hash
-    commit_hash = get_current_commit()
+    commit_hash = get_git_state(refresh=True)['commit']
     log(f"Deploying commit: {commit_hash[:8]}")
     
     # Clear Python cache
@@ -241,7 +346,7 @@ def deploy(env, branch=None):
     kill_processes_on_port(port)
 
     # Restart service
-    restart_service(service_name)
+    restart_service(service_name, port)
     
     # Stage 3: Verification
     log("=" * 60)
@@ -269,8 +374,8 @@ def deploy(env, branch=None):
 
     # Create git tag for production
     if env == 'prod':
-        tag_name = f"deployed-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
-        run_command(f'git tag {tag_name}', check=False)
+        tag_name = f"deployed-{START.strftime('%Y%m%d-%H%M%S')}"
+        run_command(['git', 'tag', tag_name], check=False)
         log(f"Created tag: {tag_name}")
 
     # Remove deployment flag file
@@ -292,28 +397,23 @@ def deploy(env, branch=None):
 
 def main():
     """Main entry point"""
-    if len(sys.argv) < 2:
-        print("Usage: python3 deploy.py <env> [--branch <branch>]")
-        print("  env: 'dev' or 'prod'")
-        print("  branch: Optional branch name (defaults to env branch)")
-        sys.exit(1)
-    
-    env = sys.argv[1].lower()
-    branch = None
-    
-    # Parse --branch flag
-    if '--branch' in sys.argv:
-        idx = sys.argv.index('--branch')
-        if idx + 1 < len(sys.argv):
-            branch = sys.argv[idx + 1]
+    parser = argparse.ArgumentParser(description="Deploy the MLTF Datatracker")
+    parser.add_argument('env', type=str.lower, choices=sorted(ENV_CONFIG),
+                        help="target environment")
+    parser.add_argument('--branch',
+                        help="branch to deploy (defaults to the environment's branch)")
+    args = parser.parse_args()
+    env = args.env
+    branch = args.branch
+    config = ENV_CONFIG[env]
     
     # Initialize log file
-    DEPLOYMENT_LOG.parent.mkdir(exist_ok=True)
-    with open(DEPLOYMENT_LOG, 'w') as f:
-        f.write(f"Deployment log started at {datetime.now()}\n")
-        f.write(f"Environment: {env}\n")
-        f.write(f"Branch: {branch or 'default'}\n")
-        f.write("=" * 60 + "\n")
+    _get_log_fh().write(
+        f"Deployment log started at {START}\n"
+        f"Environment: {env}\n"
+        f"Branch: {branch or 'default'}\n"
+        + "=" * 60 + "\n"
+    )
     
     # Run deployment
     success = deploy(env, branch)
@@ -322,10 +422,11 @@ def main():
     result = {
         'success': success,
         'environment': env,
-        'branch': branch or ENV_CONFIG[env]['branch'],
-        'commit': get_current_commit(),
+        'branch': branch or config['branch'],
+        # Re-query on failure: HEAD may have moved after the last refresh
+        'commit': get_git_state(refresh=not success)['commit'],
         'log_file': str(DEPLOYMENT_LOG),
-        'timestamp': datetime.now().isoformat()
+        'timestamp': START.isoformat()
     }
     
     print("\n" + "=" * 60)
@@ -0,0 +1,538 @@
+#!/usr/bin/env python3
+"""
+Deploy core - shared restart/verify pipeline for the dev deploy scripts
+
+ABSOLUTE_FIX.py, DEPLOY_AND_VERIFY.py, DO_RESTART.py, FINAL_DEPLOY_TEST.py and
+NUKE_AND_RESTART.py are thin wrappers that run deploy() with one of the
+PROFILES below, so they all share one implementation of each step.
+
+Usage:
+    python3 deploy_core.py <fix|verify|quick|final|nuke> [--force]
+
+Exit codes:
+    0 = Success (or nothing to do)
+    1 = Failure
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import random
+import re
+import shutil
+import socket
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+import urllib3
+
+ROOT = '/home/ubuntu/datatracker'
+SOURCE_FILE = os.path.join(ROOT, 'ietf_data_viewer_simple.py')
+# The app hashes its stylesheet and script into the page URLs at import,
+# so a change to either needs a restart just like a source change
+STATIC_FILES = (os.path.join(ROOT, 'static', 'css', 'datatracker.css'),
+                os.path.join(ROOT, 'static', 'js', 'datatracker.js'))
+STAMP_FILE = '/tmp/.datatracker-deploy-stamp'
+NGINX_DIR = '/etc/nginx'
+NGINX_STAMP_FILE = '/tmp/.datatracker-nginx-stamp'
+SERVICE = 'datatracker-dev.service'
+PORT = 8001
+LOCAL_URL = f'http://localhost:{PORT}/'
+DEV_URL = 'https://dev.rfc.themetalayer.org/'
+
+# (marker bytes, description) pairs checked in the source and the served page
+NEW_TEXT = (b'Welcome to the Meta-Layer Governance Hub', 'New homepage text')
+RED_BOX = (b'DEPLOYMENT TEST SUCCESSFUL', 'Red test box')
+VERSION = (b'Version: 2026-01-17-final', 'Version marker')
+
+# Only the top of the homepage is needed for the marker checks. The lead
+# paragraph currently sits ~15KB in, so leave plenty of headroom.
+PROBE_BYTES = 64 * 1024
+
+_TITLE_RE = re.compile(rb'<title>(.*?)</title>')
+_LEAD_RE = re.compile(rb'<p class="lead">(.*?)</p>')
+
+# Shared keep-alive pool so repeated probes reuse TCP/TLS connections
+_http = urllib3.PoolManager(num_pools=2, maxsize=5, timeout=15.0, retries=False)
+atexit.register(_http.clear)
+
+
+@dataclass(frozen=True)
+class Profile:
+    """How one deploy script varies the common pipeline"""
+    title: str
+    markers: tuple = (NEW_TEXT,)       # all must be in the source and the page
+    kill_ports: bool = False           # also lsof-kill 8000/8001 and stop prod
+    status_checks: bool = False        # hit /_deploy/status and /_deploy/test
+    homepage_text_check: bool = False  # hit /_test/homepage-text each attempt
+    reload_nginx: bool = True
+    probe_dev: bool = True
+    attempts: int = 1
+    probe_timeout: float = 15.0
+    save_html: Optional[str] = None    # write the localhost body here
+    output_file: Optional[str] = None  # also append timestamped lines here
+
+
+PROFILES = {
+    'fix': Profile('ABSOLUTE FIX FOR DEVELOPMENT DEPLOYMENT'),
+    'verify': Profile('DEPLOY AND VERIFY - NO AMBIGUITY', status_checks=True,
+                      probe_timeout=10.0),
+    'quick': Profile('QUICK RESTART', reload_nginx=False, probe_dev=False,
+                     probe_timeout=10.0,
+                     save_html='/tmp/homepage-content.html'),
+    'final': Profile('FINAL DEPLOYMENT TEST', homepage_text_check=True,
+                     reload_nginx=False, probe_dev=False, attempts=3,
+                     probe_timeout=10.0,
+                     output_file=os.path.join(ROOT, 'DEPLOY_RESULT.txt')),
+    'nuke': Profile('NUKE AND RESTART - COMPLETE SYSTEM RESET',
+                    markers=(RED_BOX, NEW_TEXT, VERSION), kill_ports=True,
+                    probe_timeout=20.0),
+}
+
+
+def run_cmd(cmd, timeout=None):
+    """Run command safely (argv lists skip the shell)"""
+    try:
+        result = subprocess.run(cmd, shell=isinstance(cmd, str), capture_output=True, text=True, timeout=timeout)
+        return result.returncode == 0, result.stdout.strip(), result.stderr.strip()
+    except subprocess.TimeoutExpired:
+        return False, "", "TIMEOUT"
+    except Exception as e:
+        return False, "", str(e)
+
+def run_quiet(cmd):
+    """Run command with output discarded; returns success"""
+    return subprocess.run(cmd, shell=isinstance(cmd, str), stdout=subprocess.DEVNULL,
+                          stderr=subprocess.DEVNULL).returncode == 0
+
+def sweep_caches(path):
+    """In-process cache sweep via os.scandir, for hosts without find
+
+    Best effort like the find sweep it replaces: unreadable or vanished
+    directories and files are skipped rather than raised.
+    """
+    try:
+        it = os.scandir(path)
+    except OSError:
+        return
+    with it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name == '__pycache__':
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    sweep_caches(entry.path)
+            elif entry.name.endswith(('.pyc', '.pyo')):
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+
+def clear_caches(root=ROOT):
+    """Remove __pycache__ dirs and .pyc/.pyo files under root via find, falling back to os.scandir"""
+    if shutil.which('find') is None:
+        sweep_caches(root)
+        return
+    run_quiet(['find', root, '-type', 'd', '-name', '__pycache__', '-prune',
+               '-exec', 'rm', '-rf', '{}', '+'])
+    run_quiet(['find', root, '(', '-name', '*.pyc', '-o', '-name', '*.pyo', ')', '-delete'])
+
+def source_fingerprint():
+    """Return the app source and static asset mtimes, used to detect no-op redeploys"""
+    return ":".join(str(os.stat(path).st_mtime_ns) for path in (SOURCE_FILE, *STATIC_FILES))
+
+def deploy_is_current(service=SERVICE):
+    """True if the source is unchanged since the last good deploy and the service is up"""
+    try:
+        with open(STAMP_FILE) as f:
+            if f.read().strip() != source_fingerprint():
+                return False
+    except OSError:
+        return False
+    return subprocess.run(['systemctl', '--user', 'is-active', '--quiet',
+                           service]).returncode == 0
+
+def record_deploy():
+    """Remember the source fingerprint of a successful deploy"""
+    with open(STAMP_FILE, 'w') as f:
+        f.write(source_fingerprint())
+
+def nginx_fingerprint():
+    """File count and newest mtime under /etc/nginx, following site symlinks"""
+    count = newest = 0
+    for dirpath, _, files in os.walk(NGINX_DIR):
+        for name in files:
+            try:
+                newest = max(newest, os.stat(os.path.join(dirpath, name)).st_mtime_ns)
+            except OSError:
+                continue
+            count += 1
+    return f"{count}:{newest}"
+
+def nginx_changed():
+    """True unless the nginx config matches the last successful reload"""
+    try:
+        with open(NGINX_STAMP_FILE) as f:
+            return f.read().strip() != nginx_fingerprint()
+    except OSError:
+        return True
+
+def stop_service(kill_ports=False):
+    """Kill the app processes, then stop the dev service in a single shell"""
+    # pkill runs on its own: a shell whose command line contains the pattern
+    # would match it and be killed before running the rest of the batch
+    run_quiet(['pkill', '-9', '-f', 'python.*(ietf_data|8001)'])
+    cmd = ""
+    if kill_ports:
+        cmd += ("lsof -t -i:8000 -i:8001 | xargs -r kill -9; "
+                "systemctl --user stop datatracker.service; ")
+    cmd += f"systemctl --user stop {SERVICE}"
+    run_quiet(cmd)
+
+def start_service(service=SERVICE):
+    """Start the service; returns (success, stderr)"""
+    success, _, stderr = run_cmd(['systemctl', '--user', 'start', service])
+    return success, stderr
+
+def wait_active(service=SERVICE, port=PORT, deadline=20.0, interval=0.25):
+    """Poll until the service is active and its port accepts connections"""
+    start = time.monotonic()
+    while time.monotonic() - start < deadline:
+        result = subprocess.run(['systemctl', '--user', 'is-active', '--quiet', service])
+        if result.returncode == 0:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=0.5).close()
+                return True
+            except OSError:
+                pass
+        time.sleep(interval)
+    return False
+
+def wait_http_200(url, deadline=15.0, interval=0.2):
+    """Poll url with HEAD until it answers 2xx; returns False after deadline seconds"""
+    start = time.monotonic()
+    while time.monotonic() - start < deadline:
+        try:
+            if 200 <= _http.request('HEAD', url, timeout=2.0).status < 300:
+                return True
+        except urllib3.exceptions.HTTPError:
+            pass
+        time.sleep(interval)
+    return False
+
+def contains_markers(resp, markers, chunk=8192, sink=None):
+    """Stream resp and stop reading once every marker has been seen.
+
+    Returns the set of markers found. Only the longest marker's length minus
+    one is carried between chunks; every chunk read is passed to sink if given.
+    """
+    wanted = set(markers)
+    found = set()
+    keep = max(len(m) for m in wanted) - 1
+    tail = b''
+    try:
+        while True:
+            data = resp.read(chunk)
+            if not data:
+                resp.release_conn()
+                return found
+            if sink is not None:
+                sink(data)
+            window = tail + data
+            found.update(m for m in wanted - found if m in window)
+            if found == wanted:
+                # Unread body left on the socket, so it can't go back to the pool
+                resp.close()
+                return found
+            tail = window[-keep:] if keep else b''
+    except Exception:
+        resp.close()
+        raise
+
+def probe(url, markers, sink=None, timeout=15.0):
+    """GET the start of url and stream-check it; returns (status code, set of markers found)
+
+    Servers that honour Range answer 206 with at most PROBE_BYTES; others
+    send the full page with 200, which is fine too.
+    """
+    response = _http.request('GET', url, timeout=timeout, preload_content=False,
+                             headers={'Range': f'bytes=0-{PROBE_BYTES - 1}'})
+    return response.status, contains_markers(response, markers, sink=sink)
+
+def check_markers(body, markers):
+    """Return the descriptions of the (marker, description) pairs present in body"""
+    return [desc for marker, desc in markers if marker in body]
+
+async def reload_nginx():
+    """Validate and reload nginx; returns (success, stderr)"""
+    try:
+        proc = await asyncio.create_subprocess_exec(
+            'sh', '-c', 'sudo nginx -t && sudo systemctl reload nginx',
+            stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.PIPE)
+    except OSError as e:
+        return False, str(e)
+    try:
+        _, stderr = await asyncio.wait_for(proc.communicate(), timeout=20)
+    except asyncio.TimeoutError:
+        proc.kill()
+        return False, "TIMEOUT"
+    if proc.returncode != 0:
+        return False, stderr.decode('utf-8', 'replace').strip()
+    with open(NGINX_STAMP_FILE, 'w') as f:
+        f.write(nginx_fingerprint())
+    return True, ""
+
+async def probe_pages(profile, local_sink, dev_sink, reload=True):
+    """Probe localhost while nginx reloads; probe dev once nginx is done.
+
+    Returns (local, nginx, dev): local/dev are probe() results, the exception
+    raised, or None if skipped; nginx is the reload_nginx() tuple or None.
+    """
+    markers = [m for m, _ in profile.markers]
+
+    async def nginx_then_dev():
+        nginx = await reload_nginx() if reload and profile.reload_nginx else None
+        if not profile.probe_dev:
+            return nginx, None
+        try:
+            dev = await asyncio.to_thread(probe, DEV_URL, markers, dev_sink, profile.probe_timeout)
+        except Exception as e:
+            dev = e
+        return nginx, dev
+
+    local, (nginx, dev) = await asyncio.gather(
+        asyncio.to_thread(probe, LOCAL_URL, markers, local_sink, profile.probe_timeout),
+        nginx_then_dev(), return_exceptions=True)
+    return local, nginx, dev
+
+def _logger(fd):
+    def log(msg):
+        if fd is not None:
+            # One unbuffered O_APPEND write per line, so the file can be tailed live
+            os.write(fd, f"{datetime.now().isoformat()}: {msg}\n".encode('utf-8'))
+        print(msg, flush=True)
+    return log
+
+def backoff(attempt, base=0.5, cap=4.0):
+    """Jittered exponential delay before retry number attempt (1-based)"""
+    return min(base * 2 ** (attempt - 1), cap) * random.uniform(0.5, 1.0)
+
+def _check_deploy_endpoints(log, timeout):
+    """Hit the /_deploy/status and /_deploy/test endpoints"""
+    try:
+        response = _http.request('GET', LOCAL_URL + '_deploy/status', timeout=timeout)
+        status_data = json.loads(response.data)
+        log("   ✓ Status endpoint works")
+        log(f"      Environment: {status_data.get('environment')}")
+        log(f"      Code changed: {status_data.get('code_changed')}")
+        log(f"      Service active: {status_data.get('service_active')}")
+        if status_data.get('current_homepage_text'):
+            log(f"      Homepage text: {status_data.get('current_homepage_text')[:50]}...")
+    except Exception as e:
+        log(f"   ✗ Status endpoint failed: {e}")
+        return False
+
+    try:
+        response = _http.request('GET', LOCAL_URL + '_deploy/test', timeout=timeout)
+        if b'DEPLOYMENT TEST PAGE' in response.data:
+            log("   ✓ Test page works")
+        else:
+            log("   ✗ Test page content wrong")
+            return False
+    except Exception as e:
+        log(f"   ✗ Test page failed: {e}")
+        return False
+    return True
+
+def _fetch_homepage_text(timeout):
+    response = _http.request('GET', LOCAL_URL + '_test/homepage-text', timeout=timeout)
+    return json.loads(response.data)
+
+def _log_debug(log, source, body):
+    match = _TITLE_RE.search(body)
+    if match:
+        log(f"{source.upper()} title: {match.group(1).decode('utf-8', 'replace')}")
+    match = _LEAD_RE.search(body)
+    if match:
+        log(f"{source.upper()} lead text: {match.group(1).decode('utf-8', 'replace')!r}")
+    else:
+        log(f"No <p class='lead'> found on {source}")
+        log("First 300 chars of response:")
+        log(body[:300].decode('utf-8', 'replace'))
+
+def deploy(profile, force=False):
+    """Run the stop/clear/start/verify pipeline for profile; returns success"""
+    if not profile.output_file:
+        return _deploy(profile, force, _logger(None))
+    fd = os.open(profile.output_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        return _deploy(profile, force, _logger(fd))
+    finally:
+        os.close(fd)
+
+def _deploy(profile, force, log):
+    log("=" * 70)
+    log(profile.title)
+    log("=" * 70)
+
+    if not force and deploy_is_current():
+        log("\nNo changes since last deploy and service is active; skipping restart (--force to override)")
+        return True
+
+    # Step 1: Verify code
+    log("\n[1] VERIFYING CODE...")
+    try:
+        with open(SOURCE_FILE, 'rb') as f:
+            code = f.read()
+    except OSError as e:
+        log(f"   ✗ Error reading code: {e}")
+        return False
+    log(f"   File size: {len(code)} bytes")
+    found = check_markers(code, profile.markers)
+    for _, desc in profile.markers:
+        log(f"   ✓ {desc} found" if desc in found else f"   ✗ {desc} NOT found!")
+    if len(found) != len(profile.markers):
+        return False
+    match = _LEAD_RE.search(code)
+    if match:
+        log(f"   Found text in code: {match.group(1).decode('utf-8', 'replace')}")
+
+    # Step 2: Kill everything
+    log("\n[2] KILLING ALL PROCESSES...")
+    stop_service(profile.kill_ports)
+    time.sleep(3)
+    log("   ✓ All processes killed")
+
+    # Step 3: Clear cache
+    log("\n[3] CLEARING ALL CACHE...")
+    clear_caches()
+    log("   ✓ Cache cleared")
+
+    # Step 4: Start service
+    log("\n[4] STARTING SERVICE...")
+    success, stderr = start_service()
+    if not success:
+        log(f"   ✗ Failed to start service: {stderr}")
+        return False
+    log("   ✓ Service started")
+
+    # Step 5: Wait for readiness
+    log("\n[5] WAITING FOR SERVICE...")
+    if not wait_active():
+        log("   ✗ Service not active after 20s")
+        return False
+    log("   ✓ Service is ACTIVE")
+    if wait_http_200(LOCAL_URL + '_deploy/status'):
+        log("   ✓ /_deploy/status answering")
+    else:
+        log("   ⚠ /_deploy/status not answering after 15s; probing anyway")
+
+    # Step 6: Deployment endpoints
+    if profile.status_checks:
+        log("\n[6] TESTING DEPLOYMENT ENDPOINTS...")
+        if not _check_deploy_endpoints(log, profile.probe_timeout):
+            return False
+
+    # Step 7: Reload nginx and probe the pages
+    log("\n[7] TESTING CONNECTIONS...")
+    markers = [m for m, _ in profile.markers]
+    local_ok = dev_ok = False
+    local_body = dev_body = b''
+    homepage_text = None
+    reload = profile.reload_nginx and (force or nginx_changed())
+    if profile.reload_nginx and not reload:
+        log("   ✓ Nginx config unchanged since last reload; skipping nginx -t/reload")
+    for attempt in range(profile.attempts):
+        if attempt:
+            time.sleep(backoff(attempt))
+        if profile.homepage_text_check:
+            try:
+                homepage_text = _fetch_homepage_text(profile.probe_timeout)
+                log("   ✓ Test endpoint responded")
+            except Exception as e:
+                log(f"   Attempt {attempt + 1} failed: {e}")
+                continue
+
+        local_chunks, dev_chunks = [], []
+        local, nginx, dev = asyncio.run(probe_pages(
+            profile, local_chunks.append, dev_chunks.append, reload=reload and attempt == 0))
+        local_body, dev_body = b''.join(local_chunks), b''.join(dev_chunks)
+
+        if nginx is not None:
+            if nginx[0]:
+                log("   ✓ Nginx reloaded")
+            else:
+                log(f"   ⚠ Nginx config error: {nginx[1]}")
+                log("   Continuing anyway...")
+
+        for source, result in (('localhost', local), ('dev subdomain', dev)):
+            if result is None:
+                continue
+            if isinstance(result, Exception):
+                log(f"   ✗ {source.capitalize()} error: {result}")
+                continue
+            status, page_found = result
+            log(f"   ✓ {source.capitalize()}: HTTP {status}")
+            log(f"   {source.upper()}: {len(page_found)}/{len(markers)} markers found")
+            if source == 'localhost':
+                local_ok = len(page_found) == len(markers)
+            else:
+                dev_ok = len(page_found) == len(markers)
+
+        if profile.save_html and local_body:
+            with open(profile.save_html, 'wb') as f:
+                f.write(local_body)
+        if local_ok or dev_ok:
+            break
+
+    # Final result
+    log("\n" + "=" * 70)
+    if dev_ok:
+        log("🎉 SUCCESS! The change is LIVE on the dev subdomain!")
+        log(f"Visit: {DEV_URL}")
+        log("Hard refresh: Ctrl+Shift+R (or Cmd+Shift+R)")
+    elif local_ok and profile.probe_dev:
+        log("⚠️  PARTIAL SUCCESS - Change is live on localhost but nginx issue")
+        log(f"Try accessing directly: http://216.238.91.120:{PORT}")
+        log("Or fix nginx proxy")
+    elif local_ok:
+        log("🎉 SUCCESS! The change is live on localhost")
+    else:
+        log("❌ FAILED - Change not found anywhere")
+        log("\nDEBUGGING INFO:")
+        for source, body in (('localhost', local_body), ('dev subdomain', dev_body)):
+            if body:
+                _log_debug(log, source, body)
+        if profile.save_html and local_body:
+            log(f"Content saved to {profile.save_html}")
+        if homepage_text is not None:
+            # Pretty-printed once, for the last attempt only
+            log("\nTest endpoint response:")
+            log(json.dumps(homepage_text, indent=2))
+        log("\nCheck service status:")
+        log(f"systemctl --user status {SERVICE}")
+        log(f"journalctl --user -u {SERVICE} -n 20")
+    log("=" * 70)
+
+    if local_ok or dev_ok:
+        record_deploy()
+        return True
+    return False
+
+def main(profile_name=None):
+    """Entry point shared by the wrapper scripts"""
+    args = [a for a in sys.argv[1:] if a != '--force']
+    name = profile_name or (args[0] if args else None)
+    if name not in PROFILES:
+        print(f"Usage: python3 deploy_core.py <{'|'.join(PROFILES)}> [--force]")
+        sys.exit(1)
+    success = deploy(PROFILES[name], force='--force' in sys.argv)
+    sys.exit(0 if success else 1)
+
+if __name__ == '__main__':
+    main()
@@ -10,12 +10,25 @@
 Version: 2026-01-17-final (includes "Welcome to the Meta-Layer Governance Hub" and visible red test box)
 """
 
-from flask import Flask, render_template_string, request, redirect, url_for, flash, session, send_file, jsonify
+from flask import Flask, render_template, stream_template, make_response, request, redirect, url_for, flash, session, send_file, jsonify, g
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from markupsafe import escape
+from jinja2 import DictLoader, FileSystemBytecodeCache
 import os
 import re
 import json
 import uuid
+import mmap
+import string
+import hashlib
+import time
+import threading
+import functools
+from urllib.parse import urlencode
+from collections import deque
 from datetime import datetime, timedelta
 from werkzeug.utils import secure_filename
 from werkzeug.security import generate_password_hash, check_password_hash
@@ -33,11 +46,27 @@
 except ImportError:
     DOCX_SUPPORT = False
 
+try:
+    from flask_compress import Compress
+    COMPRESS_SUPPORT = True
+except ImportError:
+    COMPRESS_SUPPORT = False
+
+try:
+    import orjson
+    ORJSON_SUPPORT = True
+except ImportError:
+    ORJSON_SUPPORT = False
+
 # Database initialization
 def init_db():
     """Initialize database and create tables"""
     with app.app_context():
         db.create_all()
+        # create_all() skips indexes on tables that already exist
+        for index in (*Submission.__table__.indexes, *User.__table__.indexes,
+                      *WorkingGroupChair.__table__.indexes):
+            index.create(db.engine, checkfirst=True)
 
         # Migrate hardcoded users to database if not already done
         if User.query.count() == 0:
@@ -59,7 +88,7 @@ def init_db():
                 'abstract': draft.abstract,
                 'stream': draft.stream
             }
-            DRAFTS.append(draft_entry)
+            _add_draft(draft_entry)
 
         print(f"Database initialized: {User.query.count()} users, {len(published_drafts)} published drafts loaded")
 
@@ -162,6 +191,35 @@ def safe_create_all(*args, **kwargs):
 app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{DB_PATH}'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['DEBUG'] = DEBUG
+# Templates live in this module and only change with a restart; keep compiled
+# bytecode across restarts in Jinja's per-user cache dir
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache(pattern='mltf-%s.cache')
+# Pages are mostly repeated Bootstrap markup; compress them on the wire,
+# preferring Brotli and falling back to gzip
+if COMPRESS_SUPPORT:
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'application/javascript', 'application/json']
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_LEVEL'] = 6
+    app.config['COMPRESS_BR_LEVEL'] = 5
+    app.config['COMPRESS_MIN_SIZE'] = 500
+    Compress(app)
+
+# jsonify() and request.get_json() go through orjson when it is available;
+# keys stay sorted and Flask's fallbacks still cover Decimal, Markup etc.
+if ORJSON_SUPPORT:
+    class OrjsonProvider(DefaultJSONProvider):
+        def dumps(self, obj, **kwargs):
+            option = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = OrjsonProvider(app)
 db = SQLAlchemy(app)
 
 # Database Models
@@ -175,7 +233,7 @@ class Submission(db.Model):
     file_path = db.Column(db.String(500))
     draft_name = db.Column(db.String(255))
     status = db.Column(db.String(20), default='submitted')  # submitted, approved, rejected
-    submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
+    submitted_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     submitted_by = db.Column(db.String(100), default='Anonymous User')
     approved_at = db.Column(db.DateTime, nullable=True)
     rejected_at = db.Column(db.DateTime, nullable=True)
@@ -234,7 +292,7 @@ class User(db.Model):
     email = db.Column(db.String(100), unique=True, index=True)
     role = db.Column(db.String(20), default='user')  # admin, editor, user
     theme = db.Column(db.String(10), default='dark')  # light, dark, auto
-    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
     last_login = db.Column(db.DateTime, nullable=True)
 
 class UserFollow(db.Model):
@@ -259,43 +317,205 @@ class UserFollow(db.Model):
 
 class WorkingGroupChair(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    group_acronym = db.Column(db.String(50), index=True)  # Remove unique constraint to allow multiple chairs
+    group_acronym = db.Column(db.String(50))  # Remove unique constraint to allow multiple chairs
     chair_name = db.Column(db.String(100))
     approved = db.Column(db.Boolean, default=False)
     set_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Serves both the per-group chair lists and the (group, name) duplicate check
+    __table_args__ = (db.Index('ix_working_group_chair_group_name', 'group_acronym', 'chair_name'),)
+
 # Users are now stored in database - this dict is kept for backward compatibility during migration
 
-# Store document history in memory
+# Store document history in memory, newest first, capped per document
 DOCUMENT_HISTORY = {}
+DOCUMENT_HISTORY_MAX = 500
 
 # Store comments in memory
 COMMENTS = {}
 
-# Store comment likes in memory
-COMMENT_LIKES = {}
+# Store comment likes in memory: like count and the set of users who liked,
+# keyed by (draft_name, comment_id), kept in step by toggle_comment_like
+COMMENT_LIKE_COUNTS = {}
+COMMENT_LIKE_USERS = {}
 
 # Store comment replies in memory
 COMMENT_REPLIES = {}
 
-# Store working group chairs in memory
+# Store working group chairs in memory, with indices by approval state and by
+# (group_acronym, chair_name); mutate only through the _*_chair helpers, which
+# hold _chairs_lock so concurrent requests keep the store and indices in step
 WORKING_GROUP_CHAIRS = {}
+_chairs_lock = threading.Lock()
+_chairs_by_status = {True: set(), False: set()}
+_chair_keys = {}
+# Rendered admin table row per chair id, as (approved, set_at, html)
+_chair_row_cache = {}
+# Bumped on every chair change; feeds the chair list's ETag
+_chairs_version = 0
+
+def _add_chair(chair_id, chair_data):
+    """Add a chair; False if the group already has a chair by that name"""
+    global _chairs_version
+    key = (chair_data['group_acronym'], chair_data['chair_name'])
+    with _chairs_lock:
+        if key in _chair_keys:
+            return False
+        _chairs_version += 1
+        WORKING_GROUP_CHAIRS[chair_id] = chair_data
+        _chairs_by_status[chair_data['approved']].add(chair_id)
+        _chair_keys[key] = chair_id
+    return True
+
+def _approve_chair(chair_id):
+    """Approve a chair; False if there is no such chair"""
+    global _chairs_version
+    with _chairs_lock:
+        if chair_id not in WORKING_GROUP_CHAIRS:
+            return False
+        _chairs_version += 1
+        _chairs_by_status[False].discard(chair_id)
+        _chairs_by_status[True].add(chair_id)
+        WORKING_GROUP_CHAIRS[chair_id]['approved'] = True
+        _chair_row_cache.pop(chair_id, None)
+    return True
+
+def _delete_chair(chair_id):
+    """Delete a chair; False if there is no such chair"""
+    global _chairs_version
+    with _chairs_lock:
+        chair_data = WORKING_GROUP_CHAIRS.pop(chair_id, None)
+        if chair_data is None:
+            return False
+        _chairs_version += 1
+        _chair_row_cache.pop(chair_id, None)
+        _chairs_by_status[chair_data['approved']].discard(chair_id)
+        del _chair_keys[(chair_data['group_acronym'], chair_data['chair_name'])]
+    return True
+
+def _get_chair_counts():
+    """(total, approved, pending) in-memory chairs, read off the status index"""
+    with _chairs_lock:
+        approved = len(_chairs_by_status[True])
+        pending = len(_chairs_by_status[False])
+    return approved + pending, approved, pending
+
+# Admin dashboard counts, keyed by _stats_version; the version is bumped
+# on every database commit, and entries also expire
+DASHBOARD_STATS_TTL = 60
+_stats_version = 0
+_stats_cache = {}
+
+def _bump_stats(*_):
+    global _stats_version
+    _stats_version += 1
+
+event.listen(Session, 'after_commit', _bump_stats)
+
+def _get_dashboard_stats(ttl=DASHBOARD_STATS_TTL):
+    """Counts shown on the admin dashboard"""
+    version = _stats_version
+    now = time.monotonic()
+    cached = _stats_cache.get(version)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    stats = {
+        'total_users': User.query.count(),
+        'total_groups': len(GROUPS),
+        'total_submissions': Submission.query.count(),
+        'approved_drafts': PublishedDraft.query.count(),
+        'pending_chairs': WorkingGroupChair.query.filter_by(approved=False).count(),
+        'pending_submissions': Submission.query.filter_by(status='submitted').count(),
+    }
+    _stats_cache.clear()
+    _stats_cache[version] = (stats, now + ttl)
+    return stats
+
+# Home page document count, invalidated the same way with a short TTL
+HOME_STATS_TTL = 5
+_home_count_cache = {}
+
+def _get_home_doc_count(ttl=HOME_STATS_TTL):
+    """Static drafts plus approved/published submissions"""
+    version = _stats_version
+    now = time.monotonic()
+    cached = _home_count_cache.get(version)
+    if cached is not None and cached[1] > now:
+        return cached[0]
+    doc_count = len(DRAFTS) + Submission.query.filter(Submission.status.in_(['approved', 'published'])).count()
+    _home_count_cache.clear()
+    _home_count_cache[version] = (doc_count, now + ttl)
+    return doc_count
 
 # Configuration for file uploads
 UPLOAD_FOLDER = '/home/ubuntu/data-tracker/uploads'
-ALLOWED_EXTENSIONS = {'txt', 'pdf', 'xml', 'doc', 'docx'}
+ALLOWED_EXTENSIONS = frozenset({'txt', 'pdf', 'xml', 'doc', 'docx'})
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
+# Precompiled patterns for draft-name slugs and the (mmapped, bytes) group alias file
+_SLUG_STRIP = re.compile(r'[^a-zA-Z0-9\s-]')
+_SLUG_WS = re.compile(r'\s+')
+_GROUP_RE = re.compile(rb'^(?!#)[^\n]*?xfilter-([^:\n]+):', re.MULTILINE)
+# Whitespace collapsing for extracted PDF/DOCX text
+_MULTI_NL = re.compile(r'\n+')
+_MULTI_SPACE = re.compile(r' +')
+
 # Comment edit/delete time limit (in minutes)
 EDIT_DELETE_TIME_MINUTES = 15
 
 # Create upload directory if it doesn't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
+@functools.lru_cache(maxsize=4)
+def _now_str(second, fmt):
+    return datetime.fromtimestamp(second).strftime(fmt)
+
+def now_str(fmt='%Y-%m-%d %H:%M:%S'):
+    """Current local time formatted with fmt, formatted once per second"""
+    return _now_str(int(time.time()), fmt)
+
+@functools.lru_cache(maxsize=8192)
+def fmt_dt(value, fmt):
+    """value.strftime(fmt), cached since the same rows are rendered repeatedly"""
+    return value.strftime(fmt)
+
+# Successful password checks, keyed by (stored hash, keyed BLAKE2 digest of
+# stored hash + attempt) so the raw password is never kept; the key is random
+# per process, so the digests are useless outside it. Entries expire after the TTL;
+# eviction and insertion hold _password_checks_lock so concurrent logins at the
+# cap can't race on the oldest entry
+_PASSWORD_CHECKS = {}
+_password_checks_lock = threading.Lock()
+_PASSWORD_CHECK_KEY = os.urandom(32)
+PASSWORD_CHECK_TTL = 300
+PASSWORD_CHECK_MAX = 1024
+
+@functools.lru_cache(maxsize=1)
+def _dummy_password_hash():
+    return generate_password_hash(uuid.uuid4().hex)
+
+def verify_password(password_hash, password):
+    """check_password_hash, skipping the slow KDF for a recently verified pair"""
+    digest = hashlib.blake2b(f"{password_hash}:{password}".encode(),
+                             key=_PASSWORD_CHECK_KEY, digest_size=16).digest()
+    key = (password_hash, digest)
+    now = time.monotonic()
+    expires = _PASSWORD_CHECKS.get(key)
+    if expires is not None and expires > now:
+        return True
+    if not check_password_hash(password_hash, password):
+        return False
+    with _password_checks_lock:
+        if len(_PASSWORD_CHECKS) >= PASSWORD_CHECK_MAX:
+            _PASSWORD_CHECKS.pop(next(iter(_PASSWORD_CHECKS)), None)
+        _PASSWORD_CHECKS[key] = now + PASSWORD_CHECK_TTL
+    return True
+
 def allowed_file(filename):
     """Check if file extension is allowed"""
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    _, dot, ext = filename.rpartition('.')
+    return bool(dot) and ext.lower() in ALLOWED_EXTENSIONS
 
 def generate_draft_name(title, authors):
     """Generate a draft name from title and authors"""
@@ -304,25 +524,26 @@ def generate_draft_name(title, authors):
     author_last = first_author.split()[-1].lower() if first_author else "unknown"
     
     # Create a slug from the title
-    title_slug = re.sub(r'[^a-zA-Z0-9\s-]', '', title.lower())
-    title_slug = re.sub(r'\s+', '-', title_slug.strip())
+    title_slug = _SLUG_STRIP.sub('', title.lower())
+    title_slug = _SLUG_WS.sub('-', title_slug.strip())
     title_slug = title_slug[:30]  # Limit length
     
     return f"draft-{author_last}-{title_slug}"
 
 def require_auth(f):
     """Decorator to require authentication"""
+    @functools.wraps(f)
     def decorated_function(*args, **kwargs):
         if 'user' not in session:
             flash('Please log in to access this page.', 'error')
             return redirect(url_for('login'))
         return f(*args, **kwargs)
-    decorated_function.__name__ = f.__name__
     return decorated_function
 
 def require_role(required_role):
     """Decorator to require a specific role"""
     def decorator(f):
+        @functools.wraps(f)
         def decorated_function(*args, **kwargs):
             if 'user' not in session:
                 flash('Please log in to access this page.', 'error')
@@ -331,36 +552,46 @@ def decorated_function(*args, **kwargs):
             if not current_user or current_user.get('role') != required_role:
                 return "Access denied", 403
             return f(*args, **kwargs)
-        decorated_function.__name__ = f.__name__
         return decorated_function
     return decorator
 
 def get_current_user():
-    """Get current logged in user"""
-    if 'user' in session:
-        user = User.query.filter_by(username=session['user']).first()
-        if user:
-            return {
-                'id': user.id,
-                'username': user.username,
-                'name': user.name,
-                'email': user.email,
-                'role': user.role,
-                'theme': user.theme
-            }
-    return None
+    """Get current logged in user (queried once per request, cached on flask.g)"""
+    username = session.get('user')
+    if not username:
+        return None
+    cached = g.get('current_user')
+    if cached is not None and cached[0] == username:
+        return cached[1]
+    current = None
+    user = User.query.filter_by(username=username).first()
+    if user:
+        current = {
+            'id': user.id,
+            'username': user.username,
+            'name': user.name,
+            'email': user.email,
+            'role': user.role,
+            'theme': user.theme
+        }
+    g.current_user = (username, current)
+    return current
 
-def generate_user_menu():
-    """Generate user menu HTML for navbar"""
-    current_user = get_current_user()
-    if current_user:
-        user_role = current_user.get('role', 'user')
-        is_admin = user_role in ['admin', 'editor'] or current_user['name'] in ['admin', 'Admin User']
-        admin_link = '<li><a class="dropdown-item" href="/admin/">Admin Dashboard</a></li>' if is_admin else ''
-        return f"""
+# Navbar user menus; only the signed-in user's name varies per request
+_USER_MENU_ANON_HTML = """
+        <div class="nav-item">
+            <a class="nav-link" href="/login/">Sign In</a>
+        </div>
+        <div class="nav-item">
+            <a class="nav-link" href="/register/">Register</a>
+        </div>
+        """
+
+def _user_menu_template(admin_link):
+    return string.Template(f"""
         <div class="nav-item dropdown">
             <a class="nav-link dropdown-toggle" href="#" role="button" data-bs-toggle="dropdown" aria-expanded="false">
-                {current_user['name']}
+                $name
             </a>
             <ul class="dropdown-menu">
                 <li><a class="dropdown-item" href="/submit/status/">My Submissions</a></li>
@@ -369,52 +600,84 @@ def generate_user_menu():
                 <li><a class="dropdown-item" href="/logout/">Logout</a></li>
             </ul>
         </div>
-        """
+        """)
+
+_USER_MENU_ADMIN = _user_menu_template('<li><a class="dropdown-item" href="/admin/">Admin Dashboard</a></li>')
+_USER_MENU_USER = _user_menu_template('')
+
+@functools.lru_cache(maxsize=1024)
+def _user_menu_html(is_admin, name):
+    menu = _USER_MENU_ADMIN if is_admin else _USER_MENU_USER
+    return menu.substitute(name=name)
+
+def generate_user_menu():
+    """Generate user menu HTML for navbar (built once per menu kind and name)"""
+    current_user = get_current_user()
+    if current_user:
+        user_role = current_user.get('role', 'user')
+        is_admin = user_role in ('admin', 'editor') or current_user['name'] in ('admin', 'Admin User')
+        return _user_menu_html(is_admin, current_user['name'])
     else:
-        return """
-        <div class="nav-item">
-            <a class="nav-link" href="/login/">Sign In</a>
-        </div>
-        <div class="nav-item">
-            <a class="nav-link" href="/register/">Register</a>
-        </div>
-        """
+        return _USER_MENU_ANON_HTML
+
+# Per-process part of page ETags: versions restart at zero in every process
+_ETAG_SALT = os.urandom(8).hex()
+
+def _page_etag(*versions):
+    """Weak ETag for a page built from versions, for the current viewer's menu and theme"""
+    current_user = get_current_user()
+    viewer = (current_user['name'], current_user['role']) if current_user else None
+    key = repr((_ETAG_SALT, versions, viewer, session.get('theme')))
+    return hashlib.md5(key.encode()).hexdigest()
+
+def _conditional_page(etag, render):
+    """304 if the client already holds etag, otherwise render() tagged with it"""
+    if request.if_none_match.contains_weak(etag):
+        response = make_response('', 304)
+    else:
+        response = make_response(render())
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
 
 def add_to_document_history(draft_name, action, user, details=""):
     """Add an entry to document history"""
-    if draft_name not in DOCUMENT_HISTORY:
-        DOCUMENT_HISTORY[draft_name] = []
+    history = DOCUMENT_HISTORY.get(draft_name)
+    if history is None:
+        history = DOCUMENT_HISTORY[draft_name] = deque(maxlen=DOCUMENT_HISTORY_MAX)
     
     entry = {
         'action': action,
         'user': user,
-        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'timestamp': now_str(),
         'details': details
     }
-    DOCUMENT_HISTORY[draft_name].insert(0, entry)  # Add to beginning (most recent first)
+    history.appendleft(entry)  # Add to beginning (most recent first)
 
 def toggle_comment_like(draft_name, comment_id, user):
     """Toggle like on a comment"""
-    like_key = f"{draft_name}:{comment_id}"
-    if like_key not in COMMENT_LIKES:
-        COMMENT_LIKES[like_key] = set()
+    like_key = (draft_name, comment_id)
+    users = COMMENT_LIKE_USERS.get(like_key)
+    if users is None:
+        users = COMMENT_LIKE_USERS[like_key] = set()
     
-    if user in COMMENT_LIKES[like_key]:
-        COMMENT_LIKES[like_key].remove(user)
+    if user in users:
+        users.remove(user)
+        COMMENT_LIKE_COUNTS[like_key] -= 1
         return False  # Unliked
     else:
-        COMMENT_LIKES[like_key].add(user)
+        users.add(user)
+        COMMENT_LIKE_COUNTS[like_key] = COMMENT_LIKE_COUNTS.get(like_key, 0) + 1
         return True  # Liked
 
 def get_comment_likes(draft_name, comment_id):
     """Get like count for a comment"""
-    like_key = f"{draft_name}:{comment_id}"
-    return len(COMMENT_LIKES.get(like_key, set()))
+    return COMMENT_LIKE_COUNTS.get((draft_name, comment_id), 0)
 
 def is_comment_liked(draft_name, comment_id, user):
     """Check if user has liked a comment"""
-    like_key = f"{draft_name}:{comment_id}"
-    return user in COMMENT_LIKES.get(like_key, set())
+    users = COMMENT_LIKE_USERS.get((draft_name, comment_id))
+    return user in users if users else False
 
 def is_user_following_draft(draft_name, user):
     """Check if a user is following a specific draft"""
@@ -507,6 +770,24 @@ def add_comment_reply(draft_name, parent_comment_id, reply_text, user):
     db.session.commit()
     return reply
 
+@functools.lru_cache(maxsize=1024)
+def _initials(name):
+    """Uppercased first letters of the first two words of name, in one pass
+
+    Memoized: the same few authors appear on most comments of a thread.
+    """
+    first = ''
+    take = True
+    for c in name:
+        if c.isspace():
+            take = True
+        elif take:
+            if first:
+                return first + c.upper()
+            first = c.upper()
+            take = False
+    return first
+
 def build_comment_tree(draft_name):
     """Build a tree structure of comments with nested replies"""
     # Get all comments for this draft (including deleted ones, but mark them)
@@ -518,9 +799,9 @@ def build_comment_tree(draft_name):
         comment_dict[comment.id] = {
             'id': str(comment.id),
             'author': comment.author,
-            'date': comment.timestamp.strftime('%Y-%m-%d %H:%M'),
+            'date': fmt_dt(comment.timestamp, '%Y-%m-%d %H:%M'),
             'comment': comment.text if not comment.is_deleted else '[Deleted]',
-            'avatar': ''.join([word[0].upper() for word in comment.author.split()[:2]]),
+            'avatar': _initials(comment.author),
             'replies': [],
             'timestamp': comment.timestamp,
             'edited_at': comment.edited_at,
@@ -558,23 +839,62 @@ def can_edit_delete_comment(comment, current_user):
         return time_diff <= time_limit
     return False
 
+# One comment card in a thread; filled per comment by render_comment_tree with
+# format_map. Author, initials and text are HTML-escaped before insertion.
+_COMMENT_CARD_HTML = """
+        <div class="card {card_class}" id="comment-{comment_id}">
+            <div class="card-body py-2">
+                <div class="d-flex align-items-center mb-1">
+                    <div class="avatar bg-{avatar_bg} text-white rounded-circle me-2" style="width: {avatar_size}px; height: {avatar_size}px; display: flex; align-items: center; justify-content: center; font-weight: bold; font-size: {small_font_size}px;">
+                        {avatar}
+                    </div>
+                    <div>
+                        <strong style="font-size: {font_size}px;">{author}</strong>
+                        <small class="text-muted ms-2">{date}{edited_text}</small>
+                        {deleted_badge}
+                    </div>
+                </div>
+                <p class="mb-2" style="font-size: {font_size}px; {deleted_style}">{text}</p>
+                <div class="d-flex gap-2 align-items-center">
+                    {like_button}
+                    {reply_button}
+                    {edit_delete_buttons}
+                </div>
+
+                <!-- Reply form (hidden by default) -->
+                <div id="reply-form-{comment_id}" class="mt-3" style="display: none;">
+                    <form method="POST" class="d-flex gap-2">
+                        <input type="hidden" name="action" value="reply">
+                        <input type="hidden" name="parent_comment_id" value="{comment_id}">
+                        <input type="text" name="reply_text" class="form-control" placeholder="Write a reply..." required style="font-size: {font_size}px;">
+                        <button type="submit" class="btn btn-primary btn-sm" style="font-size: {small_font_size}px;">Reply</button>
+                        <button type="button" class="btn btn-secondary btn-sm" onclick="{reply_click}" style="font-size: {small_font_size}px;">Cancel</button>
+                    </form>
+                </div>
+
+                <!-- Nested replies -->
+                {replies}
+            </div>
+        </div>
+        """
+
 def render_comment_tree(comments, draft_name, level=0):
     """Recursively render comments and their nested replies"""
     if not comments:
         return ""
     
     indent_class = f"ms-{level * 4}" if level > 0 else ""
-    html = f'<div class="{indent_class} mt-2">' if level > 0 else '<div class="mt-2">'
+    parts = [f'<div class="{indent_class} mt-2">' if level > 0 else '<div class="mt-2">']
+    current_user = get_current_user()
 
     for comment in comments:
         comment_id = comment.get('id', 'unknown')
         like_count = get_comment_likes(draft_name, comment_id)
-        is_liked = is_comment_liked(draft_name, comment_id, get_current_user()['name']) if get_current_user() else False
-        current_user = get_current_user()
+        is_liked = is_comment_liked(draft_name, comment_id, current_user['name']) if current_user else False
         can_edit_delete = can_edit_delete_comment(comment, current_user)
         is_deleted = comment.get('is_deleted', False)
         edited_at = comment.get('edited_at')
-        edited_text = f" (edited {edited_at.strftime('%Y-%m-%d %H:%M')})" if edited_at else ""
+        edited_text = f" (edited {fmt_dt(edited_at, '%Y-%m-%d %H:%M')})" if edited_at else ""
 
         # Like button styling
         like_btn_class = "btn-outline-danger" if is_liked else "btn-outline-secondary"
@@ -607,46 +927,55 @@ def render_comment_tree(comments, draft_name, level=0):
         deleted_badge = '<small class="text-muted ms-2" style="font-style: italic;">[Deleted]</small>' if is_deleted else ''
         deleted_style = 'opacity: 0.5; font-style: italic;' if is_deleted else ''
 
-        html += f"""
-        <div class="card {card_class}" id="comment-{comment_id}">
-            <div class="card-body py-2">
-                <div class="d-flex align-items-center mb-1">
-                    <div class="avatar bg-{"secondary" if level > 0 else "primary"} text-white rounded-circle me-2" style="width: {avatar_size}px; height: {avatar_size}px; display: flex; align-items: center; justify-content: center; font-weight: bold; font-size: {font_size - 2}px;">
-                        {comment['avatar']}
-                    </div>
-                    <div>
-                        <strong style="font-size: {font_size}px;">{comment['author']}</strong>
-                        <small class="text-muted ms-2">{comment['date']}{edited_text}</small>
-                        {deleted_badge}
-                    </div>
-                </div>
-                <p class="mb-2" style="font-size: {font_size}px; {deleted_style}">{comment['comment']}</p>
-                <div class="d-flex gap-2 align-items-center">
-                    {like_button}
-                    {reply_button}
-                    {edit_delete_buttons}
-                </div>
-
-                <!-- Reply form (hidden by default) -->
-                <div id="reply-form-{comment_id}" class="mt-3" style="display: none;">
-                    <form method="POST" class="d-flex gap-2">
-                        <input type="hidden" name="action" value="reply">
-                        <input type="hidden" name="parent_comment_id" value="{comment_id}">
-                        <input type="text" name="reply_text" class="form-control" placeholder="Write a reply..." required style="font-size: {font_size}px;">
-                        <button type="submit" class="btn btn-primary btn-sm" style="font-size: {font_size - 2}px;">Reply</button>
-                        <button type="button" class="btn btn-secondary btn-sm" onclick="{reply_click}" style="font-size: {font_size - 2}px;">Cancel</button>
-                    </form>
-                </div>
-
-                <!-- Nested replies -->
-                {render_comment_tree(comment.get('replies', []), draft_name, level + 1)}
-            </div>
-        </div>
-        """
-
-    html += '</div>'
-    return html
+        parts.append(_COMMENT_CARD_HTML.format_map({
+            'card_class': card_class,
+            'comment_id': comment_id,
+            'avatar_bg': "secondary" if level > 0 else "primary",
+            'avatar_size': avatar_size,
+            'font_size': font_size,
+            'small_font_size': font_size - 2,
+            'avatar': escape(comment['avatar']),
+            'author': escape(comment['author']),
+            'date': comment['date'],
+            'edited_text': edited_text,
+            'deleted_badge': deleted_badge,
+            'deleted_style': deleted_style,
+            'text': escape(comment['comment']),
+            'like_button': like_button,
+            'reply_button': reply_button,
+            'edit_delete_buttons': edit_delete_buttons,
+            'reply_click': reply_click,
+            'replies': render_comment_tree(comment.get('replies', []), draft_name, level + 1),
+        }))
+
+    parts.append('</div>')
+    return ''.join(parts)
+
+
+GROUP_ALIASES_FILE = '/home/ubuntu/datatracker/test/data/group-aliases'
+
+def _load_cached(path, loader, cache_name):
+    """Return loader()'s result, cached as JSON in INSTANCE_DIR until path or this module changes"""
+    cache = os.path.join(INSTANCE_DIR, cache_name)
+    try:
+        if os.path.getmtime(cache) >= max(os.path.getmtime(path), os.path.getmtime(__file__)):
+            with open(cache, 'r') as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass
+    data = loader()
+    try:
+        tmp = f"{cache}.{os.getpid()}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+    return data
 
+def _stable_hash(name):
+    """Hash of name that, unlike hash(), is the same in every process"""
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=4).digest(), 'little')
 
 # Load MLTF data from test files
 def load_draft_data():
@@ -748,523 +1077,62 @@ def load_group_data():
     }
 
     try:
-        with open('/home/ubuntu/datatracker/test/data/group-aliases', 'r') as f:
-            for line in f:
-                if line.startswith('#') or not line.strip():
-                    continue
-                # Extract group name from the line
-                match = re.search(r'xfilter-([^:]+):', line)
-                if match:
-                    group_name = match.group(1)
-
-                    # Use specific DP description if available, otherwise generate generic one
-                    if group_name in dp_descriptions:
-                        dp_info = dp_descriptions[group_name]
-                        group_title = dp_info['title']
-                        description = dp_info['desc']
-                    else:
-                        # Fallback for non-DP groups
-                        group_title = group_name.replace('-', ' ').title()
-                        description = f'The {group_title} Working Group focuses on {group_title.lower()} standards and protocols for the Internet.'
-
-                    groups.append({
-                        'acronym': group_name,
-                        'name': f'{group_title} Working Group',
-                        'type': 'Working Group',
-                        'state': 'Active',
-                        'chairs': [f'Chair {i+1}' for i in range(1 + (hash(group_name) % 2))],  # 1-2 chairs
-                        'description': description
-                    })
+        # One regex pass over the mapped file; comment lines never match
+        with open(GROUP_ALIASES_FILE, 'rb') as f:
+            if os.fstat(f.fileno()).st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    group_names = [m.group(1).decode() for m in _GROUP_RE.finditer(mm)]
+            else:
+                group_names = []
+
+        for group_name in group_names:
+            # Use specific DP description if available, otherwise generate generic one
+            if group_name in dp_descriptions:
+                dp_info = dp_descriptions[group_name]
+                group_title = dp_info['title']
+                description = dp_info['desc']
+            else:
+                # Fallback for non-DP groups
+                group_title = group_name.replace('-', ' ').title()
+                description = f'The {group_title} Working Group focuses on {group_title.lower()} standards and protocols for the Internet.'
+
+            groups.append({
+                'acronym': group_name,
+                'name': f'{group_title} Working Group',
+                'type': 'Working Group',
+                'state': 'Active',
+                'chairs': [f'Chair {i+1}' for i in range(1 + (_stable_hash(group_name) % 2))],  # 1-2 chairs
+                'description': description
+            })
     except FileNotFoundError:
         print("Group aliases file not found")
     return groups
 
 # Load the data
 DRAFTS = load_draft_data()
-GROUPS = load_group_data()
+# Name lookup for the document pages; the first draft with a name wins
+DRAFTS_BY_NAME = {}
+for _draft in DRAFTS:
+    DRAFTS_BY_NAME.setdefault(_draft['name'], _draft)
+
+def _add_draft(draft):
+    DRAFTS.append(draft)
+    DRAFTS_BY_NAME.setdefault(draft['name'], draft)
+GROUPS = _load_cached(GROUP_ALIASES_FILE, load_group_data, 'group-data.json')
 
 # HTML Templates
 BASE_TEMPLATE = """
 <!DOCTYPE html>
-<html lang="en" data-theme="{theme}">
+<html lang="en" data-theme="{{ theme }}">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
+    <title>{{ title }}</title>
     <link rel="icon" type="image/png" href="/static/images/overweb_logo.png">
     <link rel="shortcut icon" type="image/png" href="/static/images/overweb_logo.png">
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link href="{{ bootstrap_css }}" rel="stylesheet">
     <link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">
-    <style>
-        :root {{
-            /* Light theme (default) */
-            --bg-color: #ffffff;
-            --bg-secondary: #f7f9fa;
-            --bg-tertiary: #e1e8ed;
-            --text-primary: #14171a;
-            --text-secondary: #657786;
-            --text-muted: #aab8c2;
-            --border-color: #e1e8ed;
-            --border-hover: #ccd6dd;
-            --accent-color: #1d9bf0;
-            --accent-hover: #1a8cd8;
-            --success-color: #00ba7c;
-            --warning-color: #f7b529;
-            --error-color: #f4212e;
-            --navbar-bg: #ffffff;
-            --navbar-text: #14171a;
-            --navbar-border: #e1e8ed;
-            --card-bg: #ffffff;
-            --card-border: #e1e8ed;
-            --input-bg: #ffffff;
-            --input-border: #657786;
-            --shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
-            --shadow-hover: 0 2px 8px rgba(0, 0, 0, 0.15);
-        }}
-
-        [data-theme="dark"] {{
-            /* Dark theme */
-            --bg-color: #000000;
-            --bg-secondary: #16181c;
-            --bg-tertiary: #1d1f23;
-            --text-primary: #ffffff;
-            --text-secondary: #8b98a5;
-            --text-muted: #6c7b8a;
-            --border-color: #2f3336;
-            --border-hover: #3d4043;
-            --accent-color: #1d9bf0;
-            --accent-hover: #1a8cd8;
-            --success-color: #00ba7c;
-            --warning-color: #f7b529;
-            --error-color: #f4212e;
-            --navbar-bg: #16181c;
-            --navbar-text: #ffffff;
-            --navbar-border: #2f3336;
-            --card-bg: #16181c;
-            --card-border: #2f3336;
-            --input-bg: #16181c;
-            --input-border: #3d4043;
-            --shadow: 0 1px 3px rgba(0, 0, 0, 0.3);
-            --shadow-hover: 0 2px 8px rgba(0, 0, 0, 0.4);
-        }}
-
-        * {{
-            box-sizing: border-box;
-        }}
-
-        body {{
-            background-color: var(--bg-color);
-            color: var(--text-primary);
-            font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
-            line-height: 1.5;
-            margin: 0;
-            min-height: 100vh;
-            transition: background-color 0.2s ease, color 0.2s ease;
-        }}
-
-        /* Modern navbar similar to X */
-        .navbar {{
-            background-color: var(--navbar-bg) !important;
-            border-bottom: 1px solid var(--navbar-border);
-            backdrop-filter: blur(10px);
-            -webkit-backdrop-filter: blur(10px);
-            box-shadow: var(--shadow);
-            padding: 0;
-            height: 53px;
-            z-index: 2147483646 !important; /* Just below dropdown max */
-            position: relative !important;
-            overflow: visible !important;
-        }}
-
-        .navbar-brand {{
-            color: var(--navbar-text) !important;
-            font-weight: 700;
-            font-size: 18px;
-            padding: 16px 20px;
-            margin: 0;
-            display: flex;
-            align-items: center;
-            gap: 8px;
-        }}
-
-        .navbar-brand:hover {{
-            color: var(--accent-color) !important;
-        }}
-
-        .navbar-brand img {{
-            height: 24px;
-            width: auto;
-            object-fit: contain;
-        }}
-
-        /* White logo for dark mode */
-        [data-theme="dark"] .navbar-brand img {{
-            filter: brightness(0) invert(1);
-        }}
-
-        .navbar-nav {{
-            align-items: center;
-        }}
-
-        .nav-link {{
-            color: var(--text-secondary) !important;
-            font-weight: 500;
-            padding: 16px 20px;
-            margin: 0;
-            border-radius: 0;
-            transition: all 0.2s ease;
-        }}
-
-        .nav-link:hover {{
-            background-color: var(--bg-secondary);
-            color: var(--accent-color) !important;
-        }}
-
-        .nav-link.active {{
-            color: var(--accent-color) !important;
-            border-bottom: 3px solid var(--accent-color);
-            background-color: transparent;
-        }}
-
-        /* Theme toggle button */
-        .theme-toggle {{
-            background: none;
-            border: none;
-            color: var(--text-secondary);
-            font-size: 18px;
-            padding: 16px 20px;
-            cursor: pointer;
-            transition: color 0.2s ease;
-        }}
-
-        .theme-toggle:hover {{
-            color: var(--accent-color);
-        }}
-
-        /* Cards with modern styling */
-        .card {{
-            background-color: var(--card-bg);
-            border: 1px solid var(--card-border);
-            border-radius: 16px;
-            box-shadow: var(--shadow);
-            transition: all 0.2s ease;
-        }}
-
-        .card:hover {{
-            box-shadow: var(--shadow-hover);
-            border-color: var(--border-hover);
-        }}
-
-        .card-header {{
-            background-color: transparent;
-            border-bottom: 1px solid var(--card-border);
-            border-radius: 16px 16px 0 0 !important;
-            padding: 16px 20px;
-            font-weight: 700;
-            color: var(--text-primary);
-        }}
-
-        .card-body {{
-            padding: 20px;
-        }}
-
-        /* Buttons styled like X */
-        .btn {{
-            border-radius: 20px;
-            font-weight: 700;
-            padding: 8px 16px;
-            transition: all 0.2s ease;
-        }}
-
-        .btn-primary {{
-            background-color: var(--accent-color);
-            border-color: var(--accent-color);
-            color: white;
-        }}
-
-        .btn-primary:hover {{
-            background-color: var(--accent-hover);
-            border-color: var(--accent-hover);
-            transform: translateY(-1px);
-        }}
-
-        .btn-outline-primary {{
-            border-color: var(--text-secondary);
-            color: var(--text-primary);
-        }}
-
-        .btn-outline-primary:hover {{
-            background-color: var(--accent-color);
-            border-color: var(--accent-color);
-            color: white;
-        }}
-
-        .btn-outline-secondary {{
-            border-color: var(--border-color);
-            color: var(--text-secondary);
-        }}
-
-        .btn-outline-secondary:hover {{
-            background-color: var(--bg-secondary);
-            border-color: var(--border-hover);
-            color: var(--text-primary);
-        }}
-
-        /* Form inputs */
-        .form-control {{
-            background-color: var(--input-bg) !important;
-            border: 1px solid var(--input-border) !important;
-            border-radius: 8px;
-            color: var(--text-primary) !important;
-            padding: 12px 16px;
-            transition: all 0.2s ease;
-        }}
-
-        input.form-control, textarea.form-control, select.form-control {{
-            color: var(--text-primary) !important;
-            background-color: var(--input-bg) !important;
-            border-color: var(--input-border) !important;
-        }}
-
-        [data-theme="dark"] input,
-        [data-theme="dark"] textarea,
-        [data-theme="dark"] select,
-        [data-theme="dark"] input.form-control,
-        [data-theme="dark"] textarea.form-control,
-        [data-theme="dark"] select.form-control {{
-            color: #ffffff !important;
-            background-color: #16181c !important;
-            border-color: #3d4043 !important;
-        }}
-
-        .form-control:focus {{
-            border-color: var(--accent-color);
-            box-shadow: 0 0 0 3px rgba(29, 155, 240, 0.1);
-            background-color: var(--input-bg);
-        }}
-
-        .form-control::placeholder {{
-            color: var(--text-muted);
-        }}
-
-        .form-select {{
-            background-color: var(--input-bg) !important;
-            border: 1px solid var(--input-border) !important;
-            border-radius: 8px;
-            color: var(--text-primary) !important;
-            padding: 12px 16px;
-            transition: all 0.2s ease;
-        }}
-
-        [data-theme="dark"] .form-select {{
-            color: #ffffff !important;
-            background-color: #16181c !important;
-            border-color: #3d4043 !important;
-        }}
-
-        /* Alerts */
-        .alert {{
-            border-radius: 12px;
-            border: none;
-            padding: 16px 20px;
-        }}
-
-        .alert-info {{
-            background-color: rgba(29, 155, 240, 0.1);
-            color: var(--accent-color);
-        }}
-
-        /* Badges */
-        .badge {{
-            border-radius: 12px;
-            font-weight: 500;
-            padding: 4px 8px;
-        }}
-
-        /* Breadcrumbs */
-        .breadcrumb {{
-            background-color: transparent;
-            padding: 0;
-            margin-bottom: 20px;
-        }}
-
-        .breadcrumb-item a {{
-            color: var(--text-secondary);
-        }}
-
-        .breadcrumb-item.active {{
-            color: var(--text-primary);
-            font-weight: 500;
-        }}
-
-        /* Flash messages */
-        #flash-messages {{
-            position: fixed;
-            top: 70px;
-            right: 20px;
-            z-index: 1000;
-            max-width: 400px;
-        }}
-
-        .flash-message {{
-            margin-bottom: 10px;
-            padding: 12px 16px;
-            border-radius: 12px;
-            font-weight: 500;
-            box-shadow: var(--shadow);
-        }}
-
-        .flash-success {{
-            background-color: rgba(0, 186, 124, 0.1);
-            color: var(--success-color);
-            border: 1px solid rgba(0, 186, 124, 0.2);
-        }}
-
-        .flash-error {{
-            background-color: rgba(244, 33, 46, 0.1);
-            color: var(--error-color);
-            border: 1px solid rgba(244, 33, 46, 0.2);
-        }}
-
-        .flash-info {{
-            background-color: rgba(247, 181, 41, 0.1);
-            color: var(--warning-color);
-            border: 1px solid rgba(247, 181, 41, 0.2);
-        }}
-
-        /* Avatar styling */
-        .avatar {{
-            border-radius: 50%;
-            object-fit: cover;
-        }}
-
-        /* Wider content layout for better readability */
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            padding-left: 24px;
-            padding-right: 24px;
-        }}
-
-        /* Responsive adjustments */
-        @media (max-width: 768px) {{
-            .navbar-brand {{
-                font-size: 16px;
-                padding: 16px 15px;
-            }}
-
-            .nav-link {{
-                padding: 16px 12px;
-                font-size: 14px;
-            }}
-
-            .theme-toggle {{
-                padding: 16px 15px;
-            }}
-
-            .card {{
-                border-radius: 12px;
-            }}
-
-            .card-header {{
-                border-radius: 12px 12px 0 0 !important;
-            }}
-
-            .container {{
-                padding-left: 15px;
-                padding-right: 15px;
-            }}
-        }}
-
-        @media (min-width: 1200px) {{
-            .container {{
-                padding-left: 40px;
-                padding-right: 40px;
-            }}
-        }}
-
-        /* Custom scrollbar */
-        ::-webkit-scrollbar {{
-            width: 8px;
-        }}
-
-        ::-webkit-scrollbar-track {{
-            background: var(--bg-secondary);
-        }}
-
-        ::-webkit-scrollbar-thumb {{
-            background: var(--border-color);
-            border-radius: 4px;
-        }}
-
-        ::-webkit-scrollbar-thumb:hover {{
-            background: var(--border-hover);
-        }}
-
-        /* Dropdown menu z-index fix - maximum priority to ensure it's above everything */
-        .dropdown-menu {{
-            z-index: 2147483647 !important; /* Maximum possible z-index value */
-            border-radius: 12px;
-            border: 1px solid var(--border-color);
-            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
-            background-color: var(--card-bg);
-            margin-top: 8px;
-            overflow: visible !important;
-            position: absolute !important;
-            top: 100% !important;
-            left: 0 !important;
-            min-width: 200px;
-        }}
-
-        /* Ensure dropdown container doesn't clip */
-        .dropdown {{
-            position: relative !important;
-            overflow: visible !important;
-        }}
-
-        /* Prevent any parent from clipping the dropdown */
-        .navbar .dropdown {{
-            overflow: visible !important;
-        }}
-
-        /* Force dropdown to be on top of everything */
-        .navbar .dropdown-menu {{
-            z-index: 2147483647 !important;
-            position: absolute !important;
-            top: 100% !important;
-            left: 0 !important;
-        }}
-
-        .dropdown-item {{
-            color: var(--text-primary);
-            padding: 12px 16px;
-            transition: background-color 0.2s ease;
-        }}
-
-        .dropdown-item:hover {{
-            background-color: var(--bg-secondary);
-            color: var(--accent-color);
-        }}
-
-        .dropdown-toggle {{
-            border: none;
-            background: none;
-            color: var(--text-secondary);
-            font-weight: 500;
-            padding: 16px 12px;
-            border-radius: 8px;
-            transition: all 0.2s ease;
-        }}
-
-        .dropdown-toggle:hover {{
-            background-color: var(--bg-secondary);
-            color: var(--text-primary);
-        }}
-
-        .dropdown-toggle:focus {{
-            box-shadow: 0 0 0 3px rgba(29, 155, 240, 0.1);
-        }}
-    </style>
+    <link href="{{ datatracker_css }}" rel="stylesheet">
 </head>
 <body>
     <nav class="navbar navbar-expand-lg">
@@ -1291,7 +1159,7 @@ def load_group_data():
                 </a>
             </div>
             <div class="navbar-nav ms-auto">
-                {user_menu}
+                {% block user_menu %}{{ user_menu|safe }}{% endblock %}
                 <button class="theme-toggle" id="theme-toggle" title="Toggle theme">
                     <i class="fas fa-moon"></i>
                 </button>
@@ -1300,9 +1168,10 @@ def load_group_data():
     </nav>
 
     <div id="flash-messages"></div>
-    {content}
+    {% block content %}{{ content|safe }}{% endblock %}
 
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js"></script>
+    <script src="{{ bootstrap_js }}"></script>
+    <script src="{{ datatracker_js }}"></script>
     <script>
         // Theme switching functionality
         const themeToggle = document.getElementById('theme-toggle');
@@ -1316,39 +1185,40 @@ def load_group_data():
         html.setAttribute('data-theme', savedTheme);
         updateThemeIcon(savedTheme);
 
-        function updateThemeIcon(theme) {{
-            if (theme === 'dark') {{
+        function updateThemeIcon(theme) {
+            if (theme === 'dark') {
                 icon.className = 'fas fa-sun';
                 themeToggle.title = 'Switch to light mode';
-            }} else {{
+            } else {
                 icon.className = 'fas fa-moon';
                 themeToggle.title = 'Switch to dark mode';
-            }}
-        }}
+            }
+        }
 
-        themeToggle.addEventListener('click', () => {{
+        themeToggle.addEventListener('click', () => {
             const currentTheme = html.getAttribute('data-theme');
             const newTheme = currentTheme === 'dark' ? 'light' : 'dark';
 
             html.setAttribute('data-theme', newTheme);
             localStorage.setItem('theme', newTheme);
             updateThemeIcon(newTheme);
-        }});
+        });
 
         // Flash message auto-hide
-        setTimeout(() => {{
+        setTimeout(() => {
             const flashMessages = document.querySelectorAll('.flash-message');
-            flashMessages.forEach(msg => {{
+            flashMessages.forEach(msg => {
                 msg.style.opacity = '0';
                 setTimeout(() => msg.remove(), 300);
-            }});
-        }}, 5000);
+            });
+        }, 5000);
     </script>
 </body>
 </html>
 """
 
-SUBMIT_TEMPLATE = """
+SUBMIT_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
 <div class="container mt-4">
     <nav aria-label="breadcrumb">
         <ol class="breadcrumb">
@@ -1392,11 +1262,9 @@ def load_group_data():
                             <label for="group" class="form-label">Working Group (Optional)</label>
                             <select class="form-select" id="group" name="group">
                                 <option value="">Select a Working Group</option>
-                                <option value="httpbis">HTTP</option>
-                                <option value="quic">QUIC</option>
-                                <option value="tls">TLS</option>
-                                <option value="dnsop">DNSOP</option>
-                                <option value="rtgwg">RTGWG</option>
+                                {% for group in groups %}
+                                <option value="{{ group.acronym }}">{{ group.name }}</option>
+                                {% endfor %}
                             </select>
                         </div>
                         
@@ -1458,8 +1326,50 @@ def load_group_data():
         </div>
     </div>
 </div>
+{% endblock %}
 """
 
+# Bootstrap is served from static/vendor/ once the files are vendored there,
+# otherwise from the CDN; the URLs are resolved once at import
+def _asset_url(filename, cdn_url):
+    if os.path.exists(os.path.join(app.static_folder, 'vendor', filename)):
+        return f"{app.static_url_path}/vendor/{filename}"
+    return cdn_url
+
+# Our own stylesheet and script are versioned by a hash of their contents, so
+# a URL changes whenever its file does and browsers can cache it indefinitely;
+# _static_versions maps each versioned path to the digest in its page URL
+_static_versions = {}
+
+def _versioned_static_url(filename):
+    with open(os.path.join(app.static_folder, filename), 'rb') as f:
+        digest = hashlib.md5(f.read()).hexdigest()[:12]
+    path = f"{app.static_url_path}/{filename}"
+    _static_versions[path] = digest
+    return f"{path}?v={digest}"
+
+app.jinja_env.globals.update(
+    bootstrap_css=_asset_url('bootstrap-5.1.3.min.css', 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/css/bootstrap.min.css'),
+    bootstrap_js=_asset_url('bootstrap-5.1.3.bundle.min.js', 'https://cdn.jsdelivr.net/npm/bootstrap@5.1.3/dist/js/bootstrap.bundle.min.js'),
+    datatracker_css=_versioned_static_url('css/datatracker.css'),
+    datatracker_js=_versioned_static_url('js/datatracker.js'),
+)
+
+@app.after_request
+def cache_vendored_assets(response):
+    """Vendored and hash-versioned files never change under the same URL"""
+    if response.status_code != 200:
+        return response
+    if request.path in _static_versions:
+        # Only the digest this process links to is known to match the file
+        if request.args.get('v') == _static_versions[request.path]:
+            response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+        else:
+            response.headers['Cache-Control'] = 'no-cache'
+    elif request.path.startswith('/static/vendor/'):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
 @app.before_request
 def deployment_safety_check():
     """Block data modifications during deployment"""
@@ -1478,36 +1388,22 @@ def deployment_safety_check():
 @require_auth
 def submit_draft():
     user_menu = generate_user_menu()
-    current_theme = session.get('theme', get_current_user().get('theme', 'dark') if get_current_user() else 'dark')
-
-    # Generate working group options dynamically
-    group_options = '<option value="">Select a Working Group</option>'
-    for group in GROUPS:
-        group_options += f'<option value="{group["acronym"]}">{group["name"]}</option>'
-
-    # Replace the hardcoded options in the template
-    submit_template = SUBMIT_TEMPLATE.replace(
-        '''<option value="">Select a Working Group</option>
-                                <option value="httpbis">HTTP</option>
-                                <option value="quic">QUIC</option>
-                                <option value="tls">TLS</option>
-                                <option value="dnsop">DNSOP</option>
-                                <option value="rtgwg">RTGWG</option>''',
-        group_options
-    )
+    current_user = get_current_user()
+    current_theme = session.get('theme', current_user.get('theme', 'dark') if current_user else 'dark')
 
     if request.method == 'POST':
         # Handle form submission
-        title = request.form.get('title', '').strip()
-        authors = request.form.get('authors', '').strip()
-        abstract = request.form.get('abstract', '').strip()
-        group = request.form.get('group', '').strip()
+        form = request.form
+        title = form.get('title', '').strip()
+        authors = form.get('authors', '').strip()
+        abstract = form.get('abstract', '').strip()
+        group = form.get('group', '').strip()
         file = request.files.get('file')
 
         # Validation
         if not title or not authors or not file:
             flash('Title, authors, and file are required', 'error')
-            return BASE_TEMPLATE.format(title="Submit Internet-Draft - MLTF", theme=current_theme, user_menu=user_menu, content=submit_template)
+            return render_template('submit.html', title="Submit Internet-Draft - MLTF", theme=current_theme, user_menu=user_menu, groups=GROUPS)
 
         # Process authors (comma-separated)
         authors_list = [a.strip() for a in authors.split(',') if a.strip()]
@@ -1531,21 +1427,22 @@ def submit_draft():
             group=group,
             filename=filename,
             file_path=file_path,
-            submitted_by=get_current_user()['name']
+            submitted_by=current_user['name']
         )
 
         db.session.add(submission)
         db.session.commit()
 
         # Log the action
-        add_to_document_history(f"draft-{submission_id}", "submitted", get_current_user()['name'], f"New draft submitted: {title}")
+        add_to_document_history(f"draft-{submission_id}", "submitted", current_user['name'], f"New draft submitted: {title}")
 
         flash('Draft submitted successfully!', 'success')
         return redirect(f'/submit/status/')
 
-    return BASE_TEMPLATE.format(title="Submit Internet-Draft - MLTF", theme=current_theme, user_menu=user_menu, content=submit_template)
+    return render_template('submit.html', title="Submit Internet-Draft - MLTF", theme=current_theme, user_menu=user_menu, groups=GROUPS)
 
-SUBMISSION_STATUS_TEMPLATE = """
+SUBMISSION_STATUS_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
 <div class="container mt-4">
     <nav aria-label="breadcrumb">
         <ol class="breadcrumb">
@@ -1720,52 +1617,22 @@ def submit_draft():
         </div>
     </div>
 </div>
-
-<style>
-.timeline {
-    position: relative;
-    padding-left: 30px;
-}
-
-.timeline-item {
-    position: relative;
-    margin-bottom: 20px;
-}
-
-.timeline-marker {
-    position: absolute;
-    left: -25px;
-    top: 5px;
-    width: 12px;
-    height: 12px;
-    border-radius: 50%;
-    border: 2px solid #fff;
-    box-shadow: 0 0 0 2px #dee2e6;
-}
-
-.timeline-content h6 {
-    margin-bottom: 5px;
-    font-weight: 600;
-}
-
-.timeline-content p {
-    margin-bottom: 0;
-}
-</style>
+{% endblock %}
 """
 
 @app.route('/submit/status/')
 @require_auth
 def submission_status():
     user_menu = generate_user_menu()
-    current_theme = session.get('theme', get_current_user().get('theme', 'dark') if get_current_user() else 'dark')
+    current_user = get_current_user()
+    current_theme = session.get('theme', current_user.get('theme', 'dark') if current_user else 'dark')
 
     # Get user's submissions
-    user_name = get_current_user()['name']
+    user_name = current_user['name']
     submissions = Submission.query.filter_by(submitted_by=user_name).order_by(Submission.submitted_at.desc()).all()
 
     # Format submissions for template
-    submissions_html = ""
+    parts = []
     for submission in submissions:
         status_badge = {
             'submitted': 'badge bg-warning text-dark',
@@ -1774,7 +1641,7 @@ def submission_status():
             'published': 'badge bg-info'
         }.get(submission.status, 'badge bg-secondary')
 
-        submissions_html += f"""
+        parts.append(f"""
         <div class="submission-item">
             <div class="card mb-3">
                 <div class="card-header d-flex justify-content-between align-items-center">
@@ -1801,7 +1668,8 @@ def submission_status():
                 </div>
             </div>
         </div>
-        """
+        """)
+    submissions_html = "".join(parts)
 
     content = f"""
     <div class="container mt-4">
@@ -1826,14 +1694,14 @@ def submission_status():
     </div>
     """
 
-    return BASE_TEMPLATE.format(title="My Submissions - MLTF", theme=current_theme, user_menu=user_menu, content=content)
+    return render_template('base.html', title="My Submissions - MLTF", theme=current_theme, user_menu=user_menu, content=content)
 
 @app.route('/submit/status/<submission_id>/')
 @require_auth
 def submission_detail(submission_id):
     user_menu = generate_user_menu()
-    current_theme = session.get('theme', get_current_user().get('theme', 'dark') if get_current_user() else 'dark')
     current_user = get_current_user()
+    current_theme = session.get('theme', current_user.get('theme', 'dark') if current_user else 'dark')
 
     submission = Submission.query.filter_by(id=submission_id).first()
     if not submission:
@@ -1897,9 +1765,8 @@ def submission_detail(submission_id):
 
                 if content.strip():
                     # Clean up the text (remove excessive whitespace)
-                    import re
-                    content = re.sub(r'\n+', '\n', content)  # Remove multiple newlines
-                    content = re.sub(r' +', ' ', content)    # Remove multiple spaces
+                    content = _MULTI_NL.sub('\n', content)  # Remove multiple newlines
+                    content = _MULTI_SPACE.sub(' ', content)  # Remove multiple spaces
 
                     # Limit preview to first 2000 characters
                     if len(content) > 2000:
@@ -1926,7 +1793,6 @@ def submission_detail(submission_id):
             file_size_kb = file_size / 1024
             file_content = f"Error extracting text from {ext[1:].upper()} file ({file_size_kb:.1f} KB): {str(e)}"
 
-    # Use Flask's Jinja2 render_template_string properly - BEST PRACTICE
     # Prepare template variables
     template_vars = {
         'submission': submission,
@@ -1951,14 +1817,16 @@ def submission_detail(submission_id):
         'is_submitted': submission.status == 'submitted'
     }
     
-    # Render the submission status template using Flask's Jinja2 engine
-    # This properly handles all conditionals and preserves HTML structure
-    rendered_content = render_template_string(SUBMISSION_STATUS_TEMPLATE, **template_vars)
-    
-    # Now use the rendered content in BASE_TEMPLATE (which uses Python .format())
-    return BASE_TEMPLATE.format(title=f"Submission {submission.id} - MLTF", theme=current_theme, user_menu=user_menu, content=rendered_content)
+    # submission_status.html extends base.html, so page and shell render in one pass
+    return render_template('submission_status.html', title=f"Submission {submission.id} - MLTF", theme=current_theme, user_menu=user_menu, **template_vars)
 
-LOGIN_TEMPLATE = """
+LOGIN_TEMPLATE = """{% extends "base.html" %}
+{% block user_menu %}
+    <div class="nav-item">
+        <a class="nav-link" href="/register/">Register</a>
+    </div>
+    {% endblock %}
+{% block content %}
 <div class="container mt-4">
     <div class="row justify-content-center">
         <div class="col-md-6">
@@ -1992,9 +1860,16 @@ def submission_detail(submission_id):
         </div>
     </div>
 </div>
+{% endblock %}
 """
 
-REGISTER_TEMPLATE = """
+REGISTER_TEMPLATE = """{% extends "base.html" %}
+{% block user_menu %}
+    <div class="nav-item">
+        <a class="nav-link" href="/login/">Sign In</a>
+    </div>
+    {% endblock %}
+{% block content %}
 <div class="container mt-4">
     <div class="row justify-content-center">
         <div class="col-md-6">
@@ -2036,9 +1911,11 @@ def submission_detail(submission_id):
         </div>
     </div>
 </div>
+{% endblock %}
 """
 
-PROFILE_TEMPLATE = """
+PROFILE_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
 <div class="container mt-4">
     <div class="row">
         <div class="col-md-8">
@@ -2055,15 +1932,15 @@ def submission_detail(submission_id):
                         <input type="hidden" name="action" value="update_profile">
                         <div class="mb-3">
                             <label for="name" class="form-label">Full Name</label>
-                            <input type="text" class="form-control" id="name" name="name" value="{current_user_name}" required>
+                            <input type="text" class="form-control" id="name" name="name" value="{{ current_user_name }}" required>
                         </div>
                         <div class="mb-3">
                             <label for="email" class="form-label">Email</label>
-                            <input type="email" class="form-control" id="email" name="email" value="{current_user_email}" required>
+                            <input type="email" class="form-control" id="email" name="email" value="{{ current_user_email }}" required>
                         </div>
                         <div class="mb-3">
                             <label class="form-label">Username</label>
-                            <input type="text" class="form-control" value="{session_user}" readonly>
+                            <input type="text" class="form-control" value="{{ session_user }}" readonly>
                         </div>
                         <button type="submit" class="btn btn-primary">Update Profile</button>
                     </form>
@@ -2094,9 +1971,9 @@ def submission_detail(submission_id):
                         <div class="mb-3">
                             <label class="form-label">Preferred Theme</label>
                             <select class="form-select" name="theme" id="theme-select">
-                                <option value="light" {light_selected}>Light Mode</option>
-                                <option value="dark" {dark_selected}>Dark Mode</option>
-                                <option value="auto" {auto_selected}>Auto (System)</option>
+                                <option value="light" {{ light_selected }}>Light Mode</option>
+                                <option value="dark" {{ dark_selected }}>Dark Mode</option>
+                                <option value="auto" {{ auto_selected }}>Auto (System)</option>
                             </select>
                             <div class="form-text">Choose your preferred theme. Auto will follow your system's preference.</div>
                         </div>
@@ -2112,27 +1989,594 @@ def submission_detail(submission_id):
                     <h5>Account Status</h5>
                 </div>
                 <div class="card-body">
-                    <p><strong>Username:</strong> {session_user}</p>
-                    <p><strong>Name:</strong> {current_user_name}</p>
-                    <p><strong>Email:</strong> {current_user_email}</p>
+                    <p><strong>Username:</strong> {{ session_user }}</p>
+                    <p><strong>Name:</strong> {{ current_user_name }}</p>
+                    <p><strong>Email:</strong> {{ current_user_email }}</p>
                     <p><strong>Status:</strong> <span class="badge bg-success">Active</span></p>
                 </div>
             </div>
         </div>
     </div>
 </div>
+{% endblock %}
 """
 
+ADMIN_DASHBOARD_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <!-- Alerts Section -->
+    <div id="admin-alerts" class="mb-4">
+        {% if pending_submissions > 0 %}
+        <div class="alert alert-warning alert-dismissible fade show" role="alert">
+            <i class="fas fa-exclamation-triangle me-2"></i>
+            <strong>{{ pending_submissions }}</strong> draft submission(s) pending review
+            <a href="/admin/submissions/" class="alert-link">Review now</a>
+            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+        </div>
+        {% endif %}
+        {% if pending_chairs > 0 %}
+        <div class="alert alert-info alert-dismissible fade show" role="alert">
+            <i class="fas fa-users me-2"></i>
+            <strong>{{ pending_chairs }}</strong> working group chair(s) pending approval
+            <a href="/group/" class="alert-link">Manage chairs</a>
+            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
+        </div>
+        {% endif %}
+    </div>
+
+    <div class="row">
+        <div class="col-12">
+            <div class="d-flex justify-content-between align-items-center mb-4">
+                <h1>Admin Dashboard</h1>
+                <div>
+                    <a href="/admin/users/" class="btn btn-outline-primary me-2">Manage Users</a>
+                    <a href="/admin/chairs/" class="btn btn-outline-warning me-2">Manage Chairs</a>
+                    <a href="/admin/submissions/" class="btn btn-outline-success">Review Submissions</a>
+                </div>
+            </div>
+
+            <!-- Statistics Cards -->
+            <div class="row mb-4">
+                <div class="col-md-2">
+                    <div class="card h-100">
+                        <div class="card-body text-center">
+                            <h4 class="text-primary mb-1">{{ total_users }}</h4>
+                            <p class="mb-0 small">Total Users</p>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-2">
+                    <div class="card h-100">
+                        <div class="card-body text-center">
+                            <h4 class="text-success mb-1">{{ total_groups }}</h4>
+                            <p class="mb-0 small">Working Groups</p>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-2">
+                    <div class="card h-100">
+                        <div class="card-body text-center">
+                            <h4 class="text-warning mb-1">{{ total_submissions }}</h4>
+                            <p class="mb-0 small">Total Submissions</p>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-2">
+                    <div class="card h-100">
+                        <div class="card-body text-center">
+                            <h4 class="text-info mb-1">{{ approved_drafts }}</h4>
+                            <p class="mb-0 small">Published Drafts</p>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-2">
+                    <div class="card h-100">
+                        <div class="card-body text-center">
+                            <h4 class="text-danger mb-1">{{ pending_submissions }}</h4>
+                            <p class="mb-0 small">Pending Review</p>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-2">
+                    <div class="card h-100">
+                        <div class="card-body text-center">
+                            <h4 class="text-secondary mb-1">{{ pending_chairs }}</h4>
+                            <p class="mb-0 small">Pending Chairs</p>
+                        </div>
+                    </div>
+                </div>
+            </div>
+
+            <div class="row">
+                <!-- Recent Activity -->
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header d-flex justify-content-between align-items-center">
+                            <h5 class="mb-0">Recent Activity</h5>
+                            <span class="badge bg-primary">Live</span>
+                        </div>
+                        <div class="card-body">
+                            {% for submission in recent_submissions %}
+                            <div class="activity-item mb-2">
+                                <small class="text-muted">
+                                    <i class="fas fa-file-alt me-1"></i>
+                                    New submission: <strong>{{ submission.title[:50] }}...</strong>
+                                    by {{ submission.submitted_by }}
+                                    <span class="float-end">{{ submission.submitted_at.strftime('%m/%d %H:%M') }}</span>
+                                </small>
+                            </div>
+                            {% endfor %}
+                            {% for user in recent_users %}
+                            <div class="activity-item mb-2">
+                                <small class="text-muted">
+                                    <i class="fas fa-user-plus me-1"></i>
+                                    New user: <strong>{{ user.name }}</strong> ({{ user.email }})
+                                    <span class="float-end">{{ user.created_at.strftime('%m/%d %H:%M') }}</span>
+                                </small>
+                            </div>
+                            {% endfor %}
+                            <hr>
+                            <a href="/admin/activity/" class="btn btn-sm btn-outline-primary">View All Activity</a>
+                        </div>
+                    </div>
+                </div>
+
+                <!-- Quick Actions -->
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>Quick Actions</h5>
+                        </div>
+                        <div class="card-body">
+                            <div class="d-grid gap-2">
+                                <a href="/admin/submissions/" class="btn btn-success">
+                                    <i class="fas fa-check-circle me-2"></i>Review Submissions ({{ pending_submissions }} pending)
+                                </a>
+                                <a href="/admin/users/" class="btn btn-primary">
+                                    <i class="fas fa-users me-2"></i>Manage Users ({{ total_users }} total)
+                                </a>
+                                <a href="/group/" class="btn btn-info">
+                                    <i class="fas fa-users-cog me-2"></i>Manage Working Groups ({{ pending_chairs }} pending chairs)
+                                </a>
+                                <a href="/admin/analytics/" class="btn btn-secondary">
+                                    <i class="fas fa-chart-bar me-2"></i>View Analytics
+                                </a>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+
+            <!-- Content Management Section -->
+            <div class="row mt-4">
+                <div class="col-12">
+                    <h3 class="mb-3">Content Management</h3>
+                </div>
+            </div>
+
+            <div class="row">
+                <!-- Most Active Drafts -->
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>Recent Draft Submissions</h5>
+                        </div>
+                        <div class="card-body">
+                            <div class="list-group list-group-flush">
+                                {% for draft in active_drafts %}
+                                <a href="/doc/draft/{{ draft.id }}/" class="list-group-item list-group-item-action d-flex justify-content-between align-items-center">
+                                    <div>
+                                        <strong>{{ draft.title[:40] }}...</strong>
+                                        <br><small class="text-muted">by {{ draft.submitted_by }} • {{ draft.submitted_at.strftime('%m/%d') }}</small>
+                                    </div>
+                                    <span class="badge bg-{{ 'warning' if draft.status == 'submitted' else 'success' }}">{{ draft.status }}</span>
+                                </a>
+                                {% endfor %}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+
+                <!-- Active Users -->
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>Recent User Activity</h5>
+                        </div>
+                        <div class="card-body">
+                            <div class="list-group list-group-flush">
+                                {% for user in active_users %}
+                                <div class="list-group-item d-flex justify-content-between align-items-center">
+                                    <div>
+                                        <strong>{{ user.name }}</strong>
+                                        <br><small class="text-muted">{{ user.email }} • {{ user.role }}</small>
+                                    </div>
+                                    <small class="text-muted">
+                                        {{ user.last_login.strftime('%m/%d %H:%M') if user.last_login else 'Never logged in' }}
+                                    </small>
+                                </div>
+                                {% endfor %}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+</div>
+{% endblock %}
+"""
+
+ADMIN_CHAIRS_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <nav aria-label="breadcrumb">
+        <ol class="breadcrumb">
+            <li class="breadcrumb-item"><a href="/admin/">Admin Dashboard</a></li>
+            <li class="breadcrumb-item active">Chair Management</li>
+        </ol>
+    </nav>
+
+    <div class="d-flex justify-content-between align-items-center mb-4">
+        <div>
+            <h1 class="mb-1">Chair Management</h1>
+            <p class="text-muted mb-0">Manage working group chairs across all groups</p>
+        </div>
+        <a href="/admin/chairs/add" class="btn btn-primary">
+            <i class="fas fa-plus me-2"></i>Add New Chair
+        </a>
+    </div>
+
+    <!-- Statistics Cards -->
+    <div class="row mb-4">
+        <div class="col-md-4">
+            <div class="card text-center">
+                <div class="card-body">
+                    <h4 class="text-primary">{{ total_chairs }}</h4>
+                    <small class="text-muted">Total Chairs</small>
+                </div>
+            </div>
+        </div>
+        <div class="col-md-4">
+            <div class="card text-center">
+                <div class="card-body">
+                    <h4 class="text-success">{{ approved_chairs }}</h4>
+                    <small class="text-muted">Active Chairs</small>
+                </div>
+            </div>
+        </div>
+        <div class="col-md-4">
+            <div class="card text-center">
+                <div class="card-body">
+                    <h4 class="text-warning">{{ pending_chairs }}</h4>
+                    <small class="text-muted">Pending Approval</small>
+                </div>
+            </div>
+        </div>
+    </div>
+
+    <!-- Chairs Table -->
+    <div class="card">
+        <div class="card-header">
+            <h5 class="mb-0">Working Group Chairs</h5>
+        </div>
+        <div class="card-body p-0">
+            <div class="table-responsive">
+                <table class="table table-hover mb-0">
+                    <thead class="table-light">
+                        <tr>
+                            <th>Name</th>
+                            <th>Email</th>
+                            <th>Group</th>
+                            <th>Status</th>
+                            <th>Added</th>
+                            <th>Actions</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {% if chair_rows %}
+                        {{ chair_rows|safe }}
+                        {% else %}
+                        <tr><td colspan="6" class="text-center text-muted py-4">No chairs found. <a href="/admin/chairs/add">Add the first chair</a>.</td></tr>
+                        {% endif %}
+                    </tbody>
+                </table>
+            </div>
+        </div>
+    </div>
+</div>
+{% endblock %}
+"""
+
+ADMIN_CHAIR_ADD_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <nav aria-label="breadcrumb">
+        <ol class="breadcrumb">
+            <li class="breadcrumb-item"><a href="/admin/">Admin Dashboard</a></li>
+            <li class="breadcrumb-item"><a href="/admin/chairs/">Chair Management</a></li>
+            <li class="breadcrumb-item active">Add Chair</li>
+        </ol>
+    </nav>
+
+    <div class="row justify-content-center">
+        <div class="col-md-6">
+            <div class="card">
+                <div class="card-header">
+                    <h5 class="mb-0">Add New Chair</h5>
+                </div>
+                <div class="card-body">
+                    <form method="POST">
+                        <div class="mb-3">
+                            <label for="chair_name" class="form-label">Chair Name *</label>
+                            <input type="text" class="form-control" id="chair_name" name="chair_name" required>
+                        </div>
+                        <div class="mb-3">
+                            <label for="chair_email" class="form-label">Email</label>
+                            <input type="email" class="form-control" id="chair_email" name="chair_email">
+                        </div>
+                        <div class="mb-3">
+                            <label for="group_acronym" class="form-label">Working Group *</label>
+                            <input type="text" class="form-control" id="group_acronym" name="group_acronym" required>
+                        </div>
+                        <div class="mb-3">
+                            <div class="form-check">
+                                <input class="form-check-input" type="checkbox" id="approved" name="approved">
+                                <label class="form-check-label" for="approved">
+                                    Approved (Active Chair)
+                                </label>
+                            </div>
+                        </div>
+                        <div class="d-flex gap-2">
+                            <button type="submit" class="btn btn-primary">Add Chair</button>
+                            <a href="/admin/chairs/" class="btn btn-secondary">Cancel</a>
+                        </div>
+                    </form>
+                </div>
+            </div>
+        </div>
+    </div>
+</div>
+{% endblock %}
+"""
+
+HOME_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <div class="row">
+        <div class="col-md-8">
+            <p class="lead">Welcome to the Governance Hub for the Meta-Layer Task Force!</p>
+
+            <div class="row">
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>Recent Documents</h5>
+                        </div>
+                        <div class="card-body">
+                            <p>View the latest MLTF documents including drafts, RFCs, and other standards.</p>
+                            <a href="/doc/all/" class="btn btn-primary">View All Documents</a>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>Working Groups</h5>
+                        </div>
+                        <div class="card-body">
+                            <p>Browse MLTF working groups and their activities.</p>
+                            <a href="/group/" class="btn btn-primary">View Working Groups</a>
+                        </div>
+                    </div>
+                </div>
+            </div>
+            
+            <div class="row mt-4">
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>Meetings</h5>
+                        </div>
+                        <div class="card-body">
+                            <p>Information about MLTF meetings and sessions.</p>
+                            <a href="/meeting/" class="btn btn-primary">View Meetings</a>
+                        </div>
+                    </div>
+                </div>
+                <div class="col-md-6">
+                    <div class="card">
+                        <div class="card-header">
+                            <h5>People</h5>
+                        </div>
+                        <div class="card-body">
+                            <p>Directory of MLTF participants and contributors.</p>
+                            <a href="/person/" class="btn btn-primary">View People</a>
+                        </div>
+                    </div>
+                </div>
+            </div>
+        </div>
+        <div class="col-md-4">
+            <div class="card">
+                <div class="card-header">
+                    <h5>Quick Stats</h5>
+                </div>
+                <div class="card-body">
+                    <p><strong>Documents:</strong> {{ doc_count }}</p>
+                    <p><strong>Working Groups:</strong> {{ group_count }}</p>
+                    <p><strong>Last Updated:</strong> {{ updated }}</p>
+                </div>
+            </div>
+        </div>
+    </div>
+</div>
+{% endblock %}
+"""
+
+DOCUMENTS_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <h1>All Documents</h1>
+    <p>Showing {{ doc_count }} documents</p>
+    
+    <div class="row">
+        {% for card in doc_cards %}{{ card|safe }}{% endfor %}
+    </div>
+</div>
+{% endblock %}
+"""
+
+GROUPS_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <div class="row">
+        <div class="col-12">
+            <h1 class="mb-4">Working Groups</h1>
+            <p class="lead mb-4">Browse the Meta-Layer Desirable Properties working groups.</p>
+
+            <div class="row">
+                {{ groups_html|safe }}
+            </div>
+        </div>
+    </div>
+</div>
+{% endblock %}
+"""
+
+DRAFT_DETAIL_TEMPLATE = """{% extends "base.html" %}
+{% block content %}
+<div class="container mt-4">
+    <h1>{{ display_id }}</h1>
+    <p class="lead">{{ draft.title }}</p>
+
+    <div class="row">
+        <div class="col-md-8">
+            <div class="card">
+                <div class="card-header">
+                    <h5>Document Information</h5>
+                </div>
+                <div class="card-body">
+                    <table class="table" style="color: var(--text-primary) !important;">
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>ID:</strong></td><td style="color: var(--text-primary) !important;">{{ display_id }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Title:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.title }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Revision:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.rev }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Status:</strong></td><td style="color: var(--text-primary) !important;"><span class="badge bg-secondary">{{ draft.status }}</span></td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Pages:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.pages }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Words:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.words }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Authors:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.authors|join(', ') }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Group:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.group or 'N/A' }}</td></tr>
+                        <tr><td style="color: var(--text-secondary) !important;"><strong>Date:</strong></td><td style="color: var(--text-primary) !important;">{{ draft.date }}</td></tr>
+                    </table>
+                </div>
+            </div>
+            
+            <div class="card mt-3">
+                <div class="card-header">
+                    <h5>Abstract</h5>
+                </div>
+                <div class="card-body">
+                    <p>{{ draft.get('abstract', 'Abstract not available for this draft.') }}</p>
+                </div>
+            </div>
+
+            <!-- Full Document Content -->
+            <div class="card mt-3">
+                <div class="card-header d-flex justify-content-between align-items-center">
+                    <h5 class="mb-0">Document Content</h5>
+                    <div>
+                        <a href="/download/{{ draft.name }}" class="btn btn-sm btn-outline-primary" target="_blank">
+                            <i class="fas fa-download me-1"></i>Download
+                        </a>
+                        <a href="/doc/draft/{{ draft.name }}.txt" class="btn btn-sm btn-outline-secondary" target="_blank">
+                            <i class="fas fa-external-link-alt me-1"></i>View TXT
+                        </a>
+                    </div>
+                </div>
+                <div class="card-body">
+                    <div class="document-content" style="font-family: 'Courier New', monospace; font-size: 0.9em; line-height: 1.4; white-space: pre-wrap; background-color: var(--input-bg) !important; color: var(--text-primary) !important; padding: 20px; border-radius: 8px; max-height: 800px; overflow-y: auto; border: 1px solid var(--input-border);">
+{{ document_content }}
+                    </div>
+                </div>
+            </div>
+        </div>
+        
+        <div class="col-md-4">
+            <div class="card">
+                <div class="card-header">
+                    <h5>Actions</h5>
+                </div>
+                <div class="card-body">
+                    <a href="/doc/draft/{{ draft.name }}/comments/" class="btn btn-primary w-100 mb-2">View Comments ({{ comment_count }})</a>
+                    <a href="/doc/draft/{{ draft.name }}/history/" class="btn btn-secondary w-100 mb-2">View History</a>
+                    <a href="/doc/draft/{{ draft.name }}/revisions/" class="btn btn-info w-100 mb-2">View Revisions</a>
+                    <a href="/download/{{ draft.name }}" class="btn btn-outline-primary w-100 mb-2">Download Document</a>
+                    {% if is_following %}
+                    <form method="post" action="/doc/draft/{{ draft.name }}/unfollow/" style="display: inline;" class="mb-2"><button type="submit" class="btn btn-warning w-100"><i class="fas fa-bell-slash me-1"></i>Unfollow Document</button></form>
+                    {{ notification_controls|safe }}
+                    {% elif signed_in %}
+                    <form method="post" action="/doc/draft/{{ draft.name }}/follow/" style="display: inline;" class="mb-2"><select name="notification_level" class="form-select form-select-sm mb-1"><option value="all">All changes &amp; comments</option><option value="significant">Significant changes only</option><option value="major">Major changes only</option><option value="comments">Comments only</option><option value="none">No notifications</option></select><button type="submit" class="btn btn-success w-100"><i class="fas fa-bell me-1"></i>Follow Document</button></form>
+                    {% endif %}
+                                        </div>
+            </div>
+            
+            <div class="card mt-3">
+                <div class="card-header">
+                    <h5>Quick Comment</h5>
+                </div>
+                <div class="card-body">
+                    <form method="POST" action="/doc/draft/{{ draft.name }}/comments/">
+                        <div class="mb-3">
+                            <textarea class="form-control" name="comment" rows="3" placeholder="Add a quick comment..." required></textarea>
+                </div>
+                        <button type="submit" class="btn btn-success btn-sm w-100">Post Comment</button>
+                    </form>
+    </div>
+</div>
+
+            <div class="card mt-3">
+                <div class="card-header">
+                    <h5>Related Documents</h5>
+                </div>
+            <div class="card-body">
+                    <p>Related documents would appear here in the real datatracker.</p>
+                </div>
+                </div>
+            </div>
+        </div>
+    </div>
+{% endblock %}
+"""
+
+# Page templates served through render_template; the pages extend base.html,
+# so Jinja compiles each of them (and the shared shell) once
+app.jinja_loader = DictLoader({
+    'base.html': BASE_TEMPLATE,
+    'submit.html': SUBMIT_TEMPLATE,
+    'submission_status.html': SUBMISSION_STATUS_TEMPLATE,
+    'login.html': LOGIN_TEMPLATE,
+    'register.html': REGISTER_TEMPLATE,
+    'profile.html': PROFILE_TEMPLATE,
+    'admin_dashboard.html': ADMIN_DASHBOARD_TEMPLATE,
+    'admin_chairs.html': ADMIN_CHAIRS_TEMPLATE,
+    'admin_chair_add.html': ADMIN_CHAIR_ADD_TEMPLATE,
+    'home.html': HOME_TEMPLATE,
+    'documents.html': DOCUMENTS_TEMPLATE,
+    'groups.html': GROUPS_TEMPLATE,
+    'draft_detail.html': DRAFT_DETAIL_TEMPLATE,
+})
+
 # Authentication routes
 @app.route('/login/', methods=['GET', 'POST'])
 def login():
     """User login"""
     if request.method == 'POST':
-        username = request.form.get('username', '').strip()
-        password = request.form.get('password', '').strip()
+        form = request.form
+        username = form.get('username', '').strip()
+        password = form.get('password', '').strip()
         
         user = User.query.filter_by(username=username).first()
-        if user and check_password_hash(user.password_hash, password):
+        if user and verify_password(user.password_hash, password):
             session['user'] = username
             # Set user's preferred theme in session
             session['theme'] = user.theme
@@ -2142,15 +2586,13 @@ def login():
             flash(f'Welcome back, {user.name}!', 'success')
             return redirect(url_for('home'))
         else:
+            if user is None:
+                # Same KDF cost for unknown usernames, so response time doesn't
+                # reveal which accounts exist
+                check_password_hash(_dummy_password_hash(), password)
             flash('Invalid username or password.', 'error')
     
-    # Generate user menu for login page
-    user_menu = """
-    <div class="nav-item">
-        <a class="nav-link" href="/register/">Register</a>
-    </div>
-    """
-    return render_template_string(BASE_TEMPLATE.format(title="Login - MLTF", theme="light", user_menu=user_menu, content=LOGIN_TEMPLATE))
+    return render_template('login.html', title="Login - MLTF", theme="light")
 
 @app.route('/logout/')
 def logout():
@@ -2163,10 +2605,11 @@ def logout():
 def register():
     """User registration"""
     if request.method == 'POST':
-        username = request.form.get('username', '').strip()
-        password = request.form.get('password', '').strip()
-        name = request.form.get('name', '').strip()
-        email = request.form.get('email', '').strip()
+        form = request.form
+        username = form.get('username', '').strip()
+        password = form.get('password', '').strip()
+        name = form.get('name', '').strip()
+        email = form.get('email', '').strip()
         
         # Check if username or email already exists
         existing_user = User.query.filter((User.username == username) | (User.email == email)).first()
@@ -2194,13 +2637,7 @@ def register():
             flash(f'Account created successfully! Welcome, {name}!', 'success')
             return redirect(url_for('home'))
     
-    # Generate user menu for register page
-    user_menu = """
-    <div class="nav-item">
-        <a class="nav-link" href="/login/">Sign In</a>
-    </div>
-    """
-    return render_template_string(BASE_TEMPLATE.format(title="Register - MLTF", theme="light", user_menu=user_menu, content=REGISTER_TEMPLATE))
+    return render_template('register.html', title="Register - MLTF", theme="light")
 
 @app.route('/profile/', methods=['GET', 'POST'])
 @require_auth
@@ -2209,14 +2646,15 @@ def profile():
     current_user = get_current_user()
     
     if request.method == 'POST':
-        action = request.form.get('action')
+        form = request.form
+        action = form.get('action')
         user = User.query.filter_by(username=session['user']).first()
 
         if action == 'update_password':
-            old_password = request.form.get('old_password', '').strip()
-            new_password = request.form.get('new_password', '').strip()
+            old_password = form.get('old_password', '').strip()
+            new_password = form.get('new_password', '').strip()
             
-            if check_password_hash(user.password_hash, old_password):
+            if verify_password(user.password_hash, old_password):
                 if len(new_password) >= 6:
                     user.password_hash = generate_password_hash(new_password)
                     db.session.commit()
@@ -2227,8 +2665,8 @@ def profile():
                 flash('Current password is incorrect.', 'error')
         
         elif action == 'update_profile':
-            name = request.form.get('name', '').strip()
-            email = request.form.get('email', '').strip()
+            name = form.get('name', '').strip()
+            email = form.get('email', '').strip()
             
             # Check if email is already taken by another user
             existing_email = User.query.filter(User.email == email, User.username != session['user']).first()
@@ -2243,283 +2681,96 @@ def profile():
                 flash('Profile updated successfully!', 'success')
 
         elif action == 'update_theme':
-            theme = request.form.get('theme', 'dark').strip()
-            if theme in ['light', 'dark', 'auto']:
-                user.theme = theme
-                db.session.commit()
-                session['theme'] = theme  # Update session immediately
-                flash('Theme preference updated successfully!', 'success')
-            else:
-                flash('Invalid theme selection.', 'error')
-    
-    # Generate user menu
-    user_menu = generate_user_menu()
-    
-    current_theme = current_user.get('theme', 'dark')
-    light_selected = 'selected' if current_theme == 'light' else ''
-    dark_selected = 'selected' if current_theme == 'dark' else ''
-    auto_selected = 'selected' if current_theme == 'auto' else ''
-    
-    profile_content = PROFILE_TEMPLATE.format(
-        current_user_name=current_user['name'],
-        current_user_email=current_user['email'],
-        current_user_theme=current_theme,
-        light_selected=light_selected,
-        dark_selected=dark_selected,
-        auto_selected=auto_selected,
-        session_user=session['user']
-    )
-    return render_template_string(BASE_TEMPLATE.format(title="Profile - MLTF", theme=current_theme, user_menu=user_menu, content=profile_content))
-
-@app.route('/admin/')
-@require_role('admin')
-def admin_dashboard():
-    user_menu = generate_user_menu()
-
-    # Enhanced admin statistics
-    total_users = User.query.count()
-    total_groups = len(GROUPS)
-    total_submissions = Submission.query.count()
-    approved_drafts = PublishedDraft.query.count()
-    pending_chairs = WorkingGroupChair.query.filter_by(approved=False).count()
-
-    # Recent activity and alerts
-    pending_submissions = Submission.query.filter_by(status='submitted').count()
-    recent_submissions = Submission.query.order_by(Submission.submitted_at.desc()).limit(5).all()
-    recent_users = User.query.order_by(User.created_at.desc()).limit(5).all()
-
-    # Get most active drafts (by comment count or views if we had them)
-    # For now, just show recent submissions as proxy
-    active_drafts = Submission.query.order_by(Submission.submitted_at.desc()).limit(10).all()
-
-    # Most active users (by login frequency - simplified)
-    active_users = User.query.order_by(User.last_login.desc()).limit(10).all()
-
-    # Build recent activity feed
-    activity_html = ""
-    for submission in recent_submissions[:3]:  # Show last 3 submissions
-        activity_html += f"""
-        <div class="activity-item mb-2">
-            <small class="text-muted">
-                <i class="fas fa-file-alt me-1"></i>
-                New submission: <strong>{submission.title[:50]}...</strong>
-                by {submission.submitted_by}
-                <span class="float-end">{submission.submitted_at.strftime('%m/%d %H:%M')}</span>
-            </small>
-        </div>
-        """
-
-    for user in recent_users[:2]:  # Show last 2 new users
-        activity_html += f"""
-        <div class="activity-item mb-2">
-            <small class="text-muted">
-                <i class="fas fa-user-plus me-1"></i>
-                New user: <strong>{user.name}</strong> ({user.email})
-                <span class="float-end">{user.created_at.strftime('%m/%d %H:%M')}</span>
-            </small>
-        </div>
-        """
-
-    # Build alerts section
-    alerts_html = ""
-    if pending_submissions > 0:
-        alerts_html += f"""
-        <div class="alert alert-warning alert-dismissible fade show" role="alert">
-            <i class="fas fa-exclamation-triangle me-2"></i>
-            <strong>{pending_submissions}</strong> draft submission(s) pending review
-            <a href="/admin/submissions/" class="alert-link">Review now</a>
-            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-        </div>
-        """
-
-    if pending_chairs > 0:
-        alerts_html += f"""
-        <div class="alert alert-info alert-dismissible fade show" role="alert">
-            <i class="fas fa-users me-2"></i>
-            <strong>{pending_chairs}</strong> working group chair(s) pending approval
-            <a href="/group/" class="alert-link">Manage chairs</a>
-            <button type="button" class="btn-close" data-bs-dismiss="alert"></button>
-        </div>
-        """
-
-    content = f"""
-    <div class="container mt-4">
-        <!-- Alerts Section -->
-        <div id="admin-alerts" class="mb-4">
-            {alerts_html}
-        </div>
-
-        <div class="row">
-            <div class="col-12">
-                <div class="d-flex justify-content-between align-items-center mb-4">
-                    <h1>Admin Dashboard</h1>
-                    <div>
-                        <a href="/admin/users/" class="btn btn-outline-primary me-2">Manage Users</a>
-                        <a href="/admin/chairs/" class="btn btn-outline-warning me-2">Manage Chairs</a>
-                        <a href="/admin/submissions/" class="btn btn-outline-success">Review Submissions</a>
-                    </div>
-                </div>
+            theme = form.get('theme', 'dark').strip()
+            if theme in ['light', 'dark', 'auto']:
+                user.theme = theme
+                db.session.commit()
+                session['theme'] = theme  # Update session immediately
+                flash('Theme preference updated successfully!', 'success')
+            else:
+                flash('Invalid theme selection.', 'error')
+    
+        # The user row may have changed; re-read it for the rest of the page
+        g.pop('current_user', None)
 
-                <!-- Statistics Cards -->
-                <div class="row mb-4">
-                    <div class="col-md-2">
-                        <div class="card h-100">
-                            <div class="card-body text-center">
-                                <h4 class="text-primary mb-1">{total_users}</h4>
-                                <p class="mb-0 small">Total Users</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card h-100">
-                            <div class="card-body text-center">
-                                <h4 class="text-success mb-1">{total_groups}</h4>
-                                <p class="mb-0 small">Working Groups</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card h-100">
-                            <div class="card-body text-center">
-                                <h4 class="text-warning mb-1">{total_submissions}</h4>
-                                <p class="mb-0 small">Total Submissions</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card h-100">
-                            <div class="card-body text-center">
-                                <h4 class="text-info mb-1">{approved_drafts}</h4>
-                                <p class="mb-0 small">Published Drafts</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card h-100">
-                            <div class="card-body text-center">
-                                <h4 class="text-danger mb-1">{pending_submissions}</h4>
-                                <p class="mb-0 small">Pending Review</p>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-2">
-                        <div class="card h-100">
-                            <div class="card-body text-center">
-                                <h4 class="text-secondary mb-1">{pending_chairs}</h4>
-                                <p class="mb-0 small">Pending Chairs</p>
-                            </div>
-                        </div>
-                    </div>
-                </div>
+    # Generate user menu
+    user_menu = generate_user_menu()
+    
+    current_theme = current_user.get('theme', 'dark')
+    light_selected = 'selected' if current_theme == 'light' else ''
+    dark_selected = 'selected' if current_theme == 'dark' else ''
+    auto_selected = 'selected' if current_theme == 'auto' else ''
+    
+    return render_template(
+        'profile.html',
+        title="Profile - MLTF",
+        theme=current_theme,
+        user_menu=user_menu,
+        current_user_name=current_user['name'],
+        current_user_email=current_user['email'],
+        current_user_theme=current_theme,
+        light_selected=light_selected,
+        dark_selected=dark_selected,
+        auto_selected=auto_selected,
+        session_user=session['user']
+    )
 
-                <div class="row">
-                    <!-- Recent Activity -->
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header d-flex justify-content-between align-items-center">
-                                <h5 class="mb-0">Recent Activity</h5>
-                                <span class="badge bg-primary">Live</span>
-                            </div>
-                            <div class="card-body">
-                                {activity_html}
-                                <hr>
-                                <a href="/admin/activity/" class="btn btn-sm btn-outline-primary">View All Activity</a>
-                            </div>
-                        </div>
-                    </div>
+@app.route('/admin/')
+@require_role('admin')
+def admin_dashboard():
+    user_menu = generate_user_menu()
 
-                    <!-- Quick Actions -->
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>Quick Actions</h5>
-                            </div>
-                            <div class="card-body">
-                                <div class="d-grid gap-2">
-                                    <a href="/admin/submissions/" class="btn btn-success">
-                                        <i class="fas fa-check-circle me-2"></i>Review Submissions ({pending_submissions} pending)
-                                    </a>
-                                    <a href="/admin/users/" class="btn btn-primary">
-                                        <i class="fas fa-users me-2"></i>Manage Users ({total_users} total)
-                                    </a>
-                                    <a href="/group/" class="btn btn-info">
-                                        <i class="fas fa-users-cog me-2"></i>Manage Working Groups ({pending_chairs} pending chairs)
-                                    </a>
-                                    <a href="/admin/analytics/" class="btn btn-secondary">
-                                        <i class="fas fa-chart-bar me-2"></i>View Analytics
-                                    </a>
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
+    # Enhanced admin statistics
+    stats = _get_dashboard_stats()
 
-                <!-- Content Management Section -->
-                <div class="row mt-4">
-                    <div class="col-12">
-                        <h3 class="mb-3">Content Management</h3>
-                    </div>
-                </div>
+    # Recent activity; fetch only as many rows as the page shows
+    recent_users = User.query.order_by(User.created_at.desc()).limit(2).all()
 
-                <div class="row">
-                    <!-- Most Active Drafts -->
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>Recent Draft Submissions</h5>
-                            </div>
-                            <div class="card-body">
-                                <div class="list-group list-group-flush">
-                                    {"".join([f'''
-                                    <a href="/doc/draft/{draft.id}/" class="list-group-item list-group-item-action d-flex justify-content-between align-items-center">
-                                        <div>
-                                            <strong>{draft.title[:40]}...</strong>
-                                            <br><small class="text-muted">by {draft.submitted_by} • {draft.submitted_at.strftime('%m/%d')}</small>
-                                        </div>
-                                        <span class="badge bg-{'warning' if draft.status == 'submitted' else 'success'}">{draft.status}</span>
-                                    </a>
-                                    ''' for draft in active_drafts[:5]])}
-                                </div>
-                            </div>
-                        </div>
-                    </div>
+    # Get most active drafts (by comment count or views if we had them)
+    # For now, just show recent submissions as proxy; the activity feed
+    # shows the first 3 of the same rows
+    active_drafts = Submission.query.order_by(Submission.submitted_at.desc()).limit(5).all()
 
-                    <!-- Active Users -->
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>Recent User Activity</h5>
-                            </div>
-                            <div class="card-body">
-                                <div class="list-group list-group-flush">
-                                    {"".join([f'''
-                                    <div class="list-group-item d-flex justify-content-between align-items-center">
-                                        <div>
-                                            <strong>{user.name}</strong>
-                                            <br><small class="text-muted">{user.email} • {user.role}</small>
-                                        </div>
-                                        <small class="text-muted">
-                                            {user.last_login.strftime('%m/%d %H:%M') if user.last_login else 'Never logged in'}
-                                        </small>
-                                    </div>
-                                    ''' for user in active_users[:5]])}
-                                </div>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    """
+    # Most active users (by login frequency - simplified)
+    active_users = User.query.order_by(User.last_login.desc()).limit(5).all()
 
-    return BASE_TEMPLATE.format(
+    # admin_dashboard.html extends base.html; only the query results are passed in
+    return render_template('admin_dashboard.html',
         title="Admin Dashboard - MLTF",
         theme=get_current_user().get('theme', 'dark'),
-        content=content,
-        user_menu=user_menu
+        user_menu=user_menu,
+        total_users=stats['total_users'],
+        total_groups=stats['total_groups'],
+        total_submissions=stats['total_submissions'],
+        approved_drafts=stats['approved_drafts'],
+        pending_submissions=stats['pending_submissions'],
+        pending_chairs=stats['pending_chairs'],
+        recent_submissions=active_drafts[:3],
+        recent_users=recent_users,
+        active_drafts=active_drafts,
+        active_users=active_users
     )
 
+@functools.lru_cache(maxsize=1024)
+def _build_pagination(label, page, pages, page_numbers, query_string):
+    """Pager <nav> for an admin list; query_string carries the list's filters"""
+    if pages <= 1:
+        return ''
+    parts = [f'<nav aria-label="{label} pagination" class="mt-4">',
+             '<ul class="pagination justify-content-center">']
+    if page > 1:
+        parts.append(f'<li class="page-item"><a class="page-link" href="?page={page - 1}&{query_string}">Previous</a></li>')
+    for num in page_numbers:
+        if num is None:
+            parts.append('<li class="page-item disabled"><span class="page-link">&hellip;</span></li>')
+        else:
+            parts.append(f'<li class="page-item {"active" if num == page else ""}"><a class="page-link" href="?page={num}&{query_string}">{num}</a></li>')
+    if page < pages:
+        parts.append(f'<li class="page-item"><a class="page-link" href="?page={page + 1}&{query_string}">Next</a></li>')
+    parts.append('</ul>')
+    parts.append('</nav>')
+    return '\n'.join(parts)
+
 @app.route('/admin/users/')
 @require_role('admin')
 def admin_users():
@@ -2547,10 +2798,10 @@ def admin_users():
         query = query.filter_by(role=role_filter)
 
     users = query.order_by(User.created_at.desc()).paginate(page=page, per_page=per_page, error_out=False)
-    total_users = query.count()
+    total_users = users.total  # paginate() has already run the COUNT
 
     # Build user rows
-    user_rows = ""
+    parts = []
     for user in users.items:
         role_badge = {
             'admin': 'badge bg-danger',
@@ -2558,9 +2809,9 @@ def admin_users():
             'user': 'badge bg-secondary'
         }.get(user.role, 'badge bg-secondary')
 
-        last_login = user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else 'Never'
+        last_login = fmt_dt(user.last_login, '%Y-%m-%d %H:%M') if user.last_login else 'Never'
 
-        user_rows += f"""
+        parts.append(f"""
         <tr>
             <td>
                 <strong>{user.name}</strong><br>
@@ -2569,7 +2820,7 @@ def admin_users():
             <td>{user.email}</td>
             <td><span class="{role_badge}">{user.role.title()}</span></td>
             <td>{user.theme.title()}</td>
-            <td>{user.created_at.strftime('%Y-%m-%d')}</td>
+            <td>{fmt_dt(user.created_at, '%Y-%m-%d')}</td>
             <td>{last_login}</td>
             <td>
                 <div class="btn-group btn-group-sm">
@@ -2582,7 +2833,8 @@ def admin_users():
                 </div>
             </td>
         </tr>
-        """
+        """)
+    user_rows = "".join(parts)
 
     # Role filter options
     role_options = f"""
@@ -2663,15 +2915,8 @@ def admin_users():
         </div>
 
         <!-- Pagination -->
-        {f'''
-        <nav aria-label="User pagination" class="mt-4">
-            <ul class="pagination justify-content-center">
-                {f'<li class="page-item {"disabled" if not users.has_prev else ""}"><a class="page-link" href="?page={users.prev_num}&search={search}&role={role_filter}">Previous</a></li>' if users.has_prev else ''}
-                {''.join([f'<li class="page-item {"active" if i == users.page else ""}"><a class="page-link" href="?page={i}&search={search}&role={role_filter}">{i}</a></li>' for i in users.iter_pages()])}
-                {f'<li class="page-item {"disabled" if not users.has_next else ""}"><a class="page-link" href="?page={users.next_num}&search={search}&role={role_filter}">Next</a></li>' if users.has_next else ''}
-            </ul>
-        </nav>
-        ''' if users.pages > 1 else ''}
+        {_build_pagination('User', users.page, users.pages, tuple(users.iter_pages()),
+                           urlencode({'search': search, 'role': role_filter}))}
         </div>
 
     <script>
@@ -2688,14 +2933,7 @@ def admin_users():
                     }},
                     body: JSON.stringify({{ role: nextRole }})
                 }})
-                .then(response => response.json())
-                .then(data => {{
-                    if (data.success) {{
-                        location.reload();
-                    }} else {{
-                        alert('Error: ' + data.message);
-                    }}
-                }})
+                .then(reloadOrAlert('Error: '))
                 .catch(error => {{
                     console.error('Error:', error);
                     alert('Error updating role');
@@ -2711,14 +2949,7 @@ def admin_users():
                         'Content-Type': 'application/json',
                     }}
                 }})
-                .then(response => response.json())
-                .then(data => {{
-                    if (data.success) {{
-                        location.reload();
-                    }} else {{
-                        alert('Error: ' + data.message);
-                    }}
-                }})
+                .then(reloadOrAlert('Error: '))
                 .catch(error => {{
                     console.error('Error:', error);
                     alert('Error deleting user');
@@ -2728,7 +2959,7 @@ def admin_users():
     </script>
     """
 
-    return BASE_TEMPLATE.format(
+    return render_template('base.html', 
         title="User Management - MLTF",
         theme=current_theme,
         user_menu=user_menu,
@@ -2760,7 +2991,7 @@ def change_user_role(username):
     add_to_document_history(f"user-{user.id}", "role_changed", current_admin['name'],
                            f"Changed {user.name}'s role to {new_role}")
 
-    return jsonify({'success': True, 'message': f'Role changed to {new_role}'})
+    return '', 204
 
 @app.route('/admin/users/<username>/delete', methods=['POST'])
 @require_role('admin')
@@ -2781,87 +3012,62 @@ def delete_user(username):
     db.session.delete(user)
     db.session.commit()
 
-    return jsonify({'success': True, 'message': 'User deleted successfully'})
-
-@app.route('/admin/submissions/')
-@require_role('admin')
-def admin_submissions():
-    user_menu = generate_user_menu()
-    current_theme = get_current_user().get('theme', 'dark')
-
-    # Get submissions with filters
-    status_filter = request.args.get('status', 'submitted')
-    page = request.args.get('page', 1, type=int)
-    per_page = 10
-
-    query = Submission.query
-
-    if status_filter and status_filter != 'all':
-        query = query.filter_by(status=status_filter)
-
-    submissions = query.order_by(Submission.submitted_at.desc()).paginate(
-        page=page, per_page=per_page, error_out=False)
-
-    # Build submission cards
-    submission_cards = ""
-    for submission in submissions.items:
-        status_badge = {
-            'submitted': 'badge bg-warning text-dark',
-            'approved': 'badge bg-success',
-            'rejected': 'badge bg-danger',
-            'published': 'badge bg-info'
-        }.get(submission.status, 'badge bg-secondary')
+    return '', 204
 
-        # Get file size if file exists
-        file_size = "N/A"
-        if submission.file_path and os.path.exists(submission.file_path):
-            file_size = f"{os.path.getsize(submission.file_path) / 1024:.1f} KB"
+# Admin review list: badge class per submission status, the moderation
+# buttons each status offers, and one card per submission (filled with
+# format_map; user-supplied fields are escaped first)
+_SUBMISSION_BADGES = {
+    'submitted': 'badge bg-warning text-dark',
+    'approved': 'badge bg-success',
+    'rejected': 'badge bg-danger',
+    'published': 'badge bg-info'
+}
 
-        action_buttons = ""
-        if submission.status == 'submitted':
-            action_buttons = f"""
-            <button class="btn btn-success btn-sm me-2" onclick="approveSubmission('{submission.id}')">
+_SUBMISSION_ACTIONS = {
+    'submitted': """
+            <button class="btn btn-success btn-sm me-2" onclick="approveSubmission('{id}')">
                 <i class="fas fa-check me-1"></i>Approve
             </button>
-            <button class="btn btn-danger btn-sm me-2" onclick="rejectSubmission('{submission.id}')">
+            <button class="btn btn-danger btn-sm me-2" onclick="rejectSubmission('{id}')">
                 <i class="fas fa-times me-1"></i>Reject
             </button>
-            <button class="btn btn-info btn-sm" onclick="publishAsRFC('{submission.id}')">
+            <button class="btn btn-info btn-sm" onclick="publishAsRFC('{id}')">
                 <i class="fas fa-star me-1"></i>Publish as RFC
             </button>
-            """
-        elif submission.status == 'approved':
-            action_buttons = f"""
-            <button class="btn btn-info btn-sm me-2" onclick="publishAsRFC('{submission.id}')">
+            """,
+    'approved': """
+            <button class="btn btn-info btn-sm me-2" onclick="publishAsRFC('{id}')">
                 <i class="fas fa-star me-1"></i>Publish as RFC
             </button>
-            <button class="btn btn-warning btn-sm" onclick="unapproveSubmission('{submission.id}')">
+            <button class="btn btn-warning btn-sm" onclick="unapproveSubmission('{id}')">
                 <i class="fas fa-undo me-1"></i>Unapprove
             </button>
-            """
+            """,
+}
 
-        submission_cards += f"""
+_SUBMISSION_CARD_HTML = """
         <div class="card mb-3">
             <div class="card-header d-flex justify-content-between align-items-center">
                 <h6 class="mb-0">
-                    <a href="/doc/draft/{submission.id}/" class="text-decoration-none">
-                        {submission.title}
+                    <a href="/doc/draft/{id}/" class="text-decoration-none">
+                        {title}
                     </a>
                 </h6>
-                <span class="{status_badge}">{submission.status.title()}</span>
+                <span class="{status_badge}">{status}</span>
             </div>
             <div class="card-body">
                 <div class="row">
                     <div class="col-md-8">
-                        <p class="mb-2"><strong>Authors:</strong> {', '.join(submission.authors)}</p>
-                        <p class="mb-2"><strong>Group:</strong> {submission.group or 'None'}</p>
-                        <p class="mb-2"><strong>Submitted:</strong> {submission.submitted_at.strftime('%Y-%m-%d %H:%M')} by {submission.submitted_by}</p>
-                        <p class="mb-2"><strong>File:</strong> {submission.filename} ({file_size})</p>
-                        {f'<p class="mb-2"><strong>Abstract:</strong> {submission.abstract[:200]}...</p>' if submission.abstract else ''}
+                        <p class="mb-2"><strong>Authors:</strong> {authors}</p>
+                        <p class="mb-2"><strong>Group:</strong> {group}</p>
+                        <p class="mb-2"><strong>Submitted:</strong> {submitted_at} by {submitted_by}</p>
+                        <p class="mb-2"><strong>File:</strong> {filename} ({file_size})</p>
+                        {abstract}
                     </div>
                     <div class="col-md-4">
                         <div class="d-grid gap-2">
-                            <a href="/doc/draft/{submission.id}/" class="btn btn-outline-primary btn-sm">
+                            <a href="/doc/draft/{id}/" class="btn btn-outline-primary btn-sm">
                                 <i class="fas fa-eye me-1"></i>View Draft
                             </a>
                             {action_buttons}
@@ -2872,6 +3078,49 @@ def admin_submissions():
         </div>
         """
 
+@app.route('/admin/submissions/')
+@require_role('admin')
+def admin_submissions():
+    user_menu = generate_user_menu()
+    current_theme = get_current_user().get('theme', 'dark')
+
+    # Get submissions with filters
+    status_filter = request.args.get('status', 'submitted')
+    page = request.args.get('page', 1, type=int)
+    per_page = 10
+
+    query = Submission.query
+
+    if status_filter and status_filter != 'all':
+        query = query.filter_by(status=status_filter)
+
+    submissions = query.order_by(Submission.submitted_at.desc()).paginate(
+        page=page, per_page=per_page, error_out=False)
+
+    # Build submission cards
+    cards = []
+    for submission in submissions.items:
+        # Get file size if file exists
+        file_size = "N/A"
+        if submission.file_path and os.path.exists(submission.file_path):
+            file_size = f"{os.path.getsize(submission.file_path) / 1024:.1f} KB"
+
+        cards.append(_SUBMISSION_CARD_HTML.format_map({
+            'id': submission.id,
+            'title': escape(submission.title),
+            'status_badge': _SUBMISSION_BADGES.get(submission.status, 'badge bg-secondary'),
+            'status': submission.status.title(),
+            'authors': escape(', '.join(submission.authors)),
+            'group': escape(submission.group or 'None'),
+            'submitted_at': fmt_dt(submission.submitted_at, '%Y-%m-%d %H:%M'),
+            'submitted_by': escape(submission.submitted_by),
+            'filename': escape(submission.filename),
+            'file_size': file_size,
+            'abstract': f'<p class="mb-2"><strong>Abstract:</strong> {escape(submission.abstract[:200])}...</p>' if submission.abstract else '',
+            'action_buttons': _SUBMISSION_ACTIONS.get(submission.status, '').format(id=submission.id),
+        }))
+    submission_cards = "".join(cards)
+
     # Status filter options
     status_options = f"""
     <option value="all" {'selected' if status_filter == 'all' else ''}>All Submissions</option>
@@ -2941,15 +3190,8 @@ def admin_submissions():
         </div>
 
         <!-- Pagination -->
-        {f'''
-        <nav aria-label="Submission pagination" class="mt-4">
-            <ul class="pagination justify-content-center">
-                {f'<li class="page-item {"disabled" if not submissions.has_prev else ""}"><a class="page-link" href="?page={submissions.prev_num}&status={status_filter}">Previous</a></li>' if submissions.has_prev else ''}
-                {''.join([f'<li class="page-item {"active" if i == submissions.page else ""}"><a class="page-link" href="?page={i}&status={status_filter}">{i}</a></li>' for i in submissions.iter_pages()])}
-                {f'<li class="page-item {"disabled" if not submissions.has_next else ""}"><a class="page-link" href="?page={submissions.next_num}&status={status_filter}">Next</a></li>' if submissions.has_next else ''}
-            </ul>
-        </nav>
-        ''' if submissions.pages > 1 else ''}
+        {_build_pagination('Submission', submissions.page, submissions.pages, tuple(submissions.iter_pages()),
+                           urlencode({'status': status_filter}))}
     </div>
 
     <script>
@@ -2993,14 +3235,7 @@ def admin_submissions():
                 }},
                 body: JSON.stringify(data)
             }})
-            .then(response => response.json())
-            .then(data => {{
-                if (data.success) {{
-                    location.reload();
-                }} else {{
-                    alert('Error: ' + data.message);
-                }}
-            }})
+            .then(reloadOrAlert('Error: '))
             .catch(error => {{
                 console.error('Error:', error);
                 alert('Error updating submission status');
@@ -3009,7 +3244,7 @@ def admin_submissions():
     </script>
     """
 
-    return BASE_TEMPLATE.format(
+    return render_template('base.html', 
         title="Submission Management - MLTF",
         theme=current_theme,
         user_menu=user_menu,
@@ -3064,7 +3299,7 @@ def update_submission_status(submission_id):
     add_to_document_history(f"submission-{submission.id}", "status_changed",
                            admin_user['name'], action_details)
 
-    return jsonify({'success': True, 'message': f'Status updated to {new_status}'})
+    return '', 204
 
 def get_next_ml_number():
     """Get the next ML number (ML-001 to ML-999, then ML-1000+)"""
@@ -3173,9 +3408,9 @@ def admin_analytics():
     recent_submissions = Submission.query.filter(Submission.submitted_at >= thirty_days_ago).count()
 
     # Build active drafts table
-    draft_rows = ""
+    parts = []
     for i, draft in enumerate(active_drafts, 1):
-        draft_rows += f"""
+        parts.append(f"""
         <tr>
             <td>{i}</td>
             <td>
@@ -3185,15 +3420,16 @@ def admin_analytics():
             </td>
             <td>{', '.join(draft.authors[:2])}{'...' if len(draft.authors) > 2 else ''}</td>
             <td>{draft.group or 'None'}</td>
-            <td>{draft.submitted_at.strftime('%Y-%m-%d')}</td>
+            <td>{fmt_dt(draft.submitted_at, '%Y-%m-%d')}</td>
             <td><span class="badge bg-{ 'warning' if draft.status == 'submitted' else 'success' if draft.status == 'approved' else 'danger' if draft.status == 'rejected' else 'info'}">{draft.status}</span></td>
         </tr>
-        """
+        """)
+    draft_rows = "".join(parts)
 
     # Build active users table
-    user_rows = ""
+    parts = []
     for i, user in enumerate(active_users, 1):
-        user_rows += f"""
+        parts.append(f"""
         <tr>
             <td>{i}</td>
             <td>
@@ -3202,10 +3438,11 @@ def admin_analytics():
             </td>
             <td>{user.email}</td>
             <td><span class="badge bg-{ 'danger' if user.role == 'admin' else 'warning' if user.role == 'editor' else 'secondary'}">{user.role.title()}</span></td>
-            <td>{user.created_at.strftime('%Y-%m-%d')}</td>
-            <td>{user.last_login.strftime('%Y-%m-%d %H:%M') if user.last_login else 'Never'}</td>
+            <td>{fmt_dt(user.created_at, '%Y-%m-%d')}</td>
+            <td>{fmt_dt(user.last_login, '%Y-%m-%d %H:%M') if user.last_login else 'Never'}</td>
         </tr>
-        """
+        """)
+    user_rows = "".join(parts)
 
     content = f"""
     <div class="container mt-4">
@@ -3379,228 +3616,115 @@ def admin_analytics():
             </div>
         </div>
         </div>
-        """
-    
-    return BASE_TEMPLATE.format(
-        title="Analytics - MLTF",
-        theme=current_theme,
-        user_menu=user_menu,
-        content=content
-    )
-
-@app.route('/admin/chairs/')
-@require_auth
-def admin_chairs():
-    current_user = get_current_user()
-    current_theme = session.get('theme', 'dark')
-
-    # Generate user menu
-    user_menu = generate_user_menu()
-
-    # Get statistics
-    total_chairs = len(WORKING_GROUP_CHAIRS)
-    approved_chairs = len([c for c in WORKING_GROUP_CHAIRS.values() if c['approved']])
-    pending_chairs = total_chairs - approved_chairs
-
-    # Build chair list
-    chair_list = ""
-    for chair_id, chair_data in WORKING_GROUP_CHAIRS.items():
-        status_badge = 'success' if chair_data['approved'] else 'warning'
-        status_text = 'Active' if chair_data['approved'] else 'Pending'
-        chair_list += f"""
-        <tr>
-            <td>{chair_data['chair_name']}</td>
-            <td>{chair_data.get('chair_email', 'N/A')}</td>
-            <td><code>{chair_data['group_acronym']}</code></td>
-            <td><span class="badge bg-{status_badge}">{status_text}</span></td>
-            <td>{chair_data['set_at'].strftime('%Y-%m-%d')}</td>
-            <td>
-                <a href="/admin/chairs/{chair_id}/approve" class="btn btn-sm btn-outline-success" onclick="return confirm('Approve this chair?')">Approve</a>
-                <a href="/admin/chairs/{chair_id}/delete" class="btn btn-sm btn-outline-danger" onclick="return confirm('Delete this chair?')">Delete</a>
-            </td>
-        </tr>
-        """
-
-    content = f"""
-    <div class="container mt-4">
-        <nav aria-label="breadcrumb">
-            <ol class="breadcrumb">
-                <li class="breadcrumb-item"><a href="/admin/">Admin Dashboard</a></li>
-                <li class="breadcrumb-item active">Chair Management</li>
-            </ol>
-        </nav>
-
-        <div class="d-flex justify-content-between align-items-center mb-4">
-            <div>
-                <h1 class="mb-1">Chair Management</h1>
-                <p class="text-muted mb-0">Manage working group chairs across all groups</p>
-            </div>
-            <a href="/admin/chairs/add" class="btn btn-primary">
-                <i class="fas fa-plus me-2"></i>Add New Chair
-            </a>
-        </div>
-
-        <!-- Statistics Cards -->
-        <div class="row mb-4">
-            <div class="col-md-4">
-                <div class="card text-center">
-                    <div class="card-body">
-                        <h4 class="text-primary">{total_chairs}</h4>
-                        <small class="text-muted">Total Chairs</small>
-                    </div>
-                </div>
-            </div>
-            <div class="col-md-4">
-                <div class="card text-center">
-                    <div class="card-body">
-                        <h4 class="text-success">{approved_chairs}</h4>
-                        <small class="text-muted">Active Chairs</small>
-                    </div>
-                </div>
-            </div>
-            <div class="col-md-4">
-                <div class="card text-center">
-                    <div class="card-body">
-                        <h4 class="text-warning">{pending_chairs}</h4>
-                        <small class="text-muted">Pending Approval</small>
-                    </div>
-                </div>
-            </div>
-        </div>
-
-        <!-- Chairs Table -->
-        <div class="card">
-            <div class="card-header">
-                <h5 class="mb-0">Working Group Chairs</h5>
-            </div>
-            <div class="card-body p-0">
-                <div class="table-responsive">
-                    <table class="table table-hover mb-0">
-                        <thead class="table-light">
-                            <tr>
-                                <th>Name</th>
-                                <th>Email</th>
-                                <th>Group</th>
-                                <th>Status</th>
-                                <th>Added</th>
-                                <th>Actions</th>
-                            </tr>
-                        </thead>
-                        <tbody>
-                            {chair_list if chair_list else '<tr><td colspan="6" class="text-center text-muted py-4">No chairs found. <a href="/admin/chairs/add">Add the first chair</a>.</td></tr>'}
-                        </tbody>
-                    </table>
-                </div>
-            </div>
-        </div>
-    </div>
-    """
-
-    return BASE_TEMPLATE.format(
-        title="Chair Management - MLTF",
+        """
+    
+    return render_template('base.html', 
+        title="Analytics - MLTF",
         theme=current_theme,
         user_menu=user_menu,
         content=content
     )
 
+# One row of the chair management table; name, email and group are escaped
+_CHAIR_ROW_HTML = """
+                        <tr>
+                            <td>{chair_name}</td>
+                            <td>{chair_email}</td>
+                            <td><code>{group_acronym}</code></td>
+                            <td><span class="badge bg-{status_badge}">{status_text}</span></td>
+                            <td>{set_at}</td>
+                            <td>
+                                <a href="/admin/chairs/{chair_id}/approve" class="btn btn-sm btn-outline-success" onclick="return confirm('Approve this chair?')">Approve</a>
+                                <a href="/admin/chairs/{chair_id}/delete" class="btn btn-sm btn-outline-danger" onclick="return confirm('Delete this chair?')">Delete</a>
+                            </td>
+                        </tr>"""
+
+def _render_chair_row(chair_id, chair_data):
+    """Table row for a chair, reused until its approval or set_at changes"""
+    approved = chair_data['approved']
+    set_at = chair_data['set_at']
+    cached = _chair_row_cache.get(chair_id)
+    if cached is not None and cached[0] == approved and cached[1] == set_at:
+        return cached[2]
+    html = _CHAIR_ROW_HTML.format_map({
+        'chair_id': chair_id,
+        'chair_name': escape(chair_data['chair_name']),
+        'chair_email': escape(chair_data.get('chair_email', 'N/A')),
+        'group_acronym': escape(chair_data['group_acronym']),
+        'status_badge': 'success' if approved else 'warning',
+        'status_text': 'Active' if approved else 'Pending',
+        'set_at': fmt_dt(set_at, '%Y-%m-%d'),
+    })
+    _chair_row_cache[chair_id] = (approved, set_at, html)
+    return html
+
+@app.route('/admin/chairs/')
+@require_auth
+def admin_chairs():
+    # Re-rendered only when the chairs (or the viewer) change
+    def render():
+        current_theme = session.get('theme', 'dark')
+
+        # Generate user menu
+        user_menu = generate_user_menu()
+
+        # Get statistics, and a snapshot of the chairs that writers can't resize mid-render
+        total_chairs, approved_chairs, pending_chairs = _get_chair_counts()
+        with _chairs_lock:
+            chairs = list(WORKING_GROUP_CHAIRS.items())
+
+        return render_template('admin_chairs.html',
+            title="Chair Management - MLTF",
+            theme=current_theme,
+            user_menu=user_menu,
+            total_chairs=total_chairs,
+            approved_chairs=approved_chairs,
+            pending_chairs=pending_chairs,
+            chair_rows="".join(_render_chair_row(chair_id, chair_data)
+                               for chair_id, chair_data in chairs)
+        )
+
+    return _conditional_page(_page_etag(_chairs_version), render)
+
 @app.route('/admin/chairs/add', methods=['GET', 'POST'])
 @require_auth
 def add_chair():
-    current_user = get_current_user()
     current_theme = session.get('theme', 'dark')
 
     # Generate user menu
     user_menu = generate_user_menu()
 
     if request.method == 'POST':
-        chair_name = request.form.get('chair_name', '').strip()
-        chair_email = request.form.get('chair_email', '').strip()
-        group_acronym = request.form.get('group_acronym', '').strip()
-        approved = request.form.get('approved') == 'on'
+        form = request.form
+        chair_name = form.get('chair_name', '').strip()
+        chair_email = form.get('chair_email', '').strip()
+        group_acronym = form.get('group_acronym', '').strip()
+        approved = form.get('approved') == 'on'
 
         if not chair_name or not group_acronym:
             flash('Chair name and group are required', 'error')
+        elif not _add_chair(str(uuid.uuid4()), {
+                'chair_name': chair_name,
+                'chair_email': chair_email,
+                'group_acronym': group_acronym,
+                'approved': approved,
+                'set_at': datetime.utcnow()
+            }):
+            flash('Chair already exists in this group', 'error')
         else:
-            # Check if chair already exists
-            for chair_data in WORKING_GROUP_CHAIRS.values():
-                if chair_data['group_acronym'] == group_acronym and chair_data['chair_name'] == chair_name:
-                    flash('Chair already exists in this group', 'error')
-                    break
-            else:
-                # Add new chair
-                chair_id = str(uuid.uuid4())
-                WORKING_GROUP_CHAIRS[chair_id] = {
-                    'chair_name': chair_name,
-                    'chair_email': chair_email,
-                    'group_acronym': group_acronym,
-                    'approved': approved,
-                    'set_at': datetime.utcnow()
-                }
-                flash('Chair added successfully', 'success')
-                return redirect('/admin/chairs/')
-
-    content = f"""
-    <div class="container mt-4">
-        <nav aria-label="breadcrumb">
-            <ol class="breadcrumb">
-                <li class="breadcrumb-item"><a href="/admin/">Admin Dashboard</a></li>
-                <li class="breadcrumb-item"><a href="/admin/chairs/">Chair Management</a></li>
-                <li class="breadcrumb-item active">Add Chair</li>
-            </ol>
-        </nav>
-
-        <div class="row justify-content-center">
-            <div class="col-md-6">
-                <div class="card">
-                    <div class="card-header">
-                        <h5 class="mb-0">Add New Chair</h5>
-                    </div>
-                    <div class="card-body">
-                        <form method="POST">
-                            <div class="mb-3">
-                                <label for="chair_name" class="form-label">Chair Name *</label>
-                                <input type="text" class="form-control" id="chair_name" name="chair_name" required>
-                            </div>
-                            <div class="mb-3">
-                                <label for="chair_email" class="form-label">Email</label>
-                                <input type="email" class="form-control" id="chair_email" name="chair_email">
-                            </div>
-                            <div class="mb-3">
-                                <label for="group_acronym" class="form-label">Working Group *</label>
-                                <input type="text" class="form-control" id="group_acronym" name="group_acronym" required>
-                            </div>
-                            <div class="mb-3">
-                                <div class="form-check">
-                                    <input class="form-check-input" type="checkbox" id="approved" name="approved">
-                                    <label class="form-check-label" for="approved">
-                                        Approved (Active Chair)
-                                    </label>
-                                </div>
-                            </div>
-                            <div class="d-flex gap-2">
-                                <button type="submit" class="btn btn-primary">Add Chair</button>
-                                <a href="/admin/chairs/" class="btn btn-secondary">Cancel</a>
-                            </div>
-                        </form>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    """
+            flash('Chair added successfully', 'success')
+            return redirect('/admin/chairs/')
 
-    return BASE_TEMPLATE.format(
+    return render_template('admin_chair_add.html',
         title="Add Chair - MLTF",
         theme=current_theme,
-        user_menu=user_menu,
-        content=content
+        user_menu=user_menu
     )
 
 @app.route('/admin/chairs/<chair_id>/approve')
 @require_auth
 def approve_chair(chair_id):
-    if chair_id in WORKING_GROUP_CHAIRS:
-        WORKING_GROUP_CHAIRS[chair_id]['approved'] = True
+    if _approve_chair(chair_id):
         flash('Chair approved successfully', 'success')
     else:
         flash('Chair not found', 'error')
@@ -3609,8 +3733,7 @@ def approve_chair(chair_id):
 @app.route('/admin/chairs/<chair_id>/delete')
 @require_auth
 def delete_chair(chair_id):
-    if chair_id in WORKING_GROUP_CHAIRS:
-        del WORKING_GROUP_CHAIRS[chair_id]
+    if _delete_chair(chair_id):
         flash('Chair deleted successfully', 'success')
     else:
         flash('Chair not found', 'error')
@@ -3624,202 +3747,139 @@ def home():
     current_theme = current_user.get('theme', 'dark') if current_user else 'light'
     user_menu = generate_user_menu()
     
-    # Count documents: DRAFTS + approved/published submissions
-    doc_count = len(DRAFTS) + Submission.query.filter(Submission.status.in_(['approved', 'published'])).count()
-    
-    return BASE_TEMPLATE.format(title="MLTF", theme=current_theme, user_menu=user_menu, content=f"""
-    
-    <div class="container mt-4">
-        <div class="row">
-            <div class="col-md-8">
-                <p class="lead">Welcome to the Governance Hub for the Meta-Layer Task Force!</p>
-
-                <div class="row">
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>Recent Documents</h5>
-                            </div>
-                            <div class="card-body">
-                                <p>View the latest MLTF documents including drafts, RFCs, and other standards.</p>
-                                <a href="/doc/all/" class="btn btn-primary">View All Documents</a>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>Working Groups</h5>
-                            </div>
-                            <div class="card-body">
-                                <p>Browse MLTF working groups and their activities.</p>
-                                <a href="/group/" class="btn btn-primary">View Working Groups</a>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-                
-                <div class="row mt-4">
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>Meetings</h5>
-                            </div>
-                            <div class="card-body">
-                                <p>Information about MLTF meetings and sessions.</p>
-                                <a href="/meeting/" class="btn btn-primary">View Meetings</a>
-                            </div>
-                        </div>
-                    </div>
-                    <div class="col-md-6">
-                        <div class="card">
-                            <div class="card-header">
-                                <h5>People</h5>
-                            </div>
-                            <div class="card-body">
-                                <p>Directory of MLTF participants and contributors.</p>
-                                <a href="/person/" class="btn btn-primary">View People</a>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            <div class="col-md-4">
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Quick Stats</h5>
-                    </div>
-                    <div class="card-body">
-                        <p><strong>Documents:</strong> {doc_count}</p>
-                        <p><strong>Working Groups:</strong> {len(GROUPS)}</p>
-                        <p><strong>Last Updated:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </div>
-    """)
+    return render_template('home.html', title="MLTF", theme=current_theme, user_menu=user_menu,
+                           doc_count=_get_home_doc_count(), group_count=len(GROUPS), updated=now_str('%Y-%m-%d %H:%M'))
 
 @app.route('/doc/active/')
 def active_documents():
     """Show active documents (alias for all documents)"""
     return all_documents()
 
-@app.route('/doc/all/')
-def all_documents():
-    user_menu = generate_user_menu()
-    current_theme = session.get('theme', 'dark')
-    
-    # Get all documents: published drafts + approved/published submissions
-    all_docs = []
-    
-    # Add published drafts from DRAFTS list
-    all_docs.extend(DRAFTS)
-    
-    # Add approved/published submissions from database
-    approved_submissions = Submission.query.filter(Submission.status.in_(['approved', 'published'])).all()
-    for submission in approved_submissions:
-        # Calculate pages and words if needed
-        pages = 1
-        words = 0
-        if submission.file_path and os.path.exists(submission.file_path):
-            _, ext = os.path.splitext(submission.filename.lower())
-            try:
-                if ext in ['.txt', '.xml']:
-                    with open(submission.file_path, 'r', encoding='utf-8', errors='replace') as f:
-                        content = f.read()
-                    words = len(content.split())
-                    pages = max(1, (words + 499) // 500)
-                elif ext == '.docx':
-                    from docx import Document
-                    doc = Document(submission.file_path)
-                    content_parts = []
-                    for paragraph in doc.paragraphs:
-                        if paragraph.text.strip():
-                            content_parts.append(paragraph.text)
-                    content = '\n\n'.join(content_parts)
-                    words = len(content.split())
-                    pages = max(1, (words + 499) // 500)
-                elif ext == '.pdf':
-                    from PyPDF2 import PdfReader
-                    reader = PdfReader(submission.file_path)
-                    content_parts = []
-                    for page in reader.pages:
-                        text = page.extract_text()
-                        if text.strip():
-                            content_parts.append(text)
-                    content = '\n\n'.join(content_parts)
-                    words = len(content.split())
-                    pages = len(reader.pages) if reader.pages else max(1, (words + 499) // 500)
-            except Exception:
-                pass
-        
-        all_docs.append({
-            'name': submission.id,
-            'title': submission.title,
-            'authors': submission.authors if isinstance(submission.authors, list) else [submission.authors] if submission.authors else [],
-            'group': submission.group or 'N/A',
-            'status': submission.status,
-            'rev': '00',
-            'pages': pages,
-            'words': words,
-            'date': submission.submitted_at.strftime('%Y-%m-%d') if submission.submitted_at else '',
-            'abstract': submission.abstract or '',
-            'ml_number': submission.ml_number
-        })
-    
-    docs_html = ""
-    for draft in all_docs:
-        display_id = draft.get('ml_number') or draft['name']
-        docs_html += f"""
+# One card in the documents listing, filled with format_map by all_documents
+_DOC_CARD_HTML = """
         <div class="col-md-6 document-card">
             <div class="card">
                 <div class="card-body">
                     <h5 class="card-title document-title">
-                        <a href="/doc/draft/{draft['name']}/">{display_id}</a>
+                        <a href="/doc/draft/{name}/">{display_id}</a>
                     </h5>
-                    <p class="card-text">{draft['title']}</p>
+                    <p class="card-text">{title}</p>
                     <div class="document-meta">
-                        <span class="badge bg-secondary status-badge">{draft['status']}</span>
-                        <span class="ms-2">Rev: {draft['rev']}</span>
-                        <span class="ms-2">{draft['pages']} pages</span>
-                        <span class="ms-2">{draft['words']} words</span>
+                        <span class="badge bg-secondary status-badge">{status}</span>
+                        <span class="ms-2">Rev: {rev}</span>
+                        <span class="ms-2">{pages} pages</span>
+                        <span class="ms-2">{words} words</span>
                     </div>
                     <div class="mt-2">
                         <small class="text-muted">
-                            Authors: {', '.join(draft['authors']) if draft['authors'] else 'N/A'}<br>
-                            Group: {draft['group']}<br>
-                            Date: {draft['date']}
+                            Authors: {authors}<br>
+                            Group: {group}<br>
+                            Date: {date}
                         </small>
                     </div>
                     <div class="mt-2">
-                        <a href="/doc/draft/{draft['name']}/comments/" class="btn btn-sm btn-outline-primary">Comments</a>
-                        <a href="/doc/draft/{draft['name']}/history/" class="btn btn-sm btn-outline-secondary">History</a>
-                        <a href="/doc/draft/{draft['name']}/revisions/" class="btn btn-sm btn-outline-info">Revisions</a>
+                        <a href="/doc/draft/{name}/comments/" class="btn btn-sm btn-outline-primary">Comments</a>
+                        <a href="/doc/draft/{name}/history/" class="btn btn-sm btn-outline-secondary">History</a>
+                        <a href="/doc/draft/{name}/revisions/" class="btn btn-sm btn-outline-info">Revisions</a>
                     </div>
                 </div>
             </div>
         </div>
         """
+
+def _submission_doc(submission):
+    """Listing entry for an approved/published submission"""
+    # Calculate pages and words if needed
+    pages = 1
+    words = 0
+    if submission.file_path and os.path.exists(submission.file_path):
+        _, ext = os.path.splitext(submission.filename.lower())
+        try:
+            if ext in ['.txt', '.xml']:
+                with open(submission.file_path, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+                words = len(content.split())
+                pages = max(1, (words + 499) // 500)
+            elif ext == '.docx':
+                from docx import Document
+                doc = Document(submission.file_path)
+                content_parts = []
+                for paragraph in doc.paragraphs:
+                    if paragraph.text.strip():
+                        content_parts.append(paragraph.text)
+                content = '\n\n'.join(content_parts)
+                words = len(content.split())
+                pages = max(1, (words + 499) // 500)
+            elif ext == '.pdf':
+                from PyPDF2 import PdfReader
+                reader = PdfReader(submission.file_path)
+                content_parts = []
+                for page in reader.pages:
+                    text = page.extract_text()
+                    if text.strip():
+                        content_parts.append(text)
+                content = '\n\n'.join(content_parts)
+                words = len(content.split())
+                pages = len(reader.pages) if reader.pages else max(1, (words + 499) // 500)
+        except Exception:
+            pass
+
+    return {
+        'name': submission.id,
+        'title': submission.title,
+        'authors': submission.authors if isinstance(submission.authors, list) else [submission.authors] if submission.authors else [],
+        'group': submission.group or 'N/A',
+        'status': submission.status,
+        'rev': '00',
+        'pages': pages,
+        'words': words,
+        'date': fmt_dt(submission.submitted_at, '%Y-%m-%d') if submission.submitted_at else '',
+        'abstract': submission.abstract or '',
+        'ml_number': submission.ml_number
+    }
+
+def _doc_card(draft):
+    return _DOC_CARD_HTML.format_map({
+        'name': draft['name'],
+        'display_id': draft.get('ml_number') or draft['name'],
+        'title': escape(draft['title']),
+        'status': draft['status'],
+        'rev': draft['rev'],
+        'pages': draft['pages'],
+        'words': draft['words'],
+        'authors': escape(', '.join(draft['authors'])) if draft['authors'] else 'N/A',
+        'group': escape(draft['group']),
+        'date': draft['date'],
+    })
+
+@app.route('/doc/all/')
+def all_documents():
+    # Submissions only change through commits, which bump _stats_version
+    def render():
+        user_menu = generate_user_menu()
+        current_theme = session.get('theme', 'dark')
     
-    content = f"""
-    <div class="container mt-4">
-        <h1>All Documents</h1>
-        <p>Showing {len(all_docs)} documents</p>
-        
-        <div class="row">
-            {docs_html}
-        </div>
-    </div>
-    """
+        # All documents: published drafts + approved/published submissions.
+        # The page is streamed, so each card (and each submission file's
+        # page/word count) is produced as the response goes out
+        approved_submissions = Submission.query.filter(Submission.status.in_(['approved', 'published'])).all()
+    
+        def doc_cards():
+            for draft in DRAFTS:
+                yield _doc_card(draft)
+            for submission in approved_submissions:
+                yield _doc_card(_submission_doc(submission))
+    
+        return stream_template('documents.html', title="All Documents - MLTF", theme=current_theme, user_menu=user_menu,
+                               doc_count=len(DRAFTS) + len(approved_submissions), doc_cards=doc_cards())
 
-    return BASE_TEMPLATE.format(title="All Documents - MLTF", theme=current_theme, user_menu=user_menu, content=content)
+    return _conditional_page(_page_etag(len(DRAFTS), _stats_version), render)
 
 @app.route('/doc/draft/<path:draft_name>.txt')
 def draft_text(draft_name):
     """Serve draft content as plain text"""
     # First try to find in DRAFTS (published documents)
-    draft = next((d for d in DRAFTS if d['name'] == draft_name), None)
+    draft = DRAFTS_BY_NAME.get(draft_name)
     
     # If not found in DRAFTS, try to find as a submission ID
     submission = None
@@ -3833,7 +3893,7 @@ def draft_text(draft_name):
                 'abstract': submission.abstract or 'Abstract not available for this draft.',
                 'status': submission.status,
                 'group': submission.group,
-                'date': submission.submitted_at.strftime('%Y-%m-%d') if submission.submitted_at else '',
+                'date': fmt_dt(submission.submitted_at, '%Y-%m-%d') if submission.submitted_at else '',
             }
     
     if not draft:
@@ -3872,9 +3932,8 @@ def draft_text(draft_name):
                         content_parts.append(text)
                 document_content = '\n\n'.join(content_parts)
                 # Clean up PDF text
-                import re
-                document_content = re.sub(r'\n+', '\n', document_content)
-                document_content = re.sub(r' +', ' ', document_content)
+                document_content = _MULTI_NL.sub('\n', document_content)
+                document_content = _MULTI_SPACE.sub(' ', document_content)
             else:
                 document_content = f"Document content cannot be displayed for {ext.upper()} files. Please download to view."
         except Exception as e:
@@ -3939,7 +3998,7 @@ def draft_text(draft_name):
 @app.route('/doc/draft/<draft_name>/')
 def draft_detail(draft_name):
     # First try to find in DRAFTS (published documents)
-    draft = next((d for d in DRAFTS if d['name'] == draft_name), None)
+    draft = DRAFTS_BY_NAME.get(draft_name)
 
     # If not found in DRAFTS, try to find as a submission ID
     submission = None
@@ -3955,7 +4014,7 @@ def draft_detail(draft_name):
                 'abstract': submission.abstract or 'Abstract not available for this draft.',
                 'status': submission.status,
                 'group': submission.group,
-                'date': submission.submitted_at.strftime('%Y-%m-%d') if submission.submitted_at else '',
+                'date': fmt_dt(submission.submitted_at, '%Y-%m-%d') if submission.submitted_at else '',
                 'rev': '00',  # Default revision for submissions
                 'pages': 1,   # Default pages for submissions
                 'words': 0,   # Default words for submissions
@@ -4010,9 +4069,8 @@ def draft_detail(draft_name):
                         content_parts.append(text)
                 document_content = '\n\n'.join(content_parts)
                 # Clean up PDF text
-                import re
-                document_content = re.sub(r'\n+', '\n', document_content)
-                document_content = re.sub(r' +', ' ', document_content)
+                document_content = _MULTI_NL.sub('\n', document_content)
+                document_content = _MULTI_SPACE.sub(' ', document_content)
                 # Calculate words and pages
                 words = len(document_content.split())
                 calculated_pages = len(reader.pages) if reader.pages else max(1, (words + 499) // 500)
@@ -4082,116 +4140,19 @@ def draft_detail(draft_name):
     current_theme = session.get('theme', 'dark')
     current_user = get_current_user()
     display_id = draft.get('ml_number') or draft['name']
-    content = f"""
-    <div class="container mt-4">
-        <h1>{display_id}</h1>
-        <p class="lead">{draft['title']}</p>
-
-        <div class="row">
-            <div class="col-md-8">
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Document Information</h5>
-                    </div>
-                    <div class="card-body">
-                        <table class="table" style="color: var(--text-primary) !important;">
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>ID:</strong></td><td style="color: var(--text-primary) !important;">{display_id}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Title:</strong></td><td style="color: var(--text-primary) !important;">{draft['title']}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Revision:</strong></td><td style="color: var(--text-primary) !important;">{draft['rev']}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Status:</strong></td><td style="color: var(--text-primary) !important;"><span class="badge bg-secondary">{draft['status']}</span></td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Pages:</strong></td><td style="color: var(--text-primary) !important;">{draft['pages']}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Words:</strong></td><td style="color: var(--text-primary) !important;">{draft['words']}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Authors:</strong></td><td style="color: var(--text-primary) !important;">{', '.join(draft['authors'])}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Group:</strong></td><td style="color: var(--text-primary) !important;">{draft['group'] or 'N/A'}</td></tr>
-                            <tr><td style="color: var(--text-secondary) !important;"><strong>Date:</strong></td><td style="color: var(--text-primary) !important;">{draft['date']}</td></tr>
-                        </table>
-                    </div>
-                </div>
-                
-                <div class="card mt-3">
-                    <div class="card-header">
-                        <h5>Abstract</h5>
-                    </div>
-                    <div class="card-body">
-                        <p>{draft.get('abstract', 'Abstract not available for this draft.')}</p>
-                    </div>
-                </div>
-
-                <!-- Full Document Content -->
-                <div class="card mt-3">
-                    <div class="card-header d-flex justify-content-between align-items-center">
-                        <h5 class="mb-0">Document Content</h5>
-                        <div>
-                            <a href="/download/{draft['name']}" class="btn btn-sm btn-outline-primary" target="_blank">
-                                <i class="fas fa-download me-1"></i>Download
-                            </a>
-                            <a href="/doc/draft/{draft['name']}.txt" class="btn btn-sm btn-outline-secondary" target="_blank">
-                                <i class="fas fa-external-link-alt me-1"></i>View TXT
-                            </a>
-                        </div>
-                    </div>
-                    <div class="card-body">
-                        <div class="document-content" style="font-family: 'Courier New', monospace; font-size: 0.9em; line-height: 1.4; white-space: pre-wrap; background-color: var(--input-bg) !important; color: var(--text-primary) !important; padding: 20px; border-radius: 8px; max-height: 800px; overflow-y: auto; border: 1px solid var(--input-border);">
-{document_content}
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <div class="col-md-4">
-                <div class="card">
-                    <div class="card-header">
-                        <h5>Actions</h5>
-                    </div>
-                    <div class="card-body">
-                        <a href="/doc/draft/{draft['name']}/comments/" class="btn btn-primary w-100 mb-2">View Comments ({Comment.query.filter_by(draft_name=draft_name).count()})</a>
-                        <a href="/doc/draft/{draft['name']}/history/" class="btn btn-secondary w-100 mb-2">View History</a>
-                        <a href="/doc/draft/{draft['name']}/revisions/" class="btn btn-info w-100 mb-2">View Revisions</a>
-                        <a href="/download/{draft['name']}" class="btn btn-outline-primary w-100 mb-2">Download Document</a>
-                        {'<form method="post" action="/doc/draft/' + draft['name'] + '/follow/" style="display: inline;" class="mb-2"><select name="notification_level" class="form-select form-select-sm mb-1"><option value="all">All changes & comments</option><option value="significant">Significant changes only</option><option value="major">Major changes only</option><option value="comments">Comments only</option><option value="none">No notifications</option></select><button type="submit" class="btn btn-success w-100"><i class="fas fa-bell me-1"></i>Follow Document</button></form>' if current_user and not is_user_following_draft(draft_name, current_user) else ''}
-                        {'<form method="post" action="/doc/draft/' + draft['name'] + '/unfollow/" style="display: inline;" class="mb-2"><button type="submit" class="btn btn-warning w-100"><i class="fas fa-bell-slash me-1"></i>Unfollow Document</button></form>' if current_user and is_user_following_draft(draft_name, current_user) else ''}
-                        {get_notification_controls(draft_name, current_user) if current_user and is_user_following_draft(draft_name, current_user) else ''}
-                        {'' if not current_user else ''}
-                    </div>
-                </div>
-                
-                <div class="card mt-3">
-                    <div class="card-header">
-                        <h5>Quick Comment</h5>
-                    </div>
-                    <div class="card-body">
-                        <form method="POST" action="/doc/draft/{draft['name']}/comments/">
-                            <div class="mb-3">
-                                <textarea class="form-control" name="comment" rows="3" placeholder="Add a quick comment..." required></textarea>
-                    </div>
-                            <button type="submit" class="btn btn-success btn-sm w-100">Post Comment</button>
-                        </form>
-        </div>
-    </div>
-    
-                <div class="card mt-3">
-                    <div class="card-header">
-                        <h5>Related Documents</h5>
-                    </div>
-                <div class="card-body">
-                        <p>Related documents would appear here in the real datatracker.</p>
-                    </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-        """
-    
-    # Add document_content to the template
-    content = content.replace('{document_content}', document_content)
+    is_following = bool(current_user) and is_user_following_draft(draft_name, current_user)
 
-    return BASE_TEMPLATE.format(title=f"{draft['name']} - MLTF", theme=current_theme, user_menu=user_menu, content=content)
+    return render_template('draft_detail.html', title=f"{draft['name']} - MLTF", theme=current_theme, user_menu=user_menu,
+                           draft=draft, display_id=display_id, document_content=document_content,
+                           comment_count=Comment.query.filter_by(draft_name=draft_name).count(),
+                           signed_in=bool(current_user), is_following=is_following,
+                           notification_controls=get_notification_controls(draft_name, current_user) if is_following else '')
 
 @app.route('/doc/draft/<draft_name>/comments/', methods=['GET', 'POST'])
 @require_auth
 def draft_comments(draft_name):
     # First try to find in DRAFTS (published documents)
-    draft = next((d for d in DRAFTS if d['name'] == draft_name), None)
+    draft = DRAFTS_BY_NAME.get(draft_name)
     
     # If not found in DRAFTS, try to find as a submission ID
     submission = None
@@ -4204,7 +4165,7 @@ def draft_comments(draft_name):
                 'authors': submission.authors,
                 'status': submission.status,
                 'group': submission.group,
-                'date': submission.submitted_at.strftime('%Y-%m-%d') if submission.submitted_at else '',
+                'date': fmt_dt(submission.submitted_at, '%Y-%m-%d') if submission.submitted_at else '',
                 'ml_number': submission.ml_number
             }
     
@@ -4215,15 +4176,16 @@ def draft_comments(draft_name):
     display_id = draft.get('ml_number') or draft_name
 
     user_menu = generate_user_menu()
-    current_theme = session.get('theme', get_current_user().get('theme', 'dark') if get_current_user() else 'dark')
     current_user = get_current_user()
+    current_theme = session.get('theme', current_user.get('theme', 'dark') if current_user else 'dark')
 
     # Handle new comment submission
     if request.method == 'POST':
-        action = request.form.get('action', 'comment')
+        form = request.form
+        action = form.get('action', 'comment')
         
         if action == 'comment':
-            comment_text = request.form.get('comment', '').strip()
+            comment_text = form.get('comment', '').strip()
             if comment_text:
                 # Create new comment in database
                 new_comment = Comment(
@@ -4243,7 +4205,7 @@ def draft_comments(draft_name):
                 flash('Please enter a comment.', 'error')
         
         elif action == 'like':
-            comment_id = request.form.get('comment_id')
+            comment_id = form.get('comment_id')
             if comment_id:
                 liked = toggle_comment_like(draft_name, comment_id, current_user['name'])
                 action_text = 'liked' if liked else 'unliked'
@@ -4253,8 +4215,8 @@ def draft_comments(draft_name):
                 flash('Invalid comment ID.', 'error')
         
         elif action == 'reply':
-            parent_comment_id = request.form.get('parent_comment_id')
-            reply_text = request.form.get('reply_text', '').strip()
+            parent_comment_id = form.get('parent_comment_id')
+            reply_text = form.get('reply_text', '').strip()
             if reply_text and parent_comment_id:
                 add_comment_reply(draft_name, parent_comment_id, reply_text, current_user)
                 flash('Reply added successfully!', 'success')
@@ -4263,8 +4225,8 @@ def draft_comments(draft_name):
                 flash('Please enter a reply.', 'error')
     
         elif action == 'edit':
-            comment_id = request.form.get('comment_id')
-            new_text = request.form.get('new_text', '').strip()
+            comment_id = form.get('comment_id')
+            new_text = form.get('new_text', '').strip()
             if comment_id and new_text:
                 comment = Comment.query.filter_by(id=int(comment_id)).first()
                 if comment and comment.author == current_user['name']:
@@ -4288,7 +4250,7 @@ def draft_comments(draft_name):
                 flash('Invalid comment or empty text.', 'error')
         
         elif action == 'delete':
-            comment_id = request.form.get('comment_id')
+            comment_id = form.get('comment_id')
             if comment_id:
                 comment = Comment.query.filter_by(id=int(comment_id)).first()
                 if comment and comment.author == current_user['name']:
@@ -4500,12 +4462,12 @@ def draft_comments(draft_name):
     </script>
 """
 
-    return BASE_TEMPLATE.format(title=f"Comments - {draft_name}", theme=current_theme, user_menu=user_menu, content=content)
+    return render_template('base.html', title=f"Comments - {draft_name}", theme=current_theme, user_menu=user_menu, content=content)
 
 @app.route('/doc/draft/<draft_name>/history/')
 def draft_history(draft_name):
     # First try to find in DRAFTS (published documents)
-    draft = next((d for d in DRAFTS if d['name'] == draft_name), None)
+    draft = DRAFTS_BY_NAME.get(draft_name)
     
     # If not found in DRAFTS, try to find as a submission ID
     if not draft:
@@ -4517,7 +4479,7 @@ def draft_history(draft_name):
                 'authors': submission.authors,
                 'status': submission.status,
                 'group': submission.group,
-                'date': submission.submitted_at.strftime('%Y-%m-%d') if submission.submitted_at else '',
+                'date': fmt_dt(submission.submitted_at, '%Y-%m-%d') if submission.submitted_at else '',
             }
     
     if not draft:
@@ -4529,21 +4491,22 @@ def draft_history(draft_name):
     # Get history for this draft
     history = DocumentHistory.query.filter_by(draft_name=draft_name).order_by(DocumentHistory.timestamp.desc()).all()
     
-    history_html = ""
+    parts = []
     if history:
         for entry in history:
-            history_html += f"""
+            parts.append(f"""
             <div class="card mb-3">
                         <div class="card-body">
                     <div class="d-flex justify-content-between align-items-start mb-2">
                         <span class="badge bg-primary">{entry.action}</span>
-                        <small class="text-muted">{entry.timestamp.strftime('%Y-%m-%d %H:%M')}</small>
+                        <small class="text-muted">{fmt_dt(entry.timestamp, '%Y-%m-%d %H:%M')}</small>
                             </div>
                     <p class="mb-1"><strong>User:</strong> {entry.user}</p>
                     <p class="mb-0">{entry.details}</p>
                         </div>
                     </div>
-            """
+            """)
+        history_html = "".join(parts)
     else:
         history_html = """
         <div class="alert alert-info">
@@ -4578,7 +4541,7 @@ def draft_history(draft_name):
             </div>
     """
 
-    return BASE_TEMPLATE.format(title=f"History - {draft_name}", theme=current_theme, user_menu=user_menu, content=content)
+    return render_template('base.html', title=f"History - {draft_name}", theme=current_theme, user_menu=user_menu, content=content)
 
 @app.route('/doc/draft/<draft_name>/follow/', methods=['POST'])
 def follow_draft(draft_name):
@@ -4649,7 +4612,7 @@ def update_notification_level(draft_name):
 @app.route('/doc/draft/<draft_name>/revisions/')
 def draft_revisions(draft_name):
     # First try to find in DRAFTS (published documents)
-    draft = next((d for d in DRAFTS if d['name'] == draft_name), None)
+    draft = DRAFTS_BY_NAME.get(draft_name)
     
     # If not found in DRAFTS, try to find as a submission ID
     submission = None
@@ -4662,7 +4625,7 @@ def draft_revisions(draft_name):
                 'authors': submission.authors,
                 'status': submission.status,
                 'group': submission.group,
-                'date': submission.submitted_at.strftime('%Y-%m-%d') if submission.submitted_at else '',
+                'date': fmt_dt(submission.submitted_at, '%Y-%m-%d') if submission.submitted_at else '',
                 'rev': '00',
                 'pages': 1,
                 'words': 0,
@@ -4713,9 +4676,8 @@ def draft_revisions(draft_name):
                         content_parts.append(text)
                 document_content = '\n\n'.join(content_parts)
                 # Clean up PDF text
-                import re
-                document_content = re.sub(r'\n+', '\n', document_content)
-                document_content = re.sub(r' +', ' ', document_content)
+                document_content = _MULTI_NL.sub('\n', document_content)
+                document_content = _MULTI_SPACE.sub(' ', document_content)
                 # Calculate words and pages
                 words = len(document_content.split())
                 calculated_pages = len(reader.pages) if reader.pages else max(1, (words + 499) // 500)
@@ -4778,43 +4740,25 @@ def draft_revisions(draft_name):
     </div>
     """
 
-    return BASE_TEMPLATE.format(title=f"Revisions - {draft_name}", theme=current_theme, user_menu=user_menu, content=content)
+    return render_template('base.html', title=f"Revisions - {draft_name}", theme=current_theme, user_menu=user_menu, content=content)
 
-@app.route('/group/')
-def groups():
-    user_menu = generate_user_menu()
-    current_theme = get_current_user().get('theme', 'dark') if get_current_user() else 'light'
-    groups_html = ""
-    for group in GROUPS:
-        # Get chair information from database
-        all_chairs = WorkingGroupChair.query.filter_by(group_acronym=group['acronym']).all()
-        if all_chairs:
-            chair_names = []
-            for chair in all_chairs:
-                chair_name = chair.chair_name
-                if not chair.approved:
-                    chair_name += " (Pending)"
-                chair_names.append(chair_name)
-            chair_display = ", ".join(chair_names)
-        else:
-            chair_display = "TBD"
-
-        groups_html += f"""
+# One card in the working group listing, filled with format_map by groups
+_GROUP_CARD_HTML = """
         <div class="col-md-6">
             <div class="card mb-3">
                 <div class="card-body">
                     <h5 class="card-title">
-                        <a href="/group/{group['acronym']}/">{group['acronym']}</a>
+                        <a href="/group/{acronym}/">{acronym}</a>
                     </h5>
-                    <p class="card-text">{group['name']}</p>
+                    <p class="card-text">{name}</p>
                     <div class="document-meta">
-                        <span class="badge bg-primary">{group['type']}</span>
-                        <span class="badge bg-success ms-2">{group['state']}</span>
+                        <span class="badge bg-primary">{type}</span>
+                        <span class="badge bg-success ms-2">{state}</span>
                     </div>
                     <div class="mt-2">
                         <small class="text-muted">
                             Chair: {chair_display}<br>
-                            {group['description']}
+                            {description}
                         </small>
                     </div>
                 </div>
@@ -4822,30 +4766,39 @@ def groups():
         </div>
         """
 
-    # Get theme from session or user preference
-    current_theme = session.get('theme', 'dark')
-
-    content = f"""
-    <div class="container mt-4">
-        <div class="row">
-            <div class="col-12">
-                <h1 class="mb-4">Working Groups</h1>
-                <p class="lead mb-4">Browse the Meta-Layer Desirable Properties working groups.</p>
+@app.route('/group/')
+def groups():
+    # Chair names come from the database, which bumps _stats_version on commit
+    def render():
+        user_menu = generate_user_menu()
+        current_user = get_current_user()
+        current_theme = current_user.get('theme', 'dark') if current_user else 'light'
+        # Chair names per group from one query, rather than one query per group
+        chair_names = {}
+        for chair in WorkingGroupChair.query.all():
+            chair_names.setdefault(chair.group_acronym, []).append(
+                chair.chair_name if chair.approved else chair.chair_name + " (Pending)")
+        groups_html = "".join(_GROUP_CARD_HTML.format_map({
+            'acronym': group['acronym'],
+            'name': escape(group['name']),
+            'type': group['type'],
+            'state': group['state'],
+            'chair_display': escape(", ".join(chair_names[group['acronym']])) if group['acronym'] in chair_names else "TBD",
+            'description': escape(group['description']),
+        }) for group in GROUPS)
+
+        # Get theme from session or user preference
+        current_theme = session.get('theme', 'dark')
+
+        return render_template('groups.html',
+            title="Working Groups - MLTF",
+            theme=current_theme,
+            user_menu=user_menu,
+            groups_html=groups_html
+        )
 
-                <div class="row">
-                    {groups_html}
-                </div>
-            </div>
-        </div>
-    </div>
-    """
+    return _conditional_page(_page_etag(_stats_version), render)
 
-    return BASE_TEMPLATE.format(
-        title="Working Groups - MLTF",
-        theme=current_theme,
-        content=content,
-        user_menu=user_menu
-    )
 @app.route('/group/<acronym>/')
 def group_detail(acronym):
     """Display individual working group details"""
@@ -4853,19 +4806,17 @@ def group_detail(acronym):
     group = None
     full_acronym = acronym  # Default to the URL parameter
 
-    for g in GROUPS:
-        if g['acronym'] == acronym:
-            group = g
-            full_acronym = g['acronym']
-            break
-        # Also check for short form (dp1 -> dp1-federated-auth, DP1 -> dp1-federated-auth)
-        if acronym.lower().startswith('dp') and g['acronym'].startswith(acronym.lower() + '-'):
-            group = g
-            full_acronym = g['acronym']
+    # Also accept the short form (dp1 -> dp1-federated-auth, DP1 -> dp1-federated-auth);
+    # the prefix is worked out once rather than per group
+    short_prefix = acronym.lower() + '-' if acronym.lower().startswith('dp') else None
+    for grp in GROUPS:
+        if grp['acronym'] == acronym or (short_prefix and grp['acronym'].startswith(short_prefix)):
+            group = grp
+            full_acronym = grp['acronym']
             break
 
     if not group:
-        return f"Working group '{acronym}' not found. Available: {[g['acronym'] for g in GROUPS]}", 404
+        return f"Working group '{acronym}' not found. Available: {[grp['acronym'] for grp in GROUPS]}", 404
 
     user_menu = generate_user_menu()
     current_user = get_current_user()
@@ -4882,8 +4833,10 @@ def group_detail(acronym):
     # Get chair information using the full acronym
     all_chairs = WorkingGroupChair.query.filter_by(group_acronym=full_acronym).all()
     if all_chairs:
-        approved_chairs = [chair.chair_name for chair in all_chairs if chair.approved]
-        pending_chairs = [chair.chair_name for chair in all_chairs if not chair.approved]
+        approved_chairs = []
+        pending_chairs = []
+        for chair in all_chairs:
+            (approved_chairs if chair.approved else pending_chairs).append(chair.chair_name)
 
         if approved_chairs:
             chair_name = ", ".join(approved_chairs)
@@ -4909,15 +4862,16 @@ def group_detail(acronym):
         all_chairs = WorkingGroupChair.query.filter_by(group_acronym=full_acronym).all()
 
         # Create options for the multi-select dropdown
-        chair_options = ""
+        parts = []
         selected_chairs = []
         for chair in all_chairs:
             chair_display = chair.chair_name
             if not chair.approved:
                 chair_display += " (Pending)"
-            chair_options += f'<option value="{chair.id}" {"selected" if chair.approved else ""}>{chair_display}</option>'
+            parts.append(f'<option value="{chair.id}" {"selected" if chair.approved else ""}>{chair_display}</option>')
             if chair.approved:
                 selected_chairs.append(chair.chair_name)
+        chair_options = "".join(parts)
 
         # Convert selected chairs to JSON for JavaScript
         selected_chairs_json = json.dumps(selected_chairs)
@@ -4938,7 +4892,7 @@ def group_detail(acronym):
                 <button type="button" class="btn btn-warning" onclick="updateChairs('{full_acronym}')">Update Chairs</button>
         </div>
             <div class="mt-2">
-                <small class="text-muted">Current approved chairs: {", ".join(selected_chairs) if selected_chairs else "None"}</small>
+                <small class="text-muted" id="approved-chairs-{full_acronym}">Current approved chairs: {", ".join(selected_chairs) if selected_chairs else "None"}</small>
             </div>
         </div>
         '''
@@ -4990,8 +4944,8 @@ def group_detail(acronym):
                                 <h5 class="mb-0">Leadership</h5>
                     </div>
                     <div class="card-body">
-                                <p><strong>Chair:</strong> {chair_name}</p>
-                                {'<span class="badge bg-warning">Pending Approval</span>' if not chair_approved and chair_name != "TBD" else ''}
+                                <p><strong>Chair:</strong> <span id="chair-summary-{full_acronym}">{chair_name}</span></p>
+                                <span class="badge bg-warning" id="chair-pending-badge-{full_acronym}"{'' if not chair_approved and chair_name != "TBD" else ' hidden'}>Pending Approval</span>
                             </div>
                         </div>
 
@@ -5010,14 +4964,7 @@ def group_detail(acronym):
                 'Content-Type': 'application/json',
             }}
         }})
-        .then(response => response.json())
-        .then(data => {{
-            if (data.success) {{
-                location.reload();
-            }} else {{
-                alert('Error joining group: ' + data.message);
-            }}
-        }})
+        .then(reloadOrAlert('Error joining group: '))
         .catch(error => {{
             console.error('Error:', error);
             alert('Error joining group');
@@ -5031,20 +4978,41 @@ def group_detail(acronym):
                 'Content-Type': 'application/json',
             }}
         }})
-        .then(response => response.json())
-        .then(data => {{
-            if (data.success) {{
-                location.reload();
-            }} else {{
-                alert('Error leaving group: ' + data.message);
-            }}
-        }})
+        .then(reloadOrAlert('Error leaving group: '))
         .catch(error => {{
             console.error('Error:', error);
             alert('Error leaving group');
         }});
     }}
 
+    // Chair actions answer with the group's chairs; redraw the chair list,
+    // the approved-chairs note and the Leadership card from them in place.
+    // Resolves to whether the action succeeded
+    function renderChairsOrAlert(acronym, errorPrefix) {{
+        return response => response.json().then(data => {{
+            if (!response.ok) {{
+                alert(errorPrefix + data.message);
+                return false;
+            }}
+            const approved = data.chairs.filter(c => c.approved).map(c => c.chair_name);
+            const pending = data.chairs.filter(c => !c.approved).map(c => c.chair_name);
+            document.getElementById(`chair-select-${{acronym}}`).replaceChildren(...data.chairs.map(c =>
+                new Option(c.approved ? c.chair_name : c.chair_name + ' (Pending)', c.id, false, c.approved)));
+            document.getElementById(`approved-chairs-${{acronym}}`).textContent =
+                'Current approved chairs: ' + (approved.length ? approved.join(', ') : 'None');
+            let summary = 'TBD';
+            if (approved.length) {{
+                summary = approved.join(', ');
+                if (pending.length) summary += ' (Pending: ' + pending.join(', ') + ')';
+            }} else if (pending.length) {{
+                summary = 'Pending: ' + pending.join(', ');
+            }}
+            document.getElementById(`chair-summary-${{acronym}}`).textContent = summary;
+            document.getElementById(`chair-pending-badge-${{acronym}}`).hidden = approved.length > 0 || !pending.length;
+            return true;
+        }});
+    }}
+
     function addChair(acronym) {{
         const input = document.getElementById(`new-chair-input-${{acronym}}`);
         const chairName = input.value.trim();
@@ -5060,13 +5028,9 @@ def group_detail(acronym):
             }},
             body: JSON.stringify({{ chair_name: chairName }})
         }})
-        .then(response => response.json())
-        .then(data => {{
-            if (data.success) {{
-                location.reload();
-            }} else {{
-                alert('Error adding chair: ' + data.message);
-            }}
+        .then(renderChairsOrAlert(acronym, 'Error adding chair: '))
+        .then(added => {{
+            if (added) input.value = '';
         }})
         .catch(error => {{
             console.error('Error:', error);
@@ -5086,14 +5050,7 @@ def group_detail(acronym):
             }},
             body: JSON.stringify({{ chair_ids: chairIds }})
         }})
-        .then(response => response.json())
-        .then(data => {{
-            if (data.success) {{
-                location.reload();
-            }} else {{
-                alert('Error updating chairs: ' + data.message);
-            }}
-        }})
+        .then(renderChairsOrAlert(acronym, 'Error updating chairs: '))
         .catch(error => {{
             console.error('Error:', error);
             alert('Error updating chairs');
@@ -5119,14 +5076,7 @@ def group_detail(acronym):
                 }},
                 body: JSON.stringify({{ chair_ids: chairIds }})
             }})
-            .then(response => response.json())
-            .then(data => {{
-                if (data.success) {{
-                    location.reload();
-                }} else {{
-                    alert('Error removing chairs: ' + data.message);
-                }}
-            }})
+            .then(renderChairsOrAlert(acronym, 'Error removing chairs: '))
             .catch(error => {{
                 console.error('Error:', error);
                 alert('Error removing chairs');
@@ -5136,7 +5086,7 @@ def group_detail(acronym):
     </script>
     """
 
-    return BASE_TEMPLATE.format(
+    return render_template('base.html', 
         title=f"{group['name']} - MLTF",
         theme=current_theme,
         content=content,
@@ -5167,7 +5117,7 @@ def join_group(acronym):
     db.session.add(membership)
     db.session.commit()
 
-    return jsonify({'success': True, 'message': 'Joined successfully'})
+    return '', 204
 
 @app.route('/group/<acronym>/leave', methods=['POST'])
 @require_auth
@@ -5188,7 +5138,16 @@ def leave_group(acronym):
     db.session.delete(membership)
     db.session.commit()
 
-    return jsonify({'success': True, 'message': 'Left successfully'})
+    return '', 204
+
+def _group_chairs_response(acronym):
+    """The group's chairs after a change, for the group page to redraw in place"""
+    chairs = WorkingGroupChair.query.filter_by(group_acronym=acronym).all()
+    return jsonify({
+        'success': True,
+        'chairs': [{'id': chair.id, 'chair_name': chair.chair_name, 'approved': chair.approved}
+                   for chair in chairs]
+    })
 
 @app.route('/group/<acronym>/add_chair', methods=['POST'])
 @require_role('admin')
@@ -5212,7 +5171,7 @@ def add_group_chair(acronym):
     db.session.add(chair)
     db.session.commit()
 
-    return jsonify({'success': True, 'message': 'Chair added successfully'})
+    return _group_chairs_response(acronym)
 
 @app.route('/group/<acronym>/update_chairs', methods=['POST'])
 @require_role('admin')
@@ -5232,7 +5191,7 @@ def update_group_chairs(acronym):
 
     db.session.commit()
 
-    return jsonify({'success': True, 'message': 'Chairs updated successfully'})
+    return _group_chairs_response(acronym)
 
 @app.route('/group/<acronym>/remove_chairs', methods=['POST'])
 @require_role('admin')
@@ -5251,7 +5210,7 @@ def remove_group_chairs(acronym):
 
     db.session.commit()
 
-    return jsonify({'success': True, 'message': 'Chairs removed successfully'})
+    return _group_chairs_response(acronym)
 
 @app.route('/person/')
 def people():
@@ -5275,7 +5234,7 @@ def people():
         </div>
         """
     
-    return BASE_TEMPLATE.format(
+    return render_template('base.html', 
         title="People Directory - MLTF",
         theme=session.get('theme', 'dark'),
         content=content,
@@ -5304,7 +5263,7 @@ def meetings():
     </div>
     """
 
-    return BASE_TEMPLATE.format(
+    return render_template('base.html', 
         title="Meetings - MLTF",
         theme=session.get('theme', 'dark'),
         content=content,
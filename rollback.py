@@ -12,6 +12,7 @@
 import sys
 import subprocess
 import json
+import shutil
 from datetime import datetime
 from pathlib import Path
 
@@ -92,7 +93,6 @@ def restore_database_backup(env):
     else:
         db_path = SCRIPT_DIR / 'instance_dev' / 'datatracker_dev.db'
     
-    import shutil
     shutil.copy2(db_backup, db_path)
     log(f"Database restored from {latest_backup}")
     return True
@@ -0,0 +1,16 @@
+// Shared helpers for the page scripts
+
+// Actions answer success with a bodiless 204 and reload the page; only
+// errors carry a JSON message, shown after errorPrefix. Pass the result
+// to fetch(...).then()
+function reloadOrAlert(errorPrefix) {
+    return response => {
+        if (response.status === 204) {
+            location.reload();
+            return;
+        }
+        return response.json().then(data => {
+            alert(errorPrefix + data.message);
+        });
+    };
+}
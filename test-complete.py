@@ -3,11 +3,14 @@
 Complete test of the deployment system
 """
 
+import re
 import subprocess
 import time
 import urllib.request
 import sys
 
+from deploy_core import clear_caches
+
 def run_cmd(cmd):
     """Run command and return success, stdout, stderr"""
     result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
@@ -46,13 +49,7 @@ def main():
     time.sleep(3)
 
     # Clear cache
-    import os, shutil
-    for root, dirs, files in os.walk('/home/ubuntu/datatracker'):
-        if '__pycache__' in dirs:
-            shutil.rmtree(os.path.join(root, '__pycache__'), ignore_errors=True)
-        for f in files:
-            if f.endswith('.pyc'):
-                os.remove(os.path.join(root, f), ignore_errors=True)
+    clear_caches()
 
     success, stdout, stderr = run_cmd("systemctl --user start datatracker-dev.service")
     if success:
@@ -131,7 +128,6 @@ def main():
         write_result("FAILED! Text not found anywhere.")
         write_result("\nDebug info:")
         if content_dev:
-            import re
             match = re.search(r'<p class="lead">(.*?)</p>', content_dev)
             if match:
                 write_result(f"Dev subdomain text: '{match.group(1)}'")